@@ -0,0 +1 @@
+"""Throughput benchmarks of the object calisthenics checkers"""
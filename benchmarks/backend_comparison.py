@@ -0,0 +1,101 @@
+"""
+Compare the astroid checkers with the stdlib ast engine on the synthetic modules:
+parsing plus checking time, and peak memory, of each backend.
+
+Run with ``python -m benchmarks.backend_comparison``.
+"""
+import argparse
+import ast
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+import astroid
+
+from benchmarks.checker_throughput import BenchmarkName, _walk
+from benchmarks.generators import GENERATORS, Size, Source
+from object_calisthenics.ast_backend import check_module
+from object_calisthenics.ast_backend.engine import EngineOptions
+from object_calisthenics.checkers import register
+
+Backend = Callable[[Source], int]
+Arguments = Optional[Sequence[str]]
+
+
+def astroid_backend(source: Source):
+    """Parse the source with astroid and walk it with the registered checkers."""
+    return _walk(register, astroid.parse(source, "benchmark_module"))
+
+
+def ast_backend(source: Source):
+    """Parse the source with the stdlib ast module and apply the ast engine to it."""
+    return len(check_module(ast.parse(source), source, EngineOptions()))
+
+
+BACKENDS = {"astroid": astroid_backend, "ast": ast_backend}
+
+
+class Measurement(NamedTuple):
+    """The time and memory a backend took to check a source."""
+    seconds: float
+    peak_bytes: int
+    messages: int
+
+
+def _timed(backend: Backend, source: Source):
+    start = time.perf_counter()
+    backend(source)
+    return time.perf_counter() - start
+
+
+def measure(backend: Backend, source: Source, repeat: Size):
+    """Check the source with the backend, keeping the best time of the repeats."""
+    seconds = min(_timed(backend, source) for _ in range(repeat))
+    tracemalloc.start()
+    messages = backend(source)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return Measurement(seconds, peak, messages)
+
+
+class Comparison(NamedTuple):
+    """The measurements of both backends on a source."""
+    name: BenchmarkName
+    astroid: Measurement
+    ast: Measurement
+
+
+def compare_all(scale: Size, repeat: Size):
+    """Measure both backends on every generated module."""
+    sources = {name: generate(scale) for name, generate in GENERATORS.items()}
+    sources["all"] = Source("\n".join(sources.values()))
+    return [Comparison(BenchmarkName(name),
+                       *(measure(backend, source, repeat) for backend in BACKENDS.values()))
+            for name, source in sources.items()]
+
+
+def _print_comparisons(comparisons: List[Comparison]):
+    print(f"{'module':<26}{'astroid s':>11}{'ast s':>9}{'speedup':>9}"
+          f"{'astroid KiB':>13}{'ast KiB':>9}{'messages':>10}")
+    for comparison in comparisons:
+        astroid_run, ast_run = comparison.astroid, comparison.ast
+        print(f"{comparison.name:<26}{astroid_run.seconds:>11.3f}{ast_run.seconds:>9.3f}"
+              f"{astroid_run.seconds / ast_run.seconds:>8.1f}x"
+              f"{astroid_run.peak_bytes // 1024:>13}{ast_run.peak_bytes // 1024:>9}"
+              f"{ast_run.messages:>10}")
+
+
+def main(argv: Arguments = None):
+    """Run the comparison and print it."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="Size multiplier of the modules")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs of each backend")
+    args = parser.parse_args(argv)
+    _print_comparisons(compare_all(Size(args.scale), Size(args.repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Measure the throughput of every checker on its synthetic module, in isolation and
+all together through ``register()``.
+
+Run with ``python -m benchmarks.checker_throughput``. Save a baseline with
+``--save-baseline`` and compare a later run against it with ``--baseline``, the run
+fails when a benchmark got slower than the allowed tolerance.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import astroid
+from astroid import nodes
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+from pylint.utils import ASTWalker
+
+from benchmarks.generators import GENERATORS, Size, Source
+from object_calisthenics.checkers import (ElseKeywordPresent, FirstClassCollections,
+                                          OneDotPerLine, OneLevelOfIndentation,
+                                          PrimitiveObsession, SmallClassSize, register)
+
+CHECKERS = (OneLevelOfIndentation, ElseKeywordPresent, PrimitiveObsession,
+            FirstClassCollections, OneDotPerLine, SmallClassSize)
+
+
+class BenchmarkResult(NamedTuple):
+    """The measurements of a single benchmark."""
+    name: str
+    nodes: int
+    seconds: float
+    peak_bytes: int
+    messages: int
+
+    @property
+    def nodes_per_second(self):
+        """The amount of AST nodes the checkers went through per second."""
+        return self.nodes / self.seconds
+
+    def to_json(self):
+        """The measurements stored in a baseline file."""
+        return {"nodes": self.nodes, "seconds": self.seconds, "peak_bytes": self.peak_bytes,
+                "messages": self.messages, "nodes_per_second": self.nodes_per_second}
+
+
+Installer = Callable[[PyLinter], None]
+Baseline = Dict[str, Dict[str, float]]
+Arguments = Optional[Sequence[str]]
+
+
+class BenchmarkName(str):
+    """The name of a benchmark"""
+
+
+class Tolerance(float):
+    """The allowed slowdown ratio compared to the baseline"""
+
+
+def _install_checker(checker_class: type):
+    return lambda linter: linter.register_checker(checker_class(linter))
+
+
+def _count_nodes(module: nodes.Module):
+    return sum(1 for _ in module.nodes_of_class(nodes.NodeNG))
+
+
+def _walk(install: Installer, module: nodes.Module):
+    linter = PyLinter(reporter=CollectingReporter())
+    install(linter)
+    linter.set_current_module(module.name)
+    walker = ASTWalker(linter)
+    checkers = linter.get_checkers()[1:]
+    for checker in checkers:
+        checker.open()
+        walker.add_checker(checker)
+    walker.walk(module)
+    return len(linter.reporter.messages)  # pylint: disable=chain-of-method-calls
+
+
+def _timed_walk(install: Installer, source: Source):
+    module = astroid.parse(source, "benchmark_module")
+    start = time.perf_counter()
+    _walk(install, module)
+    return time.perf_counter() - start
+
+
+def _peak_memory(install: Installer, source: Source):
+    module = astroid.parse(source, "benchmark_module")
+    tracemalloc.start()
+    messages = _walk(install, module)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, messages
+
+
+def run_benchmark(name: BenchmarkName, install: Installer, source: Source, repeat: Size):
+    """Time the installed checkers on the source, keeping the best of the repeats."""
+    seconds = min(_timed_walk(install, source) for _ in range(repeat))
+    peak_bytes, messages = _peak_memory(install, source)
+    return BenchmarkResult(name, _count_nodes(astroid.parse(source)), seconds, peak_bytes,
+                           messages)
+
+
+def run_all(scale: Size, repeat: Size):
+    """Run every checker on its own module, then all of them on all the modules."""
+    sources = {name: generate(scale) for name, generate in GENERATORS.items()}
+    results = [run_benchmark(BenchmarkName(checker.name), _install_checker(checker),
+                             sources[checker.name], repeat)
+               for checker in CHECKERS]
+    all_sources = Source("\n".join(sources.values()))
+    results.append(run_benchmark(BenchmarkName("register"), register, all_sources, repeat))
+    return results
+
+
+def _print_results(results: List[BenchmarkResult]):
+    print(f"{'benchmark':<26}{'nodes':>10}{'seconds':>10}{'nodes/sec':>12}{'peak KiB':>10}")
+    for result in results:
+        print(f"{result.name:<26}{result.nodes:>10}{result.seconds:>10.3f}"
+              f"{result.nodes_per_second:>12.0f}{result.peak_bytes // 1024:>10}")
+
+
+def _regressions(results: List[BenchmarkResult], baseline: Baseline, tolerance: Tolerance):
+    return [f"{result.name}: {result.nodes_per_second:.0f} nodes/sec, baseline "
+            f"{baseline[result.name]['nodes_per_second']:.0f}"
+            for result in results
+            if result.name in baseline and result.nodes_per_second <
+            baseline[result.name]["nodes_per_second"] * (1 - tolerance)]
+
+
+def _parse_args(argv: Arguments):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="Size multiplier of the modules")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs of each benchmark")
+    parser.add_argument("--save-baseline", type=Path, help="Write the results to a json file")
+    parser.add_argument("--baseline", type=Path, help="Compare the results to a json file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed nodes/sec slowdown compared to the baseline")
+    return parser.parse_args(argv)
+
+
+def _save_baseline(results: List[BenchmarkResult], path: Path):
+    baseline = {result.name: result.to_json() for result in results}
+    path.write_text(json.dumps(baseline, indent=2), encoding="utf-8")
+
+
+def _load_baseline(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv: Arguments = None):
+    """Run the benchmarks, returning a non zero exit code on regressions."""
+    args = _parse_args(argv)
+    results = run_all(Size(args.scale), Size(args.repeat))
+    _print_results(results)
+    if args.save_baseline:
+        _save_baseline(results, args.save_baseline)
+    if not args.baseline:
+        return 0
+    regressions = _regressions(results, _load_baseline(args.baseline), Tolerance(args.tolerance))
+    print("\n".join(["Regressions:"] + regressions) if regressions else "No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
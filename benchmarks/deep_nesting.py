@@ -0,0 +1,233 @@
+"""
+Measure the traversals of the checkers on deeply nested code, against the recursive
+traversals they replaced, and find the depths at which the recursive ones crash.
+
+The module walk of the indentation and else checkers is timed on functions nested as
+deep as Python allows, and the annotation keys of the primitive checker on long
+generated unions, each ``|`` nesting the union one level deeper. Unions too deep for
+astroid to build are checked with the ast backend, which parses them with the stdlib
+ast module: the recursive key builder raises ``RecursionError`` on them while the
+iterative one doesn't.
+
+The violation modes of the indentation and else checkers are compared on the same
+kind of modules: ``all`` locates every violation while walking the module, ``first``
+walks it without locating anything and then walks the functions breaking a rule up
+to their first violation, leaving out the blocks nested deeper than allowed.
+
+Run with ``python -m benchmarks.deep_nesting``.
+"""
+import argparse
+import ast
+import sys
+import time
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+import astroid
+from astroid import nodes
+
+from benchmarks.checker_throughput import BenchmarkName
+from benchmarks.generators import Size, Source, deep_nesting, else_branches, long_unions
+from object_calisthenics.ast_backend.engine import check_source
+from object_calisthenics.checkers.annotation_keys import (_AST_KEYS, _ASTROID_KEYS,
+                                                          _UNKNOWN_RULE, AnnotationKey,
+                                                          AnnotationKeys, TypeAliases)
+from object_calisthenics.checkers.function_body_walker import (_SIDE_BLOCKS, ELSE_BRANCHES,
+                                                               MAX_INDENTATION_LEVELS,
+                                                               NESTED_BLOCKS,
+                                                               FirstViolationWalker,
+                                                               FunctionFacts,
+                                                               LocatingModuleWalker,
+                                                               MeasuringModuleWalker,
+                                                               ModuleWalker)
+
+Arguments = Optional[Sequence[str]]
+Timed = Callable[[], object]
+
+_ALIASES = TypeAliases({})
+
+
+class BlockFacts(NamedTuple):
+    """The facts of a list of statements, as the recursive walk merged them."""
+    height: int
+    contains_else: bool
+
+    def merge(self, other: "BlockFacts"):
+        """Combine the facts of two sibling statements."""
+        return BlockFacts(max(self.height, other.height),
+                          self.contains_else or other.contains_else)
+
+
+_EMPTY_BLOCK = BlockFacts(0, False)
+
+
+class RecursiveModuleWalker(ModuleWalker):
+    """The module walk as it was, recursing through the blocks of the statements."""
+
+    def _walk_block(self, statements: List[nodes.NodeNG]):
+        block = _EMPTY_BLOCK
+        for statement in statements:
+            block = block.merge(self._walk_statement(statement))
+        return block
+
+    def _walk_statement(self, statement: nodes.NodeNG):
+        for block_name in _SIDE_BLOCKS:
+            self._walk_block(getattr(statement, block_name, ()))
+        if not hasattr(statement, "body"):
+            return _EMPTY_BLOCK
+        body = self._walk_block(statement.body)
+        if isinstance(statement, nodes.FunctionDef):
+            self._facts[id(statement)] = FunctionFacts(body.height, body.contains_else)
+        return BlockFacts(body.height + 1, body.contains_else or (
+            isinstance(statement, nodes.If) and bool(statement.orelse)))
+
+    def walk(self, module: nodes.Module):
+        """Walk the module recursively."""
+        self._walk_block(module.body)
+        return self
+
+
+def recursive_key(node: object, rules: dict) -> AnnotationKey:
+    """The key of an annotation, built recursively from the keys of its parts."""
+    rule = rules.get(type(node), _UNKNOWN_RULE)
+    parts = tuple(recursive_key(part, rules) for part in rule.parts(node, _ALIASES))
+    return rule.combine(node, parts, _ALIASES)
+
+
+class TimingResult(NamedTuple):
+    """The time of the recursive and the iterative traversal of the same trees."""
+    name: BenchmarkName
+    recursive_seconds: float
+    iterative_seconds: float
+
+
+def _best_time(timed: Timed, repeat: Size):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        timed()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def _annotations(source: Source):
+    # pylint: disable=chain-of-method-calls
+    module = astroid.parse(source)
+    return [function.args.annotations[0] for function in module.body]
+
+
+def timings(repeat: Size):
+    """Time both traversals on the deepest nesting and on unions astroid can build."""
+    module = astroid.parse(deep_nesting(Size(98), Size(200)))
+    annotations = _annotations(long_unions(Size(300), Size(100)))
+    return [
+        TimingResult(BenchmarkName("module walk, 98 levels"),
+                     _best_time(lambda: RecursiveModuleWalker().walk(module), repeat),
+                     _best_time(lambda: ModuleWalker().walk(module), repeat)),
+        TimingResult(BenchmarkName("annotation keys, 300 terms"),
+                     _best_time(lambda: [recursive_key(annotation, _ASTROID_KEYS)
+                                         for annotation in annotations], repeat),
+                     _best_time(lambda: [AnnotationKeys.of_astroid(annotation, _ALIASES)
+                                         for annotation in annotations], repeat)),
+    ]
+
+
+class ModeTiming(NamedTuple):
+    """The time of finding every violation of the functions of a module, and the first."""
+    name: BenchmarkName
+    every_seconds: float
+    first_seconds: float
+
+
+def every_violation(module: nodes.Module, functions: List[nodes.FunctionDef]):
+    """The violations of the functions in the ``all`` mode of both checkers."""
+    walk = LocatingModuleWalker().walk(module)
+    return [(walk.facts_of(function).nested_blocks, walk.facts_of(function).else_branches)
+            for function in functions]
+
+
+def first_violations(module: nodes.Module, functions: List[nodes.FunctionDef]):
+    """The violations of the functions in the ``first`` mode of both checkers."""
+    measured = MeasuringModuleWalker().walk(module)
+    return [tuple(FirstViolationWalker.first_of(function, measured, kind, MAX_INDENTATION_LEVELS)
+                  for kind in (NESTED_BLOCKS, ELSE_BRANCHES)) for function in functions]
+
+
+def mode_timing(name: BenchmarkName, source: Source, repeat: Size):
+    """Time both violation modes on the functions of the source."""
+    module = astroid.parse(source)
+    functions = list(module.nodes_of_class(nodes.FunctionDef))
+    return ModeTiming(name, _best_time(lambda: every_violation(module, functions), repeat),
+                      _best_time(lambda: first_violations(module, functions), repeat))
+
+
+def mode_timings(repeat: Size):
+    """Time both modes on deep nesting, many else branches and functions keeping to the rules."""
+    return [
+        mode_timing(BenchmarkName("98 levels, 200 functions"),
+                    deep_nesting(Size(98), Size(200)), repeat),
+        mode_timing(BenchmarkName("50 else, 200 functions"),
+                    else_branches(Size(50), Size(200)), repeat),
+        mode_timing(BenchmarkName("1 level, 2000 functions"),
+                    deep_nesting(Size(1), Size(2000)), repeat),
+    ]
+
+
+def _outcome(timed: Timed):
+    try:
+        timed()
+    except RecursionError:
+        return "RecursionError"
+    return "ok"
+
+
+class CrashResult(NamedTuple):
+    """How the recursive keys and the ast backend went through a union."""
+    terms: Size
+    recursive: str
+    iterative: str
+
+
+def crash_result(terms: Size):
+    """Build the key of a union recursively, then check it with the ast backend."""
+    # pylint: disable=chain-of-method-calls
+    source = long_unions(terms, Size(1))
+    annotation = ast.parse(source).body[0].args.args[0].annotation
+    return CrashResult(terms, _outcome(lambda: recursive_key(annotation, _AST_KEYS)),
+                       _outcome(lambda: check_source(source)))
+
+
+def _print_timings(results: List[TimingResult]):
+    print(f"{'traversal':<28}{'recursive s':>13}{'iterative s':>13}{'speedup':>9}")
+    for result in results:
+        print(f"{result.name:<28}{result.recursive_seconds:>13.4f}"
+              f"{result.iterative_seconds:>13.4f}"
+              f"{result.recursive_seconds / result.iterative_seconds:>8.2f}x")
+
+
+def _print_modes(results: List[ModeTiming]):
+    print(f"\n{'violation modes':<28}{'all s':>13}{'first s':>13}{'speedup':>9}")
+    for result in results:
+        print(f"{result.name:<28}{result.every_seconds:>13.4f}{result.first_seconds:>13.4f}"
+              f"{result.every_seconds / result.first_seconds:>8.2f}x")
+
+
+def _print_crashes(results: List[CrashResult]):
+    print(f"\n{'union terms':<14}{'recursive keys':>16}{'ast backend':>14}")
+    for result in results:
+        print(f"{result.terms:<14}{result.recursive:>16}{result.iterative:>14}")
+
+
+def main(argv: Arguments = None):
+    """Time the traversals and look for recursion limit crashes."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs of each traversal")
+    args = parser.parse_args(argv)
+    _print_timings(timings(Size(args.repeat)))
+    _print_modes(mode_timings(Size(args.repeat)))
+    _print_crashes([crash_result(Size(terms)) for terms in (100, 500, 1000, 2000)])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
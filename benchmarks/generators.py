@@ -0,0 +1,96 @@
+"""Generators of synthetic modules that stress each of the checkers"""
+from typing import Callable, Dict
+
+
+class Size(int):
+    """A size parameter of a generated module"""
+
+
+class Source(str):
+    """The source code of a generated module"""
+
+
+def _indent(level: Size):
+    return "    " * level
+
+
+def _nested_block(depth: Size):
+    lines = [f"{_indent(Size(level + 1))}if value > {level}:" for level in range(depth)]
+    return "\n".join(lines + [f"{_indent(Size(depth + 1))}value -= 1"])
+
+
+def deep_nesting(depth: Size, functions: Size):
+    """Functions with blocks nested ``depth`` levels deep, for OneLevelOfIndentation."""
+    block = _nested_block(depth)
+    return Source("\n".join(f"def nested_{index}(value):\n{block}\n    return value\n"
+                            for index in range(functions)))
+
+
+def else_branches(branches: Size, functions: Size):
+    """Functions with many if/else statements, for ElseKeywordPresent."""
+    block = "\n".join(f"    if value == {index}:\n        value += 1\n    else:\n        value -= 1"
+                      for index in range(branches))
+    return Source("\n".join(f"def branching_{index}(value):\n{block}\n    return value\n"
+                            for index in range(functions)))
+
+
+def attribute_chains(length: Size, statements: Size):
+    """Statements made of long attribute chains and calls, for OneDotPerLine."""
+    chain = ".".join(f"attr_{index}" for index in range(length))
+    body = "\n".join(f"    result_{index} = receiver.{chain}.call_{index}()"
+                     for index in range(statements))
+    return Source(f"def chained(receiver):\n{body}\n    return receiver\n")
+
+
+def annotated_args(arguments: Size, functions: Size):
+    """Functions with many annotated arguments, for PrimitiveObsession."""
+    annotations = ("CustomType", "Dict[str, List[CustomType]]", "Optional[CustomType]",
+                   "Union[CustomType, Tuple[CustomType, CustomType]]")
+    args = ", ".join(f"arg_{index}: {annotations[index % len(annotations)]}"
+                     for index in range(arguments))
+    return Source("\n".join(f"def annotated_{index}({args}):\n    pass\n"
+                            for index in range(functions)))
+
+
+def wide_classes(attributes: Size, classes: Size):
+    """Classes with many instance attributes, for FirstClassCollections."""
+    assignments = "\n".join(f"        self.attr_{index}: CustomType = CustomType()"
+                            for index in range(attributes))
+    return Source("\n".join(f"class Wide{index}:\n    def __init__(self):\n{assignments}\n"
+                            for index in range(classes)))
+
+
+def long_classes(methods: Size, classes: Size):
+    """Classes with many methods, for SmallClassSize."""
+    body = "\n".join(f"    def method_{index}(self):\n        return {index}\n"
+                     for index in range(methods))
+    return Source("\n".join(f"class Long{index}:\n{body}" for index in range(classes)))
+
+
+def long_unions(terms: Size, functions: Size):
+    """Functions whose argument is a generated union of many types, nested as deep."""
+    union = " | ".join(f"Type{index}" for index in range(terms))
+    return Source("\n".join(f"def union_{index}(value: {union}):\n    return value\n"
+                             for index in range(functions)))
+
+
+def generated_models(fields: Size, classes: Size):
+    """A module like the generated protobuf and ORM ones: many classes of many fields."""
+    assignments = "\n".join(f"        self.field_{index}: Field = Field(number={index})"
+                            for index in range(fields))
+    accessors = "\n".join(f"    def get_field_{index}(self):\n        return self.field_{index}\n"
+                          for index in range(fields))
+    return Source("\n".join(
+        f"class Model{index}(Message):\n    def __init__(self):\n{assignments}\n\n{accessors}"
+        f"\nREGISTRY.register(Model{index}, descriptor.file.message_types[{index}])\n"
+        for index in range(classes)))
+
+# The benchmark of every checker, generating a module of a given scale.
+GENERATORS: Dict[str, Callable[[Size], Source]] = {
+    "one-level-indentation": lambda scale: deep_nesting(Size(40), Size(50 * scale)),
+    "else-keyword-present": lambda scale: else_branches(Size(40), Size(50 * scale)),
+    "one-dot-per-line": lambda scale: attribute_chains(Size(30), Size(500 * scale)),
+    "primitive-obsession": lambda scale: annotated_args(Size(2000), Size(2 * scale)),
+    "first-class-collections": lambda scale: wide_classes(Size(300), Size(10 * scale)),
+    "small-class-size": lambda scale: long_classes(Size(200), Size(10 * scale)),
+}
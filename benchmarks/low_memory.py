@@ -0,0 +1,82 @@
+"""
+Measure the peak resident memory of the standalone runner checking a large generated
+module, built whole and built one top-level definition at a time, along with the
+wall clock time of both and whether they reported the same messages.
+
+Every run happens in a fresh interpreter, whose peak resident set size is read from
+``getrusage`` once the runner is done.
+
+Run with ``python -m benchmarks.low_memory``.
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence
+
+from benchmarks.checker_throughput import BenchmarkName
+from benchmarks.generators import Size, generated_models
+
+Arguments = Optional[Sequence[str]]
+
+_RUN = """
+import resource
+import sys
+from object_calisthenics.runner import main
+main(sys.argv[1:])
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stderr)
+"""
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+class MemoryResult(NamedTuple):
+    """The peak memory and time of a run, with the messages it reported."""
+    name: BenchmarkName
+    peak_bytes: int
+    seconds: float
+    output: str
+
+
+def measure(name: BenchmarkName, module: Path, low_memory: bool):  # pylint: disable=dont-use-primitives
+    """Check the module with the runner in a fresh interpreter."""
+    # pylint: disable=chain-of-method-calls
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", _RUN, "--score=n", "--persistent=n",
+         f"--calisthenics-low-memory={'y' if low_memory else 'n'}", str(module)],
+        capture_output=True, check=False, text=True)
+    seconds = time.perf_counter() - start
+    return MemoryResult(name, int(completed.stderr.split()[-1]) * _RSS_UNIT, seconds,
+                        completed.stdout)
+
+
+def _print_results(results: List[MemoryResult]):
+    print(f"{'run':<22}{'peak MiB':>10}{'s':>9}")
+    for result in results:
+        print(f"{result.name:<22}{result.peak_bytes / 2 ** 20:>10.1f}{result.seconds:>9.2f}")
+    same = all(result.output == results[0].output for result in results)
+    print(f"same messages: {'yes' if same else 'no'}")
+
+
+def main(argv: Arguments = None):
+    """Generate the module, check it both ways and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--classes", type=int, default=400, help="Classes of the module")
+    parser.add_argument("--fields", type=int, default=40, help="Fields of every class")
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        module = Path(directory) / "generated_pb2.py"
+        source = generated_models(Size(args.fields), Size(args.classes))
+        module.write_text(source, encoding="utf-8")
+        print(f"module of {source.count(chr(10)) + 1} lines")
+        _print_results([measure(BenchmarkName("whole module"), module, False),
+                        measure(BenchmarkName("low memory"), module, True)])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
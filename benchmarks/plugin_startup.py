@@ -0,0 +1,99 @@
+"""
+Measure the cost of loading the plugin: the wall clock time of fresh interpreters
+importing pylint with and without the plugin, and linting a tiny module with all the
+object calisthenics messages enabled or a single one, along with the amount of plugin
+modules each of them imported.
+
+Run with ``python -m benchmarks.plugin_startup``.
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence
+
+from benchmarks.checker_throughput import BenchmarkName
+from benchmarks.generators import Size
+
+Arguments = Optional[Sequence[str]]
+Script = str
+
+_IMPORT_PYLINT = "import sys\nimport pylint.lint\n"
+_IMPORT_PLUGIN = _IMPORT_PYLINT + "import object_calisthenics.checkers\n"
+_LINT = _IMPORT_PYLINT + """\
+from pylint.lint import Run
+Run(sys.argv[1:], exit=False)
+"""
+_COUNT_MODULES = """
+print(sum(name.startswith("object_calisthenics") for name in sys.modules), file=sys.stderr)
+"""
+_ALL_MESSAGES = "W9001,W9002,W9003,W9004,W9005,W9006,W9007"
+_TINY_MODULE = '"""A tiny module"""\nVALUE = 1\n'
+
+
+class StartupCase(NamedTuple):
+    """A script run in a fresh interpreter, with its arguments."""
+    name: BenchmarkName
+    script: Script
+    arguments: Sequence[str] = ()
+
+
+class StartupResult(NamedTuple):
+    """The best wall clock time of a case and the plugin modules it imported."""
+    name: BenchmarkName
+    seconds: float
+    plugin_modules: int
+
+
+def cases(module: Path):
+    """The import and lint cases, the lint ones checking the module."""
+    plugin = ["--load-plugins=object_calisthenics.checkers", "--disable=all"]
+    return [
+        StartupCase(BenchmarkName("import pylint"), Script(_IMPORT_PYLINT)),
+        StartupCase(BenchmarkName("import pylint + plugin"), Script(_IMPORT_PLUGIN)),
+        StartupCase(BenchmarkName("lint without plugin"), Script(_LINT),
+                    ["--disable=all", "--score=n", str(module)]),
+        StartupCase(BenchmarkName("lint, all messages"), Script(_LINT),
+                    plugin + [f"--enable={_ALL_MESSAGES}", "--score=n", str(module)]),
+        StartupCase(BenchmarkName("lint, W9007 only"), Script(_LINT),
+                    plugin + ["--enable=W9007", "--score=n", str(module)]),
+    ]
+
+
+def _run_once(case: StartupCase):
+    # pylint: disable=chain-of-method-calls
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", case.script + _COUNT_MODULES,
+                                *case.arguments], capture_output=True, check=True, text=True)
+    return time.perf_counter() - start, int(completed.stderr.split()[-1])
+
+
+def measure(case: StartupCase, repeat: Size):
+    """Run the case in fresh interpreters, keeping the best time of the repeats."""
+    runs = [_run_once(case) for _ in range(repeat)]
+    return StartupResult(case.name, min(seconds for seconds, _ in runs), runs[-1][1])
+
+
+def _print_results(results: List[StartupResult]):
+    print(f"{'case':<26}{'ms':>9}{'plugin modules':>16}")
+    for result in results:
+        print(f"{result.name:<26}{result.seconds * 1000:>9.1f}{result.plugin_modules:>16}")
+
+
+def main(argv: Arguments = None):
+    """Run every startup case and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs of each case")
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        module = Path(directory) / "tiny.py"
+        module.write_text(_TINY_MODULE, encoding="utf-8")
+        _print_results([measure(case, Size(args.repeat)) for case in cases(module)])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
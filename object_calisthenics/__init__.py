@@ -0,0 +1,3 @@
+"""Object calisthenics pylint plugin"""
+
+__version__ = "0.0.1"
@@ -0,0 +1,6 @@
+"""Run the object calisthenics checkers without the rest of pylint"""
+import sys
+
+from object_calisthenics.runner import main
+
+sys.exit(main())
@@ -0,0 +1,9 @@
+"""
+Implementation of the object calisthenics rules over the stdlib ``ast`` module.
+
+None of the checkers relies on inference, so the same rules can run on the much
+cheaper trees built by ``ast.parse``. The violations carry the locations and frame
+names pylint reports for the astroid based checkers.
+"""
+from object_calisthenics.ast_backend.engine import EngineOptions, check_module, check_source
+from object_calisthenics.ast_backend.violation import Violation, Violations
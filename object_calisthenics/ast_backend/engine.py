@@ -0,0 +1,276 @@
+"""Walk of stdlib ast modules applying the object calisthenics rules"""
+import ast
+import re
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from object_calisthenics.ast_backend.function_facts import (AstFactsWalker,
+                                                            AstFirstViolationWalker,
+                                                            AstModuleWalker, TryExceptPart)
+from object_calisthenics.ast_backend.instance_attrs import instance_attrs
+from object_calisthenics.ast_backend.rules import chain_length, has_primitive_arguments
+from object_calisthenics.ast_backend.tree import children
+from object_calisthenics.ast_backend.violation import Violation, Violations
+from object_calisthenics.checkers.annotation_classifier import (AnnotationClassifier,
+                                                                CollectionClassifier,
+                                                                classifier_for,
+                                                                collection_classifier_for)
+from object_calisthenics.checkers.annotation_keys import TypeAliases
+from object_calisthenics.checkers.class_lines import (ClassSizes, LineKinds, LineNumber,
+                                                      source_excluded_lines)
+from object_calisthenics.checkers.class_metrics import attribute_counts
+from object_calisthenics.checkers.declarations import (DEFAULT_ALIASES, DEFAULT_COLLECTIONS,
+                                                       DEFAULT_PRIMITIVES)
+from object_calisthenics.checkers.function_body_walker import (ELSE_BRANCHES,
+                                                               MAX_INDENTATION_LEVELS,
+                                                               NESTED_BLOCKS, ViolationKind)
+from object_calisthenics.checkers.module_aliases import ast_module_aliases
+from object_calisthenics.checkers.one_dot_per_line import Receivers
+
+_DEFINITION = re.compile(r"(?:def|class)(?:\s|\\\n)+\w+")
+
+Source = str
+SourceLines = Tuple[str, ...]
+Frame = Tuple[str, ...]
+StatementFrames = Dict[int, Frame]
+ViolationMode = str
+FactsWalker = Union[AstFactsWalker, AstModuleWalker]
+
+
+class EngineOptions(NamedTuple):
+    """The checker options the rules depend on."""
+    max_class_lines: int = 150
+    classifier: AnnotationClassifier = classifier_for(DEFAULT_PRIMITIVES, DEFAULT_ALIASES)
+    max_chain_length: int = 1
+    chain_receivers: Receivers = ()
+    class_lines_exclude: LineKinds = frozenset()
+    indentation_violations: ViolationMode = "first"
+    else_violations: ViolationMode = "first"
+    collections: CollectionClassifier = collection_classifier_for(DEFAULT_COLLECTIONS)
+    max_indentation_levels: int = MAX_INDENTATION_LEVELS
+
+
+class InnerAttributes:
+    # pylint: disable=chain-of-method-calls
+    """The attributes found inside a chain already checked from its outermost node."""
+
+    def __init__(self):
+        self._ids: Set[int] = set()
+
+    def add(self, node: ast.expr):
+        """Mark the attribute as part of a checked chain, when it is one."""
+        if isinstance(node, ast.Attribute):
+            self._ids.add(id(node))
+
+    def take(self, node: ast.Attribute):
+        """Whether the attribute is part of a checked chain, forgetting it."""
+        inner = id(node) in self._ids
+        self._ids.discard(id(node))
+        return inner
+
+
+class ModuleChecker:  # pylint: disable=too-many-instance-attributes,single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    Applies the rules to a module in a single walk. The messages come in the order
+    pylint adds them for the astroid checkers: the function, call and attribute
+    messages when visiting their node, the class messages when leaving it.
+    """
+
+    def __init__(self, lines: SourceLines, options: EngineOptions, facts: FactsWalker,
+                 class_sizes: Optional[ClassSizes] = None):
+        self._lines: SourceLines = lines
+        self._options: EngineOptions = options
+        self._facts: FactsWalker = facts
+        self._class_sizes: ClassSizes = class_sizes or ClassSizes()
+        self._frame: Frame = ()
+        self._inner: InnerAttributes = InnerAttributes()
+        self._aliases: TypeAliases = TypeAliases({})
+        self.violations: Violations = Violations()
+
+    def _add(self, msgid: str, span: Tuple[int, ...],  # pylint: disable=dont-use-primitives
+             args: object = None, frame: Optional[Frame] = None):
+        self.violations.append(Violation(msgid, *span, ".".join(frame or self._frame), args))
+
+    def _definition_span(self, node: ast.stmt):
+        """The span of the keyword and name of a definition, as astroid reports it."""
+        line = self._lines[node.lineno - 1]
+        column = len(line.encode()[:node.col_offset].decode(errors="ignore"))
+        text = "\n".join(self._lines[node.lineno - 1:node.lineno + 2])
+        match = _DEFINITION.match(text, column)
+        end = match.end() if match else column
+        line_start = text.rfind("\n", 0, end) + 1
+        return node.lineno, column, node.lineno + text.count("\n", 0, end), end - line_start
+
+    @staticmethod
+    def _span(node: ast.expr):
+        return node.lineno, node.col_offset, node.end_lineno, node.end_col_offset
+
+    def _statement_span(self, statement: Union[ast.stmt, TryExceptPart]):
+        """The span astroid reports a statement at, its TryExcept ending before finally."""
+        if isinstance(statement, TryExceptPart):
+            last = (statement.statement.orelse or statement.statement.handlers)[-1]
+            return statement.statement.lineno, statement.statement.col_offset, \
+                last.end_lineno, last.end_col_offset
+        if isinstance(statement, _DEFINITIONS):
+            return self._definition_span(statement)
+        return self._span(statement)
+
+    def _add_at(self, msgid: str, statement: Union[ast.stmt, TryExceptPart],  # pylint: disable=dont-use-primitives
+                frames: StatementFrames, args: object = None):
+        """Add a message on a statement of the function, in the frame astroid gives it."""
+        node = statement.statement if isinstance(statement, TryExceptPart) else statement
+        self._add(msgid, self._statement_span(statement), args, frames[id(node)])
+
+    def _violations(self, node: ast.FunctionDef, kind: ViolationKind, mode: ViolationMode):
+        """Every violation of a kind of the function, or the first one walking up to it."""
+        if isinstance(self._facts, AstModuleWalker):
+            return kind.located(self._facts.facts_of(node))[:_reported(mode)]
+        return AstFirstViolationWalker.first_of(node, self._facts, kind,
+                                                self._options.max_indentation_levels)
+
+    def check_function(self, node: ast.FunctionDef):
+        """Apply the indentation, else and primitive arguments rules to a function."""
+        options = self._options
+        branches = self._violations(node, ELSE_BRANCHES, options.else_violations)
+        nested_blocks = self._violations(node, NESTED_BLOCKS, options.indentation_violations)
+        frames = statement_frames(node, self._frame) if branches or nested_blocks else {}
+        # pylint runs the checkers sorted by name, else-keyword-present comes first.
+        for branch in branches:
+            self._add_at("W9002", branch, frames)
+        for nested in nested_blocks:
+            self._add_at("W9001", nested.statement, frames,
+                         (nested.depth, options.max_indentation_levels))
+        if has_primitive_arguments(node, options.classifier):
+            self._add("W9003", self._definition_span(node))
+
+    def _check_chain(self, outermost: ast.expr, last_attribute: ast.Attribute):
+        dots = chain_length(last_attribute, self._options.chain_receivers)
+        if dots > self._options.max_chain_length:
+            self._add("W9006", self._span(outermost), (dots, self._options.max_chain_length))
+
+    def check_call(self, node: ast.Call):
+        """Apply the one dot per line rule to the chain of a method call."""
+        self._inner.add(node.func)
+        if isinstance(node.func, ast.Attribute):
+            self._check_chain(node, node.func)
+
+    def check_attribute(self, node: ast.Attribute):
+        """Apply the one dot per line rule to an attribute read ending a chain."""
+        if not isinstance(node.ctx, ast.Load):
+            return
+        self._inner.add(node.value)
+        if not self._inner.take(node):
+            self._check_chain(node, node)
+
+    def enter_module(self, node: ast.Module):
+        """Collect the type aliases of the module its annotations are resolved with."""
+        self._aliases = ast_module_aliases(node)
+
+    def enter_class(self, _: ast.ClassDef):
+        """Start counting the lines of the nested classes of a class."""
+        self._class_sizes.enter()
+
+    def check_class(self, node: ast.ClassDef):
+        """Apply the instance attributes and class size rules to a class."""
+        collections = self._options.collections
+        counts = attribute_counts(
+            (assignment.annotation for assignment in instance_attrs(node)),
+            lambda annotation: collections.is_collection_ast(annotation, self._aliases))
+        span = self._definition_span(node)
+        lines = self._class_sizes.leave(LineNumber(node.lineno), LineNumber(node.end_lineno))
+        if counts.untyped:
+            self._add("W9005", span)
+        if counts.collections and counts.attrs > 1:
+            self._add("W9004", span)
+        if lines > self._options.max_class_lines:
+            self._add("W9007", span, (lines, self._options.max_class_lines))
+
+    def _enter(self, node: ast.AST):
+        """Apply the rules of a node entered, returning what is left to walk of it."""
+        outer = self._frame
+        if isinstance(node, _FRAMES):
+            self._frame = outer + (getattr(node, "name", "<lambda>"),)
+        enter = _ENTER_RULES.get(type(node))
+        if enter:
+            enter(self, node)
+        return [PendingLeave(node, outer)] + list(children(node))[::-1]
+
+    def _leave(self, pending: "PendingLeave"):
+        leave = _LEAVE_RULES.get(type(pending.node))
+        if leave:
+            leave(self, pending.node)
+        self._frame = pending.outer_frame
+
+    def _step(self, pending: "PendingStep"):
+        if isinstance(pending, PendingLeave):
+            self._leave(pending)
+            return []
+        return self._enter(pending)
+
+    def visit(self, node: ast.AST):
+        """
+        Apply the rules to a node and everything below it. The nodes left to enter
+        and to leave are kept on a stack, so the depth of the tree isn't bounded by
+        the recursion limit.
+        """
+        pending: List[PendingStep] = [node]
+        while pending:
+            pending.extend(self._step(pending.pop()))
+
+
+class PendingLeave(NamedTuple):
+    """A node entered by the walk, to be left once everything below it is walked."""
+    node: ast.AST
+    outer_frame: Frame
+
+
+PendingStep = Union[ast.AST, PendingLeave]
+
+
+def statement_frames(function: ast.AST, frame: Frame):
+    """
+    The frames astroid gives the nodes below a function in the frame, by their ids: a
+    definition is its own frame, the other nodes are in the one of their definition.
+    """
+    frames: StatementFrames = {}
+    pending = [(child, frame) for child in ast.iter_child_nodes(function)]
+    while pending:
+        node, outer = pending.pop()
+        inner = outer + (getattr(node, "name", "<lambda>"),) if isinstance(node, _FRAMES) \
+            else outer
+        frames[id(node)] = inner
+        pending.extend((child, inner) for child in ast.iter_child_nodes(node))
+    return frames
+
+
+def _reported(mode: ViolationMode):
+    """How many violations of a function are reported, all of them or the first."""
+    return None if mode == "all" else 1
+
+
+_DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_FRAMES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+_ENTER_RULES = {
+    ast.Module: ModuleChecker.enter_module,
+    ast.FunctionDef: ModuleChecker.check_function,
+    ast.ClassDef: ModuleChecker.enter_class,
+    ast.Call: ModuleChecker.check_call,
+    ast.Attribute: ModuleChecker.check_attribute,
+}
+_LEAVE_RULES = {ast.ClassDef: ModuleChecker.check_class}
+
+
+def check_module(module: ast.Module, source: Source, options: EngineOptions):
+    """Return the violations in a module parsed from the source."""
+    every = "all" in (options.else_violations, options.indentation_violations)
+    facts = AstModuleWalker(options.max_indentation_levels) if every else AstFactsWalker()
+    facts.walk(module)
+    checker = ModuleChecker(tuple(source.split("\n")), options, facts,
+                            ClassSizes(source_excluded_lines(source, options.class_lines_exclude)))
+    checker.visit(module)
+    return checker.violations
+
+
+def check_source(source: Source, options: EngineOptions = EngineOptions()):
+    """Parse the source with the stdlib ast module and return the violations in it."""
+    return check_module(ast.parse(source), source, options)
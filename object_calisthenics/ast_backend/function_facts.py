@@ -0,0 +1,52 @@
+"""Per-function body facts of stdlib ast modules"""
+import ast
+from typing import Dict, NamedTuple, Tuple
+
+from object_calisthenics.checkers.function_body_walker import (FirstViolationWalker,
+                                                                LocatingModuleWalker,
+                                                                MeasuringModuleWalker,
+                                                                ModuleWalker, StatementShape)
+
+
+class TryExceptPart(NamedTuple):
+    """
+    The ``TryExcept`` astroid builds inside the ``TryFinally`` of a ``try`` that has both
+    handlers and a ``finally`` block, located as the statement it has no ast node for.
+    """
+    statement: ast.Try
+
+
+def _has_try_except_part(statement: ast.AST):
+    return isinstance(statement, ast.Try) and statement.handlers and statement.finalbody
+
+
+class AstWalker(ModuleWalker):
+    """
+    The module walk over stdlib ast nodes, knowing their statements as the walks of
+    the astroid checkers know astroid ones. Astroid builds a ``try`` that has both
+    handlers and a ``finally`` block as a ``TryFinally`` wrapping a ``TryExcept``,
+    which adds an indentation level that is added here as well, the ``TryExcept``
+    being located as its own statement.
+    """
+
+    _function_types: Tuple[type, ...] = (ast.FunctionDef, ast.AsyncFunctionDef)
+    _if_types: Tuple[type, ...] = (ast.If,)
+    _shapes: Dict[type, StatementShape] = {}
+
+    def _levels(self, statement: ast.AST):
+        return 2 if _has_try_except_part(statement) else 1
+
+    def _located(self, statement: ast.AST, level: int):  # pylint: disable=dont-use-primitives
+        return TryExceptPart(statement) if level else statement
+
+
+class AstFactsWalker(AstWalker, MeasuringModuleWalker):
+    """The module walk over stdlib ast nodes, measuring the bodies without locating."""
+
+
+class AstModuleWalker(AstWalker, LocatingModuleWalker):
+    """The module walk over stdlib ast nodes, locating every violation."""
+
+
+class AstFirstViolationWalker(AstWalker, FirstViolationWalker):
+    """The walk of a function over stdlib ast nodes, up to its first violation."""
@@ -0,0 +1,200 @@
+"""Instance attributes of stdlib ast classes"""
+import ast
+from typing import Dict, Iterator, NamedTuple, Optional, Set
+
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+_CLASS_METHODS = frozenset({"__new__", "__init_subclass__", "__class_getitem__"})
+_NON_INSTANCE_DECORATORS = frozenset({"staticmethod", "classmethod"})
+
+ArgumentName = Optional[str]
+
+
+class AttributeAssignment(NamedTuple):
+    """An assignment of an instance attribute, with its annotation when annotated."""
+    annotated: bool
+    annotation: Optional[ast.expr]
+    in_init: bool
+
+
+class InstanceAttrs:
+    # pylint: disable=chain-of-method-calls
+    """
+    The first assignment of every instance attribute of a class, the equivalent of
+    the first node of ``ClassDef.instance_attrs`` in astroid.
+    Astroid finds them by inferring the target of attribute assignments. Here they
+    are the attributes assigned on the instance argument of the methods, or on a
+    name bound to ``X.__new__(cls, ...)`` in any method, in the methods and in the
+    functions nested in them that don't rebind that name. The methods of classes
+    deriving from ``type`` get the class as first argument, as astroid infers it.
+    The fields of dataclasses are instance attributes too, as the astroid dataclass
+    transform makes them.
+    As in astroid, an assignment made directly in ``__init__`` comes first.
+    """
+
+    def __init__(self):
+        self._assignments: Dict[str, AttributeAssignment] = {}
+
+    def __len__(self):
+        return len(self._assignments)
+
+    def __iter__(self) -> Iterator[AttributeAssignment]:
+        return iter(self._assignments.values())
+
+    def record(self, name: str,  # pylint: disable=dont-use-primitives
+               assignment: AttributeAssignment):
+        """Record an assignment, keeping the one astroid would list first."""
+        first = self._assignments.get(name)
+        if first is None or (assignment.in_init and not first.in_init):
+            self._assignments[name] = assignment
+
+    def replace(self, name: str,  # pylint: disable=dont-use-primitives
+                assignment: AttributeAssignment):
+        """Make an assignment the first one of the attribute."""
+        self._assignments[name] = assignment
+
+
+def _decorator_names(function: ast.AST):
+    return {decorator.id for decorator in function.decorator_list
+            if isinstance(decorator, ast.Name)}
+
+
+def _first_argument(function: ast.AST):
+    arguments = function.args.posonlyargs + function.args.args  # pylint: disable=chain-of-method-calls
+    return arguments[0].arg if arguments else None
+
+
+def _binds(function: ast.AST, name: str):  # pylint: disable=dont-use-primitives
+    arguments = function.args
+    every = arguments.posonlyargs + arguments.args + arguments.kwonlyargs + \
+        [arguments.vararg, arguments.kwarg]
+    return any(argument is not None and argument.arg == name for argument in every)
+
+
+def _is_metaclass(node: ast.ClassDef):
+    return any(isinstance(base, ast.Name) and base.id == "type" for base in node.bases)
+
+
+def _is_instance_method(method: ast.AST, owner: ast.ClassDef):
+    return not (_is_metaclass(owner) or method.name in _CLASS_METHODS or
+                _decorator_names(method) & _NON_INSTANCE_DECORATORS)
+
+
+class InstanceNames:
+    """The names a method refers to instances of its class with."""
+
+    def __init__(self):
+        self._names: Set[str] = set()
+
+    def __contains__(self, name: str):  # pylint: disable=dont-use-primitives
+        return name in self._names
+
+    def add(self, name: str):  # pylint: disable=dont-use-primitives
+        """Add a name bound to an instance."""
+        self._names.add(name)  # pylint: disable=chain-of-method-calls
+
+    def rebound_by(self, function: ast.AST):
+        """Whether a nested function binds one of the names to its own argument."""
+        return any(_binds(function, name) for name in self._names)
+
+
+def _creates_instance(node: ast.AST, class_argument: ArgumentName):
+    # pylint: disable=chain-of-method-calls
+    """Whether the node is ``name = X.__new__(class_argument, ...)``."""
+    if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)):
+        return False
+    call = node.value
+    return isinstance(call.func, ast.Attribute) and call.func.attr == "__new__" and \
+        bool(call.args) and isinstance(call.args[0], ast.Name) and \
+        call.args[0].id == class_argument and len(node.targets) == 1 and \
+        isinstance(node.targets[0], ast.Name)
+
+
+class _MethodScan:
+    # pylint: disable=chain-of-method-calls
+    """Collects the attributes a method assigns on the instances it has names for."""
+
+    def __init__(self, method: ast.AST, owner: ast.ClassDef, attrs: InstanceAttrs):
+        self._method: ast.AST = method
+        self._class_argument: ArgumentName = _first_argument(method)
+        self._instances: InstanceNames = InstanceNames()
+        if _is_instance_method(method, owner):
+            self._instances.add(self._class_argument)
+        self._attrs: InstanceAttrs = attrs
+
+    def _is_instance_attribute(self, node: ast.AST):
+        return isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Store) and \
+            isinstance(node.value, ast.Name) and node.value.id in self._instances
+
+    def _record(self, node: ast.Attribute, statement: ast.AST, frame: ast.AST):
+        annotated = isinstance(statement, ast.AnnAssign) and statement.target is node
+        annotation = statement.annotation if annotated else None
+        in_init = isinstance(frame, ast.FunctionDef) and frame.name == "__init__"
+        self._attrs.record(node.attr, AttributeAssignment(annotated, annotation, in_init))
+
+    def _skipped(self, node: ast.AST):
+        """Whether a nested function rebinds the names of the instances, once reached."""
+        return node is not self._method and isinstance(node, _FUNCTIONS) and \
+            self._instances.rebound_by(node)
+
+    def scan(self, scanned: "ScannedNode"):
+        """Scan a node of the method, returning its children to scan."""
+        node, statement, frame = scanned
+        if self._skipped(node):
+            return []
+        if self._is_instance_attribute(node):
+            self._record(node, statement, frame)
+        if _creates_instance(node, self._class_argument):
+            self._instances.add(node.targets[0].id)
+        statement = node if isinstance(node, ast.stmt) else statement
+        frame = node if isinstance(node, _FUNCTIONS) else frame
+        return [ScannedNode(child, statement, frame) for child in ast.iter_child_nodes(node)]
+
+    def scan_method(self):
+        """
+        Scan the whole method in source order, like astroid builds it, keeping the
+        nodes left to scan on a stack.
+        """
+        pending = [ScannedNode(self._method, self._method, self._method)]
+        while pending:
+            pending.extend(reversed(self.scan(pending.pop())))
+
+
+class ScannedNode(NamedTuple):
+    """A node of a method, with the statement and the function it is part of."""
+    node: ast.AST
+    statement: ast.AST
+    frame: ast.AST
+
+
+def _name_of(node: ast.AST):
+    if isinstance(node, ast.Call):
+        return _name_of(node.func)
+    if isinstance(node, ast.Subscript):
+        return _name_of(node.value)
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return getattr(node, "id", None)
+
+
+def _is_dataclass_field(statement: ast.AST):
+    return isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name) \
+        and _name_of(statement.annotation) not in ("ClassVar", "KW_ONLY")
+
+
+def _dataclass_fields(node: ast.ClassDef):
+    if not any(_name_of(decorator) == "dataclass" for decorator in node.decorator_list):
+        return []
+    return [statement for statement in node.body if _is_dataclass_field(statement)]
+
+
+def instance_attrs(node: ast.ClassDef):
+    """Return the first assignment of every instance attribute of the class."""
+    attrs = InstanceAttrs()
+    methods = (statement for statement in node.body
+               if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)))
+    for method in methods:
+        _MethodScan(method, node, attrs).scan_method()
+    for field in _dataclass_fields(node):
+        attrs.replace(field.target.id,  # pylint: disable=chain-of-method-calls
+                      AttributeAssignment(True, field.annotation, False))
+    return attrs
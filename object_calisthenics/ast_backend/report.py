@@ -0,0 +1,143 @@
+"""Reporting of the ast engine violations through a pylint linter"""
+# The violations are added the way PyLinter adds the messages of a node, which
+# goes through a few protected members of the pinned pylint version.
+# pylint: disable=protected-access
+import ast
+import importlib.util
+import os
+from pathlib import Path
+from typing import Callable, FrozenSet, Iterable, Optional
+
+from pylint.constants import MSG_TYPES, MSG_TYPES_STATUS
+from pylint.interfaces import UNDEFINED
+from pylint.lint import PyLinter
+from pylint.message import Message
+from pylint.typing import FileItem, MessageLocationTuple
+from pylint.utils import FileState
+from pylint.utils.pragma_parser import OPTION_PO
+
+from object_calisthenics.ast_backend.engine import EngineOptions, Source, check_module
+from object_calisthenics.ast_backend.violation import Violation
+from object_calisthenics.checkers.annotation_classifier import (classifier_for,
+                                                                collection_classifier_for)
+from object_calisthenics.checkers.baseline import (Baseline, SourceLines, configured_baseline,
+                                                   fingerprint, qualified_name, source_line)
+from object_calisthenics.checkers.class_lines import LINE_KINDS
+from object_calisthenics.checkers.message_location import module_name
+from object_calisthenics.checkers.one_dot_per_line import parse_receivers
+from object_calisthenics.checkers.path_rules import PathSettings, configured_path_rules
+
+ModuleCheck = Callable[..., Optional[bool]]
+
+
+def _read_source(item: FileItem):
+    try:
+        return Source(importlib.util.decode_source(Path(item.filepath).read_bytes()))  # pylint: disable=chain-of-method-calls
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+
+_DOCUMENTED = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _statements(node: ast.AST):
+    """The statements astroid builds for a node: docstrings aren't statements in astroid,
+    and a try with handlers and a finally is built as two statements."""
+    statements = int(isinstance(node, (ast.stmt, ast.ExceptHandler)))
+    if isinstance(node, _DOCUMENTED) and ast.get_docstring(node, clean=False) is not None:
+        return statements - 1
+    if isinstance(node, ast.Try) and node.handlers and node.finalbody:
+        return statements + 1
+    return statements
+
+
+def statement_count(module: ast.Module):
+    """The amount of statements the pylint walker counts in the astroid module."""
+    return sum(_statements(node) for node in ast.walk(module))
+
+
+class AstFileReport:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    Adds the violations of a file to the linter, as it adds the checkers messages,
+    leaving out the ones disabled under its path and the ones the baseline knows.
+    """
+
+    def __init__(self, linter: PyLinter, item: FileItem, lines: SourceLines,
+                 settings: PathSettings):
+        self._linter: PyLinter = linter
+        self._module: str = module_name(item)
+        self._abspath: str = os.path.abspath(item.filepath)
+        self._lines: SourceLines = lines
+        self._baseline: Optional[Baseline] = configured_baseline(linter)
+        self._disabled: FrozenSet[str] = settings.disabled
+
+    def _is_known(self, violation: Violation):
+        return self._baseline is not None and fingerprint(
+            violation.msgid, qualified_name(self._module, violation.obj),
+            source_line(self._lines, violation.line)) in self._baseline
+
+    def _message(self, violation: Violation):
+        definition = self._linter.msgs_store.get_message_definitions(violation.msgid)[0]
+        text = definition.msg % violation.args if violation.args is not None else definition.msg
+        path = self._abspath.replace(self._linter.reporter.path_strip_prefix, "", 1)
+        location = MessageLocationTuple(self._abspath, path, self._module, violation.obj,
+                                        violation.line, violation.col_offset,
+                                        violation.end_lineno, violation.end_col_offset)
+        return Message(definition.msgid, definition.symbol, location, text, UNDEFINED)
+
+    def _count(self, message: Message):
+        linter = self._linter
+        linter.msg_status |= MSG_TYPES_STATUS[message.msg_id[0]]
+        linter.stats.increase_single_message_count(MSG_TYPES[message.msg_id[0]], 1)
+        linter.stats.increase_single_module_message_count(self._module,
+                                                          MSG_TYPES[message.msg_id[0]], 1)
+        linter.stats.by_msg[message.symbol] = linter.stats.by_msg.get(message.symbol, 0) + 1
+
+    def add(self, violation: Violation):
+        """Report a violation, unless its message is disabled or the baseline knows it."""
+        if violation.msgid not in self._disabled and \
+                self._linter.is_message_enabled(violation.msgid, violation.line) and \
+                not self._is_known(violation):
+            message = self._message(violation)
+            self._count(message)
+            self._linter.reporter.handle_message(message)
+
+    def add_all(self, violations: Iterable[Violation]):
+        """Report the violations of the file in order."""
+        for violation in violations:
+            self.add(violation)
+
+
+def report_file(linter: PyLinter, item: FileItem, check_astroid_module: ModuleCheck):
+    """
+    Check a file with the ast engine and report its violations through the linter.
+    Files that can't be read or parsed, or that contain pylint pragmas, whose scope
+    is computed on the astroid tree, are left to the astroid checkers: False is
+    returned for them and nothing is reported.
+    """
+    source = _read_source(item)
+    if source is None or OPTION_PO.search(source):
+        return False
+    try:
+        module = ast.parse(source, item.filepath)
+    except (SyntaxError, ValueError):
+        return False
+    linter.set_current_module(module_name(item), item.filepath)
+    linter.file_state = FileState(item.modpath, linter.msgs_store)
+    settings = configured_path_rules(linter).settings_of(item.filepath)
+    config = settings.config(linter.config)
+    options = EngineOptions(config.max_class_lines,
+                            classifier_for(config.primitive_types, config.primitive_aliases),
+                            config.max_chain_length,
+                            parse_receivers(config.chain_allowed_receivers),
+                            frozenset(config.class_lines_exclude).intersection(LINE_KINDS),
+                            config.indentation_violations, config.else_violations,
+                            collection_classifier_for(config.collection_types),
+                            config.max_indentation_levels)
+    report = AstFileReport(linter, item, source.split("\n"), settings)
+    report.add_all(check_module(module, source, options))
+    walker = check_astroid_module.keywords["walker"]
+    walker.nbstatements += statement_count(module)
+    linter.stats.statement = walker.nbstatements  # pylint: disable=chain-of-method-calls
+    return True
@@ -0,0 +1,27 @@
+"""Node level rules of the ast engine, the stdlib ast equivalent of the checkers tests"""
+import ast
+
+from object_calisthenics.checkers.annotation_classifier import AnnotationClassifier
+from object_calisthenics.checkers.one_dot_per_line import ChainLength, Receivers, receiver_dots
+
+
+def has_primitive_arguments(node: ast.FunctionDef, classifier: AnnotationClassifier):
+    """Whether a function takes an argument other than ``self`` typed with a primitive."""
+    arguments = node.args.args  # pylint: disable=chain-of-method-calls
+    if arguments and arguments[0].arg == "self":
+        arguments = arguments[1:]
+    return any(classifier.is_primitive_ast(argument.annotation) for argument in arguments)
+
+
+def chain_length(node: ast.Attribute, receivers: Receivers):
+    """Count the dots of the chain ending with the attribute, as OneDotPerLine does."""
+    path = [node.attr]
+    receiver = node.value
+    while isinstance(receiver, ast.Attribute):
+        path.append(receiver.attr)
+        receiver = receiver.value
+    dots = ChainLength(len(path))
+    if isinstance(receiver, ast.Name):
+        path.append(receiver.id)
+        dots = ChainLength(dots - receiver_dots(path[::-1], receivers))
+    return dots
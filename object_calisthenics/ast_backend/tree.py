@@ -0,0 +1,46 @@
+"""Children of stdlib ast nodes, in the order the pylint walker visits astroid nodes"""
+import ast
+from typing import Iterator
+
+
+def _arguments_children(node: ast.arguments):
+    """The children of the arguments, in the order astroid walks them."""
+    annotated = node.posonlyargs + node.args + [node.vararg, node.kwarg] + node.kwonlyargs
+    yield from [argument.annotation for argument in node.posonlyargs if argument.annotation]
+    yield from node.defaults
+    yield from [default for default in node.kw_defaults if default is not None]
+    yield from [argument.annotation for argument in annotated[len(node.posonlyargs):]
+                if argument is not None and argument.annotation is not None]
+
+
+def _dict_children(node: ast.Dict):
+    for key, value in zip(node.keys, node.values):
+        yield from [value] if key is None else [key, value]
+
+
+def _function_children(node: ast.FunctionDef):
+    yield from node.decorator_list
+    yield node.args
+    yield from [node.returns] if node.returns else []
+    yield from node.body
+
+
+def _class_children(node: ast.ClassDef):
+    yield from node.decorator_list
+    yield from node.bases
+    yield from node.keywords
+    yield from node.body
+
+
+_CHILDREN = {
+    ast.arguments: _arguments_children,
+    ast.Dict: _dict_children,
+    ast.FunctionDef: _function_children,
+    ast.AsyncFunctionDef: _function_children,
+    ast.ClassDef: _class_children,
+}
+
+
+def children(node: ast.AST) -> Iterator[ast.AST]:
+    """The children of a node, in the order the pylint walker visits astroid nodes."""
+    return _CHILDREN.get(type(node), ast.iter_child_nodes)(node)
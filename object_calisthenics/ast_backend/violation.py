@@ -0,0 +1,30 @@
+"""Violations of the rules found by the ast engine"""
+from typing import Iterator, List, NamedTuple, Optional
+
+
+class Violation(NamedTuple):
+    """A message to report, located the way pylint locates the astroid checkers messages."""
+    msgid: str
+    line: int
+    col_offset: int
+    end_lineno: Optional[int]
+    end_col_offset: Optional[int]
+    obj: str
+    args: object = None
+
+
+class Violations:
+    """The violations found in a module, in the order pylint would add them."""
+
+    def __init__(self):
+        self._violations: List[Violation] = []
+
+    def __iter__(self) -> Iterator[Violation]:
+        return iter(self._violations)
+
+    def __len__(self):
+        return len(self._violations)
+
+    def append(self, violation: Violation):
+        """Add a violation to the collection."""
+        self._violations.append(violation)  # pylint: disable=chain-of-method-calls
@@ -1,24 +1,51 @@
-"""The object calisthenics pylint checkers"""
+"""
+The object calisthenics pylint checkers.
+The checker classes are importable from here, but are only imported when asked for:
+pylint gets their declarations, and builds a checker once one of its messages is enabled.
+"""
+import importlib
 from typing import TYPE_CHECKING
 
-from object_calisthenics.checkers.else_keyword_present import ElseKeywordPresent
-from object_calisthenics.checkers.first_class_collections import FirstClassCollections
-from object_calisthenics.checkers.one_dot_per_line import OneDotPerLine
-from object_calisthenics.checkers.one_level_of_indentation import OneLevelOfIndentation
-from object_calisthenics.checkers.primitive_obsession import PrimitiveObsession
-from object_calisthenics.checkers.small_class_size import SmallClassSize
+from object_calisthenics.checkers.declarations import DECLARATIONS, REPORTERS
+from object_calisthenics.checkers.lazy_checker import LazyChecker
+from object_calisthenics.checkers.path_rules import configured_path_rules
+from object_calisthenics.checkers.plugin_options import PluginOptions
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
 
+    from object_calisthenics.checkers.else_keyword_present import ElseKeywordPresent
+    from object_calisthenics.checkers.first_class_collections import FirstClassCollections
+    from object_calisthenics.checkers.one_dot_per_line import OneDotPerLine
+    from object_calisthenics.checkers.one_level_of_indentation import OneLevelOfIndentation
+    from object_calisthenics.checkers.primitive_obsession import PrimitiveObsession
+    from object_calisthenics.checkers.small_class_size import SmallClassSize
+
+_CHECKER_MODULES = {declaration.class_name: declaration.module for declaration in DECLARATIONS}
+
+
+def __getattr__(name: str):  # pylint: disable=dont-use-primitives
+    """Import a checker class the first time it is asked for."""
+    if name not in _CHECKER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_CHECKER_MODULES[name]), name)
+
 
 def register(linter: "PyLinter"):
-    """This required method auto registers the checkers during initialization.
+    """This required method auto registers the checkers and the streaming reporters
+    during initialization. The reporters are registered by their declaration, and
+    imported once their output format is chosen.
     :param linter: The linter to register the checker to.
     """
-    linter.register_checker(OneLevelOfIndentation(linter))
-    linter.register_checker(ElseKeywordPresent(linter))
-    linter.register_checker(PrimitiveObsession(linter))
-    linter.register_checker(FirstClassCollections(linter))
-    linter.register_checker(OneDotPerLine(linter))
-    linter.register_checker(SmallClassSize(linter))
+    linter.register_checker(PluginOptions(linter))
+    for declaration in DECLARATIONS:
+        linter.register_checker(LazyChecker(linter, declaration))
+    for reporter in REPORTERS:
+        linter.register_reporter(reporter)
+
+
+def load_configuration(linter: "PyLinter"):
+    """Compile the per-path rules table once the configuration was read, before any check.
+    :param linter: The linter whose configuration was read.
+    """
+    configured_path_rules(linter)
@@ -0,0 +1,131 @@
+"""Memoized classification of annotations as primitive or collection types"""
+import ast
+import functools
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+from astroid import nodes
+
+from object_calisthenics.checkers.annotation_keys import (SUBSCRIPT, TUPLE, UNION, AnnotationKey,
+                                                          AnnotationKeys, TypeAliases,
+                                                          TypeNames, type_aliases)
+
+MAX_CACHED_KEYS = 4096
+
+
+def _classified_parts(key: AnnotationKey):
+    """The parts of a key that make it primitive, none for a name."""
+    if isinstance(key, str):
+        return ()
+    return key[2 if key[0] == SUBSCRIPT else 1:]
+
+
+class AnnotationClassifier:  # pylint: disable=single-collection-instance-variable
+    """
+    Tells whether annotations are, or are made of, primitive types.
+    Annotations are normalized to their canonical key first, and the verdict of
+    every key is kept in a bounded cache, so an annotation shape repeated across
+    the run is classified once. Only the arguments of a subscript are classified,
+    ``Optional[str]`` being primitive and ``List[Custom]`` not.
+    """
+
+    def __init__(self, primitives: FrozenSet[str],  # pylint: disable=dont-use-primitives
+                 aliases: TypeAliases):
+        self._primitives: FrozenSet[str] = primitives
+        self._aliases: TypeAliases = aliases
+        self.is_primitive_key: Callable[[AnnotationKey], bool] = \
+            functools.lru_cache(maxsize=MAX_CACHED_KEYS)(self._classify)
+
+    def _is_primitive_name(self, part: AnnotationKey):
+        return isinstance(part, str) and part in self._primitives
+
+    def _classify(self, key: AnnotationKey):
+        """Look for a primitive name among the parts of the key, keeping a stack of parts."""
+        pending = [key]
+        while pending and not self._is_primitive_name(pending[-1]):
+            pending.extend(_classified_parts(pending.pop()))
+        return bool(pending)
+
+    def is_primitive(self, annotation: Optional[nodes.NodeNG]):
+        """Whether an astroid annotation is primitive, a missing one being primitive."""
+        if annotation is None:
+            return True
+        return self.is_primitive_key(AnnotationKeys.of_astroid(annotation, self._aliases))
+
+    def is_primitive_ast(self, annotation: Optional[ast.expr]):
+        """Whether a stdlib ast annotation is primitive, a missing one being primitive."""
+        if annotation is None:
+            return True
+        return self.is_primitive_key(AnnotationKeys.of_ast(annotation, self._aliases))
+
+
+_CLASSIFIERS: Dict[Tuple[FrozenSet[str], TypeNames], AnnotationClassifier] = {}
+
+
+def classifier_for(primitives: TypeNames, aliases: TypeNames):
+    """Return the classifier of the primitives and ``alias:type`` aliases, shared by the run."""
+    key = (frozenset(primitives), tuple(aliases))
+    if key not in _CLASSIFIERS:
+        _CLASSIFIERS[key] = AnnotationClassifier(key[0], type_aliases(key[1]))
+    return _CLASSIFIERS[key]
+
+
+_WRAPPERS = frozenset({"Optional", "Union"})
+
+
+def _wrapped_parts(key: AnnotationKey):
+    """
+    The parts of a key that make it a collection: the name of a subscript, the types
+    an ``Optional`` or ``Union`` wraps, or the sides of a ``X | Y`` union.
+    """
+    if isinstance(key, str):
+        return ()
+    if key[0] == SUBSCRIPT:
+        return key[2:] if key[1] in _WRAPPERS else key[1:2]
+    return key[1:] if key[0] in (TUPLE, UNION) else ()
+
+
+class CollectionClassifier:  # pylint: disable=single-collection-instance-variable
+    """
+    Tells whether annotations are collection types, like ``List[str]``, ``deque`` or
+    ``Optional[Dict[str, int]]``. The annotations are normalized to their canonical
+    key through the type aliases of their module, so the verdict of every key only
+    depends on the collection types and is kept in a bounded cache for the run.
+    """
+
+    def __init__(self, collections: FrozenSet[str]):  # pylint: disable=dont-use-primitives
+        self._collections: FrozenSet[str] = collections
+        self.is_collection_key: Callable[[AnnotationKey], bool] = \
+            functools.lru_cache(maxsize=MAX_CACHED_KEYS)(self._classify)
+
+    def _is_collection_name(self, part: AnnotationKey):
+        return isinstance(part, str) and part in self._collections
+
+    def _classify(self, key: AnnotationKey):
+        """Look for a collection name among the wrapped parts of the key."""
+        pending = [key]
+        while pending and not self._is_collection_name(pending[-1]):
+            pending.extend(_wrapped_parts(pending.pop()))
+        return bool(pending)
+
+    def is_collection(self, annotation: Optional[nodes.NodeNG], aliases: TypeAliases):
+        """Whether an astroid annotation is a collection type, a missing one not being one."""
+        if annotation is None:
+            return False
+        return self.is_collection_key(AnnotationKeys.of_astroid(annotation, aliases))
+
+    def is_collection_ast(self, annotation: Optional[ast.expr], aliases: TypeAliases):
+        """Whether a stdlib ast annotation is a collection type, a missing one not being one."""
+        if annotation is None:
+            return False
+        return self.is_collection_key(AnnotationKeys.of_ast(annotation, aliases))
+
+
+_COLLECTION_CLASSIFIERS: Dict[FrozenSet[str], CollectionClassifier] = {}
+
+
+def collection_classifier_for(collections: TypeNames):
+    """Return the classifier of the collection types, shared by the run."""
+    key = frozenset(collections)
+    if key not in _COLLECTION_CLASSIFIERS:
+        _COLLECTION_CLASSIFIERS[key] = CollectionClassifier(key)
+    return _COLLECTION_CLASSIFIERS[key]
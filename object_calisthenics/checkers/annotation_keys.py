@@ -0,0 +1,199 @@
+"""Canonical keys of annotations, the same for astroid and stdlib ast nodes"""
+import ast
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from astroid import nodes
+
+AnnotationKey = Union[str, Tuple[object, ...]]
+TypeNames = Tuple[str, ...]
+
+UNKNOWN = ("?",)
+SUBSCRIPT = "[]"
+TUPLE = "()"
+UNION = "|"
+
+_QUALIFIERS = frozenset({"typing", "typing_extensions", "builtins"})
+_LITERAL = "Literal"
+_ANNOTATED = "Annotated"
+
+
+class TypeAliases:
+    # pylint: disable=chain-of-method-calls
+    """The type names standing for another type name, like ``Text`` for ``str``."""
+
+    def __init__(self, aliases: Dict[str, str]):  # pylint: disable=dont-use-primitives
+        self._aliases: Dict[str, str] = aliases
+
+    def resolve(self, name: str):  # pylint: disable=dont-use-primitives
+        """The name the alias stands for, or the name itself when it isn't an alias."""
+        return self._aliases.get(name, name)
+
+    def qualified(self, qualifier: AnnotationKey, name: str):  # pylint: disable=dont-use-primitives
+        """
+        The key of a qualified name. The ``typing``, ``typing_extensions`` and
+        ``builtins`` qualifiers are dropped, ``typing.Text`` being the same as ``Text``.
+        """
+        if not isinstance(qualifier, str):
+            return UNKNOWN
+        if qualifier in _QUALIFIERS:
+            return self.resolve(name)
+        return self.resolve(f"{qualifier}.{name}")
+
+
+def type_aliases(definitions: TypeNames):
+    """Parse ``alias:type`` definitions, ignoring the ones without a type."""
+    pairs = (definition.partition(":") for definition in definitions)
+    return TypeAliases({alias.strip(): target.strip() for alias, _, target in pairs if target})
+
+
+def _string_key(annotation: str, aliases: TypeAliases):  # pylint: disable=dont-use-primitives
+    """The key of a forward reference, the annotation written as a string."""
+    try:
+        expression = ast.parse(annotation.strip(), mode="eval")
+    except SyntaxError:
+        return UNKNOWN
+    return AnnotationKeys.of_ast(expression.body, aliases)
+
+
+def _constant_key(value: object, aliases: TypeAliases):
+    if isinstance(value, str):
+        return _string_key(value, aliases)
+    return "None" if value is None else UNKNOWN
+
+
+class KeyRule(NamedTuple):
+    """
+    How the key of a type of node is built: the nodes whose keys it is made of, found
+    with the type aliases, and how the key is made from theirs.
+    """
+    parts: Callable[..., Sequence[object]]
+    combine: Callable[..., AnnotationKey]
+
+
+_NO_PARTS: Tuple[object, ...] = ()
+
+
+def _no_parts(*_: object):
+    return _NO_PARTS
+
+
+_UNKNOWN_RULE = KeyRule(_no_parts, lambda *_: UNKNOWN)
+
+
+def _subscript_parts(value: object, arguments: object, first_argument: object,
+                     name: object):
+    """
+    The parts of a subscript that are types, the strings in them being forward
+    references: the arguments of ``Literal`` are values, and only the first argument
+    of ``Annotated`` is a type, the other ones being its metadata.
+    """
+    if name == _LITERAL:
+        return (value,)
+    return (value, first_argument) if name == _ANNOTATED else (value, arguments)
+
+
+def _astroid_subscript_parts(node: nodes.Subscript, aliases: TypeAliases):
+    value, arguments = node.value, node.slice
+    name = aliases.resolve(value.name) if isinstance(value, nodes.Name) else \
+        getattr(value, "attrname", None)
+    elements = arguments.elts if isinstance(arguments, nodes.Tuple) else ()
+    return _subscript_parts(value, arguments, elements[0] if elements else arguments, name)
+
+
+def _ast_subscript_parts(node: ast.Subscript, aliases: TypeAliases):
+    value, arguments = node.value, node.slice
+    name = aliases.resolve(value.id) if isinstance(value, ast.Name) else \
+        getattr(value, "attr", None)
+    elements = arguments.elts if isinstance(arguments, ast.Tuple) else ()
+    return _subscript_parts(value, arguments, elements[0] if elements else arguments, name)
+
+
+def _is_union(operator: str):  # pylint: disable=dont-use-primitives
+    return operator == "|"
+
+
+def _union(is_union: bool, parts: Tuple[AnnotationKey, ...]):  # pylint: disable=dont-use-primitives
+    return (UNION,) + parts if is_union else UNKNOWN
+
+
+_ASTROID_KEYS = {
+    nodes.Name: KeyRule(_no_parts, lambda node, _, aliases: aliases.resolve(node.name)),
+    nodes.Attribute: KeyRule(lambda node, _: (node.expr,),
+                             lambda node, parts, aliases: aliases.qualified(parts[0],
+                                                                            node.attrname)),
+    nodes.Subscript: KeyRule(_astroid_subscript_parts,
+                             lambda _, parts, __: (SUBSCRIPT,) + parts),
+    nodes.Tuple: KeyRule(lambda node, _: node.elts, lambda _, parts, __: (TUPLE,) + parts),
+    nodes.BinOp: KeyRule(lambda node, _: (node.left, node.right) if _is_union(node.op) else (),
+                         lambda node, parts, _: _union(_is_union(node.op), parts)),
+    nodes.Const: KeyRule(_no_parts, lambda node, _, aliases: _constant_key(node.value, aliases)),
+}
+
+_AST_KEYS = {
+    ast.Name: KeyRule(_no_parts, lambda node, _, aliases: aliases.resolve(node.id)),
+    ast.Attribute: KeyRule(lambda node, _: (node.value,),
+                           lambda node, parts, aliases: aliases.qualified(parts[0], node.attr)),
+    ast.Subscript: KeyRule(_ast_subscript_parts,
+                           lambda _, parts, __: (SUBSCRIPT,) + parts),
+    ast.Tuple: KeyRule(lambda node, _: node.elts, lambda _, parts, __: (TUPLE,) + parts),
+    ast.BinOp: KeyRule(
+        lambda node, _: (node.left, node.right) if isinstance(node.op, ast.BitOr) else (),
+        lambda node, parts, _: _union(isinstance(node.op, ast.BitOr), parts)),
+    ast.Constant: KeyRule(_no_parts,
+                          lambda node, _, aliases: _constant_key(node.value, aliases)),
+}
+
+
+# A node whose key is built once the keys of its parts are, with its rule and how many
+# parts it has.
+PendingNode = Tuple[object, KeyRule, int]
+
+
+def _pending_nodes(annotation: object, rules: Dict[type, KeyRule],
+                   aliases: TypeAliases) -> List[PendingNode]:
+    """The nodes of the annotation, every node before the nodes of its parts."""
+    ordered: List[PendingNode] = []
+    pending = [annotation]
+    while pending:
+        node = pending.pop()
+        rule = rules.get(type(node), _UNKNOWN_RULE)
+        parts = rule.parts(node, aliases)
+        ordered.append((node, rule, len(parts)))
+        pending.extend(parts)
+    return ordered
+
+
+def _build_key(annotation: object, rules: Dict[type, KeyRule], aliases: TypeAliases):
+    """
+    Build the key of an annotation with a stack of built keys instead of recursing:
+    the nodes taken in the reverse of their order come after the nodes of their
+    parts, whose keys are then the last ones built, in the order of the parts.
+    """
+    keys: List[AnnotationKey] = []
+    for node, rule, arity in reversed(_pending_nodes(annotation, rules, aliases)):
+        first_part = len(keys) - arity
+        parts = tuple(keys[first_part:])
+        del keys[first_part:]
+        keys.append(rule.combine(node, parts, aliases))
+    return keys[0]
+
+
+class AnnotationKeys:
+    """
+    Builds the canonical key of an annotation: names are resolved through the type
+    aliases and lose their ``typing`` qualifier, ``X | Y`` unions keep both sides
+    and string annotations are parsed, unless they are the values of a ``Literal``
+    or the metadata of an ``Annotated``. Equivalent annotations, from astroid or the
+    stdlib ast module, get the same key. Annotations nested deeper than the
+    recursion limit, like long unions of generated code, get their key as well.
+    """
+
+    @staticmethod
+    def of_astroid(node: nodes.NodeNG, aliases: TypeAliases) -> AnnotationKey:
+        """The key of an astroid annotation."""
+        return _build_key(node, _ASTROID_KEYS, aliases)
+
+    @staticmethod
+    def of_ast(node: ast.expr, aliases: TypeAliases) -> AnnotationKey:
+        """The key of a stdlib ast annotation."""
+        return _build_key(node, _AST_KEYS, aliases)
@@ -0,0 +1,151 @@
+"""
+Baseline of known violations, left out of the reported messages.
+
+A violation is known by its fingerprint, a 64 bits hash of its message id, the
+qualified name of the module, class or function it is reported in, and the source
+line it starts on, whitespace normalized. The fingerprint doesn't depend on line
+numbers, so unrelated edits moving a violation around don't make it new, while a
+rewritten statement or a moved function does.
+
+The baseline file holds ``HEADER``, made of ``MAGIC`` and the amount of fingerprints,
+followed by the sorted and distinct fingerprints as little-endian unsigned 64 bits
+integers. It is read into a hash set, so every message is looked up in constant time
+whatever the size of the baseline. Baseline files are written by the
+``calisthenics-baseline`` reporter, see ``reporters.baseline_reporter``.
+"""
+import hashlib
+import importlib.util
+import struct
+import weakref
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Dict, FrozenSet, Iterable, List, Tuple
+
+from astroid import nodes
+from pylint.utils import get_module_and_frameid
+
+from object_calisthenics.checkers.class_index_format import little_endian
+from object_calisthenics.checkers.message_location import MessageLocation, message_location
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+MAGIC = b"OCBASE\x01\x00"
+HEADER = struct.Struct("<8sQ")
+
+Fingerprint = int
+SourceLines = List[str]
+
+
+class BaselineError(Exception):
+    """The baseline file can't be read."""
+
+
+def qualified_name(module: str, obj: str):  # pylint: disable=dont-use-primitives
+    """The name of the module, class or function a message is reported in."""
+    return f"{module}.{obj}" if obj else module
+
+
+def fingerprint(msgid: str, qualname: str, line: str):  # pylint: disable=dont-use-primitives
+    """The fingerprint of a message reported in a scope on a source line."""
+    normalized = " ".join(line.split())
+    digest = hashlib.blake2b(f"{msgid}\0{qualname}\0{normalized}".encode(), digest_size=8)
+    return Fingerprint(int.from_bytes(digest.digest(), "little"))
+
+
+def decoded_lines(source: bytes):  # pylint: disable=dont-use-primitives
+    """The lines of a python source file, decoded the way the interpreter does."""
+    return importlib.util.decode_source(source).split("\n")  # pylint: disable=chain-of-method-calls
+
+
+def source_line(lines: SourceLines, line: int):  # pylint: disable=dont-use-primitives
+    """A line of the source by its number, empty past the end of the source."""
+    return lines[line - 1] if 0 < line <= len(lines) else ""
+
+
+_MODULE_LINES: "weakref.WeakKeyDictionary[nodes.Module, SourceLines]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _read_module_lines(module: nodes.Module):
+    with module.stream() as stream:
+        return decoded_lines(stream.read())
+
+
+def module_lines(module: nodes.Module):
+    """The source lines of a module node, read once for as long as the module is alive."""
+    if module not in _MODULE_LINES:
+        _MODULE_LINES[module] = _read_module_lines(module)
+    return _MODULE_LINES[module]
+
+
+def location_fingerprint(msgid: str, module: nodes.Module,  # pylint: disable=dont-use-primitives
+                         location: MessageLocation):
+    """The fingerprint of a message added at a location of a module."""
+    return fingerprint(msgid, qualified_name(module.name, location.frame_id),
+                       source_line(module_lines(module), location.line))
+
+
+def node_fingerprint(msgid: str, node: nodes.NodeNG):  # pylint: disable=dont-use-primitives
+    """The fingerprint of a message added on a node."""
+    return fingerprint(msgid, qualified_name(*get_module_and_frameid(node)),
+                       source_line(module_lines(node.root()), message_location(node).line))
+
+
+class Baseline:
+    """The fingerprints of the known violations."""
+
+    def __init__(self, fingerprints: Iterable[Fingerprint]):
+        self._fingerprints: FrozenSet[Fingerprint] = frozenset(fingerprints)
+
+    def __contains__(self, known: Fingerprint):
+        return known in self._fingerprints
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def write(self, stream: BinaryIO):
+        """Write the baseline file."""
+        fingerprints = array("Q", sorted(self._fingerprints))
+        stream.write(HEADER.pack(MAGIC, len(fingerprints)))
+        stream.write(little_endian(fingerprints).tobytes())
+
+
+def read_baseline(path: Path):
+    """Read a baseline file."""
+    try:
+        data = path.read_bytes()
+    except OSError as error:
+        raise BaselineError(f"Can't read the baseline {path}: {error}") from error
+    if len(data) < HEADER.size or data[:len(MAGIC)] != MAGIC:
+        raise BaselineError(f"{path} isn't a baseline file")
+    count = HEADER.unpack_from(data)[1]
+    fingerprints = array("Q")
+    if len(data) - HEADER.size != count * fingerprints.itemsize:
+        raise BaselineError(f"{path} is truncated")
+    fingerprints.frombytes(data[HEADER.size:])
+    return Baseline(little_endian(fingerprints))
+
+
+_BASELINES: Dict[Tuple[Path, int], Baseline] = {}
+
+
+def baseline_for(path: Path):
+    """
+    Return the baseline read from the file, shared by all the checkers. It is read
+    again once the file was modified, as by a daemon outliving it.
+    """
+    path = path.resolve()
+    try:
+        key = (path, path.stat().st_mtime_ns)
+    except OSError as error:
+        raise BaselineError(f"Can't read the baseline {path}: {error}") from error
+    if key not in _BASELINES:
+        _BASELINES[key] = read_baseline(path)
+    return _BASELINES[key]
+
+
+def configured_baseline(linter: "PyLinter"):
+    """The baseline of the ``calisthenics-baseline`` option, none when it is empty."""
+    path = getattr(linter.config, "calisthenics_baseline", "")  # pylint: disable=chain-of-method-calls
+    return baseline_for(Path(path)) if path else None
@@ -0,0 +1,207 @@
+"""Base class of the object calisthenics checkers"""
+import argparse
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Tuple
+
+from astroid import nodes
+from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.baseline import (Baseline, configured_baseline,
+                                                   location_fingerprint, node_fingerprint)
+from object_calisthenics.checkers.instrumentation import (Instrumentation, RecursiveHelper,
+                                                          instrumentation_for)
+from object_calisthenics.checkers.latency_report import LatencyRecorder, latency_recorder_for
+from object_calisthenics.checkers.message_location import message_location, resolve_frame
+from object_calisthenics.checkers.path_rules import (NO_SETTINGS, PathRules, PathSettings,
+                                                     configured_path_rules, path_rules_for)
+from object_calisthenics.checkers.result_cache import (CachedMessage, CachedMessages,
+                                                       CheckerSignature, EntryCount, ModuleResults,
+                                                       ResultCache, cache_key, module_content_hash,
+                                                       result_cache_for)
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+_MODULE_CALLBACKS = frozenset({"visit_module", "leave_module", "visit_default"})
+
+
+def is_walker_callback(name: str):  # pylint: disable=dont-use-primitives
+    """Return whether a checker member is called by the pylint AST walker."""
+    return name.startswith(("visit_", "leave_"))
+
+
+def is_node_callback(name: str):  # pylint: disable=dont-use-primitives
+    """Return whether a checker member is called by the walker for nodes inside modules."""
+    return is_walker_callback(name) and name not in _MODULE_CALLBACKS
+
+
+def configured_result_cache(config: argparse.Namespace):
+    """The result cache of the ``calisthenics-cache-dir`` option, none when it is empty."""
+    directory = getattr(config, "calisthenics_cache_dir", "")
+    if not directory:
+        return None
+    max_entries = getattr(config, "calisthenics_cache_max_entries", 100000)
+    return result_cache_for(Path(directory), EntryCount(max_entries))
+
+
+def unwrap_callbacks(checker: BaseChecker):
+    """Drop the wrappers of the walker callbacks, leaving the callbacks of the class."""
+    for name in [name for name in vars(checker) if is_walker_callback(name)]:
+        delattr(checker, name)
+
+
+def wrap_callbacks(checker: BaseChecker, names: Iterable[str],  # pylint: disable=dont-use-primitives
+                   wrap: Callable[[str, Callable], Callable]):
+    """Replace the callbacks of the checker with their wrappers."""
+    for name in list(names):
+        setattr(checker, name, wrap(name, getattr(checker, name)))
+
+
+class CalisthenicsChecker(BaseChecker):  # pylint: disable=too-many-instance-attributes
+    # pylint: disable=chain-of-method-calls
+    """
+    Base class of the object calisthenics checkers.
+    When the result cache is enabled, the messages of a module whose source and
+    checker options didn't change are replayed from the cache instead of visiting it.
+    When instrumentation is enabled, the walker callbacks and recursive helpers are
+    wrapped with counters, and with the latency report their time goes to the file of
+    their module, otherwise they are left untouched.
+    When a baseline is given, the messages it knows aren't added, though they are
+    still stored in the cache, which doesn't depend on the baseline.
+    Per-path rules give a module the options, read in ``_configure``, of its path.
+    """
+
+    def __init__(self, linter: "PyLinter"):
+        super().__init__(linter)
+        self._cache: Optional[ResultCache] = None
+        self._results: Optional[ModuleResults] = None
+        self._replaying: bool = False
+        self._instrumentation: Optional[Instrumentation] = None
+        self._latency: Optional[LatencyRecorder] = None
+        self._baseline: Optional[Baseline] = None
+        self._path_rules: PathRules = path_rules_for(())
+        self._settings: PathSettings = NO_SETTINGS
+
+    def _options(self):
+        """The linter options, with the ones of the path of the current module in place."""
+        return self._settings.config(self.linter.config)
+
+    def _signature(self):
+        config = self._options()
+        values = [getattr(config, option[0].replace("-", "_"), None) for option in self.options]
+        return CheckerSignature(f"{self.name}:{values!r}")
+
+    def _unless_replaying(self, callback: Callable[[nodes.NodeNG], None]):
+        @functools.wraps(callback)
+        def guarded(node: nodes.NodeNG):
+            return self._replaying or callback(node)
+        return guarded
+
+    def _recursive_helpers(self) -> Tuple[RecursiveHelper, ...]:
+        """The recursive helpers whose depth is recorded when instrumenting the checker."""
+        return ()
+
+    def _instrument(self, instrumentation: Instrumentation):
+        self._instrumentation = instrumentation
+        instrumentation.checker_opened(self._recursive_helpers())
+        wrap_callbacks(self, filter(is_walker_callback, dir(self)), lambda name, callback:
+                       instrumentation.instrument_callback(f"{self.name}.{name}", callback))
+
+    def _configure(self, config: argparse.Namespace):
+        """Read the options of the checker, the ones of the path of the current module."""
+
+    def _use_settings(self, settings: PathSettings):
+        """Check the next modules with the settings, reading their options if they changed."""
+        if settings is not self._settings:
+            self._settings = settings
+            self._configure(self._options())
+
+    def open(self):
+        """
+        Read the baseline, the per-path rules and the options of the checker, and wrap
+        the walker callbacks for the result cache, instrumentation and latency report.
+        The linter opens the checkers for every run, so the callbacks of the class are
+        wrapped again rather than the wrappers of the previous run.
+        """
+        super().open()
+        unwrap_callbacks(self)
+        self._baseline = configured_baseline(self.linter)
+        self._path_rules = configured_path_rules(self.linter)
+        self._settings = self._path_rules.root.settings
+        self._configure(self._options())
+        config = self.linter.config
+        self._cache = configured_result_cache(config)
+        if self._cache:
+            wrap_callbacks(self, filter(is_node_callback, dir(self)),
+                           lambda _, callback: self._unless_replaying(callback))
+        if getattr(config, "calisthenics_instrumentation_report", ""):
+            self._instrument(instrumentation_for(Path(config.calisthenics_instrumentation_report)))
+        if getattr(config, "calisthenics_latency_report", ""):
+            top = getattr(config, "calisthenics_latency_top", 10)
+            self._latency = latency_recorder_for(Path(config.calisthenics_latency_report),
+                                                 top).checker_opened()
+            wrap_callbacks(self, filter(is_walker_callback, dir(self)), self._latency.time_callback)
+
+    def close(self):
+        """Let the instrumentation and latency report know the run is over for this checker."""
+        super().close()
+        for report in filter(None, (self._instrumentation, self._latency)):
+            report.checker_closed()
+        self._instrumentation = self._latency = None
+
+    def _module_results(self, node: nodes.Module):
+        if self._cache is None:
+            return None
+        content_hash = module_content_hash(node)
+        if content_hash is None:
+            return None
+        return ModuleResults(self._cache, cache_key(content_hash, self._signature()))
+
+    def _unknown(self, module: nodes.Module, messages: CachedMessages):
+        """The cached messages of the module not disabled under its path nor in the baseline."""
+        return [message for message in messages if message.msgid not in self._settings.disabled
+                and (self._baseline is None or location_fingerprint(
+                    message.msgid, module, message.location) not in self._baseline)]
+
+    def _replay(self, module: nodes.Module, messages: CachedMessages):
+        for message in self._unknown(module, messages):
+            location = message.location
+            self.linter.add_message(message.msgid, node=resolve_frame(module, location),
+                                    args=message.args, line=location.line,
+                                    col_offset=location.col_offset,
+                                    end_lineno=location.end_lineno,
+                                    end_col_offset=location.end_col_offset)
+
+    def visit_module(self, node: nodes.Module):
+        """Use the settings of the module path, and replay its messages when they are cached."""
+        self._use_settings(self._path_rules.settings_of(node.file))
+        self._results = self._module_results(node)
+        cached = self._results and self._results.cached
+        self._replaying = cached is not None
+        if self._replaying:
+            self._replay(node, cached)
+
+    def leave_module(self, _: nodes.Module):
+        """Store the messages added while checking the module in the cache."""
+        if self._results:
+            self._results.store()
+        self._results = None
+        self._replaying = False
+
+    def add_message(  # pylint: disable=too-many-arguments,dont-use-primitives
+            self, msgid, line=None, node=None, args=None, confidence=None,
+            col_offset=None, end_lineno=None, end_col_offset=None):
+        """
+        Add a message, recording it in the cache entry of the current module, unless it
+        is disabled under the path of the module or the baseline knows it.
+        """
+        if self._results and node:
+            self._results.record(CachedMessage(msgid, message_location(node), args))
+        if msgid in self._settings.disabled:
+            return
+        if self._baseline is not None and node and \
+                node_fingerprint(msgid, node) in self._baseline:
+            return
+        super().add_message(msgid, line, node, args, confidence, col_offset, end_lineno,
+                            end_col_offset)
@@ -0,0 +1,119 @@
+"""
+Index of the metrics of every checked class, for project wide reports. The classes
+are measured by the checkers of classes, and the index written once they are done.
+"""
+import os
+import tempfile
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from astroid import nodes
+
+from object_calisthenics.checkers.annotation_classifier import (CollectionClassifier,
+                                                                collection_classifier_for)
+from object_calisthenics.checkers.calisthenics_checker import CalisthenicsChecker
+from object_calisthenics.checkers.class_index_format import ClassIndexTable
+from object_calisthenics.checkers.class_metrics import class_metrics
+from object_calisthenics.checkers.declarations import DEFAULT_COLLECTIONS
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+
+class ClassIndexBuilder:
+    # pylint: disable=chain-of-method-calls
+    """
+    Collects the metrics of the classes of every checked module, and writes the index
+    once the last checker feeding it is closed. A class is only measured once, however
+    many checkers feed the index.
+    """
+
+    def __init__(self, path: Path, collections: CollectionClassifier):
+        self._path: Path = path
+        self._collections: CollectionClassifier = collections
+        self._table: ClassIndexTable = ClassIndexTable()
+        self._added: weakref.WeakSet = weakref.WeakSet()
+        self._open_checkers: int = 0
+
+    def checker_opened(self):
+        """Count a checker feeding the index."""
+        self._open_checkers += 1
+
+    def add_class(self, node: nodes.ClassDef):
+        """Add a class, unless it was already added."""
+        if node in self._added:
+            return
+        self._added.add(node)
+        module = node.root()
+        self._table.add(class_metrics(module.file or module.name, node,
+                                      self._collections))
+
+    def add_module(self, module: nodes.Module):
+        """Add the classes of a module that weren't already added."""
+        for node in module.nodes_of_class(nodes.ClassDef):
+            self.add_class(node)
+
+    def checker_closed(self):
+        """Write the index once all the checkers feeding it are closed."""
+        self._open_checkers -= 1
+        if not self._open_checkers:
+            self._finish()
+
+    def _finish(self):
+        _BUILDERS.pop(self._path, None)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=self._path.parent, delete=False) as index:
+            self._table.write(index)
+        os.replace(index.name, self._path)
+
+
+_BUILDERS: Dict[Path, ClassIndexBuilder] = {}
+
+
+def class_index_for(path: Path, collections: CollectionClassifier):
+    """Return the builder of the index at the path, shared by all the checkers."""
+    if path not in _BUILDERS:
+        _BUILDERS[path] = ClassIndexBuilder(path, collections)
+    return _BUILDERS[path]
+
+
+class IndexedClassChecker(CalisthenicsChecker):
+    # pylint: disable=chain-of-method-calls
+    """
+    Base class of the checkers of classes. When the class index is enabled, the
+    classes they check are added to it as they are visited, and all the classes of
+    the modules whose messages are replayed from the result cache.
+    """
+
+    def __init__(self, linter: "PyLinter"):
+        super().__init__(linter)
+        self._class_index: Optional[ClassIndexBuilder] = None
+
+    def open(self):
+        """Start feeding the class index when it is enabled."""
+        super().open()
+        config = self.linter.config
+        path = getattr(config, "calisthenics_class_index", "")
+        if path:
+            self._class_index = class_index_for(Path(path), collection_classifier_for(
+                getattr(config, "collection_types", DEFAULT_COLLECTIONS)))
+            self._class_index.checker_opened()
+
+    def visit_module(self, node: nodes.Module):
+        """Add the classes of the module to the class index when it isn't visited."""
+        super().visit_module(node)
+        if self._replaying and self._class_index:
+            self._class_index.add_module(node)
+
+    def visit_classdef(self, node: nodes.ClassDef):
+        """Add the class to the class index."""
+        if self._class_index:
+            self._class_index.add_class(node)
+
+    def close(self):
+        """Let the class index know this checker is done with the run."""
+        super().close()
+        if self._class_index:
+            self._class_index.checker_closed()
+        self._class_index = None
@@ -0,0 +1,85 @@
+"""
+Columnar file format of the class index, the metrics of every checked class.
+
+The index file is made of little-endian unsigned 32 bits integers, so every column
+can be memory mapped and queried without parsing:
+
+- ``HEADER``: ``MAGIC``, then the amount of rows and of strings.
+- One column of a value per row for every ``ClassMetrics`` field, in order. The path
+  and qualname columns hold indexes in the string table.
+- The string table: the offsets of the strings in the blob, one more than the amount
+  of strings, followed by the blob of the utf-8 encoded strings.
+
+The index is read back by ``class_index_reader.ClassIndex``.
+"""
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, Tuple
+
+from object_calisthenics.checkers.class_metrics import ClassMetrics
+
+MAGIC = b"OCIDX\x01\x00\x00"
+HEADER = struct.Struct("<8sII")
+COLUMNS = ClassMetrics._fields
+STRING_COLUMNS = ("path", "qualname")
+
+
+def little_endian(column: array):
+    """The column itself on little-endian hosts, a byte swapped copy of it otherwise."""
+    if sys.byteorder == "little":
+        return column
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped
+
+
+class InternedStrings:
+    # pylint: disable=chain-of-method-calls
+    """The strings of the index, each one stored once."""
+
+    def __init__(self):
+        self._indexes: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def intern(self, text: str):  # pylint: disable=dont-use-primitives
+        """Return the index of a string, adding it on first use."""
+        return self._indexes.setdefault(text, len(self._indexes))
+
+    def encoded(self):
+        """The offsets of the strings, in the order of their indexes, and their blob."""
+        blob = bytearray()
+        offsets = array("I", [0])
+        for text in self._indexes:
+            blob += text.encode("utf-8")
+            offsets.append(len(blob))
+        return offsets, bytes(blob)
+
+
+class ClassIndexTable:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """The columns of the index, one compact array of integers per metric."""
+
+    def __init__(self):
+        self._columns: Tuple[array, ...] = tuple(array("I") for _ in COLUMNS)
+        self._strings: InternedStrings = InternedStrings()
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def add(self, metrics: ClassMetrics):
+        """Add the row of a class."""
+        row = (self._strings.intern(metrics.path), self._strings.intern(metrics.qualname),
+               *metrics[len(STRING_COLUMNS):])
+        for column, value in zip(self._columns, row):
+            column.append(value)
+
+    def write(self, stream: BinaryIO):
+        """Write the index file."""
+        offsets, blob = self._strings.encoded()
+        stream.write(HEADER.pack(MAGIC, len(self), len(self._strings)))
+        for column in self._columns + (offsets,):
+            stream.write(little_endian(column).tobytes())
+        stream.write(blob)
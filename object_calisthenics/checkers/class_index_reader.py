@@ -0,0 +1,170 @@
+"""
+Queries of a class index written by the checkers, memory mapped rather than loaded.
+
+Run with ``python -m object_calisthenics.checkers.class_index_reader <index>`` to print
+the totals of the index, its largest classes and the ones mixing collections with
+other instance variables.
+"""
+import argparse
+import contextlib
+import heapq
+import mmap
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+from object_calisthenics.checkers.class_index_format import (COLUMNS, HEADER, MAGIC,
+                                                             STRING_COLUMNS)
+from object_calisthenics.checkers.class_metrics import ClassMetrics
+
+Column = Union[memoryview, array]
+Arguments = Optional[Sequence[str]]
+
+
+class RowCount(int):
+    """An amount of rows of the index"""
+
+
+class IndexFormatError(ValueError):
+    """The file isn't a class index."""
+
+
+class IndexTotals(NamedTuple):
+    """The sums of the metrics of all the classes, to follow them from run to run."""
+    classes: int
+    lines: int
+    instance_attrs: int
+    collections: int
+    untyped: int
+    mixing_collections: int
+
+
+def _uint32_column(buffer: memoryview):
+    """Read a column in place on little-endian hosts, copy and swap it otherwise."""
+    if sys.byteorder == "little":
+        return buffer.cast("I")
+    column = array("I", buffer.tobytes())
+    column.byteswap()
+    return column
+
+
+def _release(column: Column):
+    if isinstance(column, memoryview):
+        column.release()
+
+
+class IndexColumns:
+    # pylint: disable=chain-of-method-calls
+    """The columns of an index, by the name of their metric."""
+
+    def __init__(self, buffer: memoryview, rows: RowCount):
+        self._columns: Dict[str, Column] = {
+            name: _uint32_column(buffer[index * rows * 4:(index + 1) * rows * 4])
+            for index, name in enumerate(COLUMNS)}
+
+    def __getitem__(self, name: str) -> Column:  # pylint: disable=dont-use-primitives
+        return self._columns[name]
+
+    def release(self):
+        """Release the views on the mapped file."""
+        for column in self._columns.values():
+            _release(column)
+
+
+class ClassIndex:
+    # pylint: disable=chain-of-method-calls
+    """
+    A class index over a buffer, usually a memory mapped file. The columns are read
+    in place, so querying a metric over millions of classes only touches its column.
+    """
+
+    def __init__(self, buffer: memoryview):
+        magic, rows, strings = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise IndexFormatError("The file isn't a class index")
+        self._rows: RowCount = RowCount(rows)
+        table_start = HEADER.size + len(COLUMNS) * rows * 4
+        self.columns: IndexColumns = IndexColumns(buffer[HEADER.size:table_start], self._rows)
+        self._offsets: Column = _uint32_column(buffer[table_start:table_start + (strings + 1) * 4])
+        self._blob: memoryview = buffer[table_start + (strings + 1) * 4:]
+
+    def __len__(self):
+        return int(self._rows)
+
+    def string(self, index: int):  # pylint: disable=dont-use-primitives
+        """Decode a string of the string table."""
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def row(self, index: int):  # pylint: disable=dont-use-primitives
+        """The metrics of the class of a row."""
+        values = [self.columns[name][index] for name in COLUMNS]
+        strings = [self.string(value) for value in values[:len(STRING_COLUMNS)]]
+        return ClassMetrics(*strings, *values[len(STRING_COLUMNS):])
+
+    def largest(self, count: RowCount):
+        """The classes spanning the most lines, largest first."""
+        spans = self.columns["line_span"]
+        return [self.row(index) for index in heapq.nlargest(count, range(self._rows),
+                                                            key=spans.__getitem__)]
+
+    def _mixing_rows(self):
+        attrs, collections = self.columns["instance_attrs"], self.columns["collections"]
+        return (index for index in range(self._rows) if collections[index] and attrs[index] > 1)
+
+    def mixing_collections(self) -> Iterator[ClassMetrics]:
+        """The classes with a collection and other instance variables."""
+        return (self.row(index) for index in self._mixing_rows())
+
+    def totals(self):
+        """Sum the metrics of all the classes."""
+        return IndexTotals(self._rows, sum(self.columns["line_span"]),
+                           sum(self.columns["instance_attrs"]), sum(self.columns["collections"]),
+                           sum(self.columns["untyped"]), sum(1 for _ in self._mixing_rows()))
+
+    def release(self):
+        """Release the views on the buffer, so the file it maps can be closed."""
+        self.columns.release()
+        _release(self._offsets)
+        _release(self._blob)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object):
+        self.release()
+
+
+@contextlib.contextmanager
+def open_class_index(path: Path) -> Iterator[ClassIndex]:
+    """Memory map an index file and query it while the context lasts."""
+    with path.open("rb") as index_file, \
+            mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+            memoryview(mapped) as buffer, ClassIndex(buffer) as index:
+        yield index
+
+
+def _print_classes(title: str, classes: List[ClassMetrics]):  # pylint: disable=dont-use-primitives
+    print(title)
+    for metrics in classes:
+        print(f"  {metrics.path}:{metrics.lineno} {metrics.qualname} lines={metrics.line_span} "
+              f"attrs={metrics.instance_attrs} collections={metrics.collections} "
+              f"untyped={metrics.untyped}")
+
+
+def main(argv: Arguments = None):
+    """Print the totals, largest classes and collection mixing classes of an index."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("index", type=Path, help="Class index file")
+    parser.add_argument("--top", type=int, default=10, help="Amount of largest classes")
+    args = parser.parse_args(argv)
+    with open_class_index(args.index) as index:
+        print(index.totals())
+        _print_classes("Largest classes:", index.largest(RowCount(args.top)))
+        _print_classes("Classes mixing collections:", list(index.mixing_collections()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
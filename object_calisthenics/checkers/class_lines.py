@@ -0,0 +1,206 @@
+"""
+Counting of the lines of classes from their line positions.
+
+A class spans the lines from its ``class`` keyword to its last statement. The lines
+of docstrings, comments and blank lines can be left out: they are found in a single
+pass over the tokens of the module, and kept as a running count so the excluded lines
+of any class are known in constant time. The lines of a nested class only count for
+the nested class, not for the classes it is defined in.
+"""
+import io
+import itertools
+import tokenize
+from array import array
+from typing import Callable, FrozenSet, Iterable, List, Optional
+
+from astroid import nodes
+
+DOCSTRINGS = "docstrings"
+COMMENTS = "comments"
+BLANK = "blank"
+LINE_KINDS = (DOCSTRINGS, COMMENTS, BLANK)
+
+LineKinds = FrozenSet[str]
+Readline = Callable[[], bytes]
+
+_LAYOUT_TOKENS = frozenset({tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT, tokenize.INDENT,
+                            tokenize.DEDENT, tokenize.ENDMARKER, tokenize.ENCODING})
+_BLOCK_KEYWORDS = frozenset({"class", "def", "async"})
+
+
+class LineNumber(int):
+    """A line number, starting at 1"""
+
+
+class LineFlags(bytearray):
+    """A flag by line number, set for the lines of a kind."""
+
+    def mark(self, first: LineNumber, last: LineNumber):
+        """Set the flags of the lines from the first to the last, both included."""
+        if len(self) <= last:
+            self.extend(bytes(last + 1 - len(self)))
+        self[first:last + 1] = b"\x01" * (last + 1 - first)
+
+    def is_set(self, line: LineNumber):
+        """Whether the flag of the line is set."""
+        return line < len(self) and bool(self[line])
+
+
+class Statement:
+    # pylint: disable=chain-of-method-calls
+    """The tokens of a logical line, without its layout tokens."""
+
+    def __init__(self):
+        self._tokens: List[tokenize.TokenInfo] = []
+
+    def add(self, token: tokenize.TokenInfo):
+        """Add a token of the statement."""
+        self._tokens.append(token)
+
+    def is_docstring(self):
+        """Whether the statement is only made of strings."""
+        return all(token.type == tokenize.STRING for token in self._tokens)
+
+    def starts_block(self):
+        """Whether the statement is the header of a class or function."""
+        return bool(self._tokens) and self._tokens[0].string in _BLOCK_KEYWORDS
+
+    def lines(self):
+        """The first and last line of the statement."""
+        return LineNumber(self._tokens[0].start[0]), LineNumber(self._tokens[-1].end[0])
+
+
+class ModuleLines:
+    # pylint: disable=chain-of-method-calls
+    """
+    The kind of every line of a module, found from its tokens. A docstring is a
+    statement made of strings only, first in a module or in the body of a class or
+    function.
+    """
+
+    def __init__(self):
+        self.code: LineFlags = LineFlags()
+        self.comments: LineFlags = LineFlags()
+        self.docstrings: LineFlags = LineFlags()
+        self._statement: Statement = Statement()
+        self._expects_docstring: bool = True
+
+    def add_token(self, token: tokenize.TokenInfo):
+        """Mark the lines a token is on."""
+        if token.type == tokenize.COMMENT:
+            self.comments.mark(LineNumber(token.start[0]), LineNumber(token.start[0]))
+        if token.type not in _LAYOUT_TOKENS:
+            self.code.mark(LineNumber(token.start[0]), LineNumber(token.end[0]))
+            self._statement.add(token)
+        if token.type == tokenize.NEWLINE:
+            self._end_statement()
+
+    def _end_statement(self):
+        if self._expects_docstring and self._statement.is_docstring():
+            self.docstrings.mark(*self._statement.lines())
+        self._expects_docstring = self._statement.starts_block()
+        self._statement = Statement()
+
+    def is_excluded(self, line: LineNumber, kinds: LineKinds):
+        """Whether the line is of one of the excluded kinds."""
+        is_code = self.code.is_set(line)
+        is_comment = not is_code and self.comments.is_set(line)
+        excluded = {DOCSTRINGS: self.docstrings.is_set(line), COMMENTS: is_comment,
+                    BLANK: not is_code and not is_comment}
+        return any(excluded[kind] for kind in kinds)
+
+
+def module_lines(tokens: Iterable[tokenize.TokenInfo]):
+    """Find the kind of the lines of the tokens."""
+    lines = ModuleLines()
+    for token in tokens:
+        lines.add_token(token)
+    return lines
+
+
+class ExcludedLines:
+    """The running count of the excluded lines of a module, by line."""
+
+    def __init__(self, counts: Optional[array] = None):
+        self._counts: array = counts if counts is not None else array("I")
+
+    def between(self, first: LineNumber, last: LineNumber):
+        """The amount of excluded lines from the first to the last line, both included."""
+        if not self._counts:
+            return 0
+        last_count = self._counts[min(last, len(self._counts) - 1)]
+        return last_count - self._counts[min(first - 1, len(self._counts) - 1)]
+
+    def __bool__(self):
+        return bool(self._counts)
+
+
+def excluded_lines(tokens: Iterable[tokenize.TokenInfo], kinds: LineKinds):
+    """Count the lines of the excluded kinds, the tokens being read once."""
+    lines = module_lines(tokens)
+    flags = (lines.is_excluded(LineNumber(line), kinds) for line in range(1, len(lines.code)))
+    return ExcludedLines(array("I", itertools.accumulate(flags, initial=0)))
+
+
+def _safe_excluded_lines(readline: Readline, kinds: LineKinds):
+    try:
+        return excluded_lines(tokenize.tokenize(readline), kinds)
+    except (tokenize.TokenError, SyntaxError):
+        return ExcludedLines()
+
+
+def module_excluded_lines(module: nodes.Module, kinds: LineKinds):
+    """The excluded lines of an astroid module, none when nothing is excluded."""
+    if not kinds or (module.file_bytes is None and module.file is None):
+        return ExcludedLines()
+    with module.stream() as stream:
+        return _safe_excluded_lines(stream.readline, kinds)
+
+
+def source_excluded_lines(source: str, kinds: LineKinds):  # pylint: disable=dont-use-primitives
+    """The excluded lines of a source, none when nothing is excluded."""
+    if not kinds:
+        return ExcludedLines()
+    return _safe_excluded_lines(io.BytesIO(source.encode("utf-8")).readline, kinds)
+
+
+class NestedClassLines:
+    # pylint: disable=chain-of-method-calls
+    """The lines of the nested classes of the classes being checked."""
+
+    def __init__(self):
+        self._open: List[int] = []
+
+    def enter(self):
+        """Start a class, without nested classes yet."""
+        self._open.append(0)
+
+    def leave(self, total: int):  # pylint: disable=dont-use-primitives
+        """
+        Leave a class counting the total of lines, returning its own lines: the total
+        minus the lines of its nested classes, which now count for the enclosing class.
+        """
+        nested = self._open.pop() if self._open else 0
+        if self._open:
+            self._open[-1] += total
+        return total - nested
+
+
+class ClassSizes:
+    # pylint: disable=chain-of-method-calls
+    """
+    Counts the lines of the classes of a module as they are left, the classes being
+    entered and left in the order of a walk of the module.
+    """
+
+    def __init__(self, excluded: Optional[ExcludedLines] = None):
+        self._excluded: ExcludedLines = excluded or ExcludedLines()
+        self._nested: NestedClassLines = NestedClassLines()
+
+    def enter(self):
+        """Enter a class."""
+        self._nested.enter()
+
+    def leave(self, first: LineNumber, last: LineNumber):
+        """Leave the class spanning from the first to the last line, returning its size."""
+        return self._nested.leave(last - first + 1 - self._excluded.between(first, last))
@@ -0,0 +1,62 @@
+"""Size and instance variable metrics of a class"""
+from typing import Callable, Iterable, NamedTuple, Optional, TypeVar
+
+from astroid import nodes
+
+from object_calisthenics.checkers.annotation_classifier import CollectionClassifier
+from object_calisthenics.checkers.module_aliases import module_aliases
+
+Annotation = TypeVar("Annotation")
+
+
+def annotation_of(instance_variable: nodes.AssignAttr):
+    """The annotation of the first assignment of an instance variable, if it has one."""
+    parent = instance_variable.parent
+    return parent.annotation if isinstance(parent, nodes.AnnAssign) else None
+
+
+class AttributeCounts(NamedTuple):
+    """How many instance variables a class has, are collections and aren't annotated."""
+    attrs: int
+    collections: int
+    untyped: int
+
+
+def attribute_counts(annotations: Iterable[Optional[Annotation]],  # pylint: disable=dont-use-primitives
+                     is_collection: Callable[[Annotation], bool]):
+    """Count the instance variables of their annotations in a single pass."""
+    attrs = collections = untyped = 0
+    for annotation in annotations:
+        attrs += 1
+        untyped += annotation is None
+        collections += annotation is not None and is_collection(annotation)
+    return AttributeCounts(attrs, collections, untyped)
+
+
+def class_attribute_counts(node: nodes.ClassDef, classifier: CollectionClassifier):
+    """Count the instance variables of a class, resolving the aliases of its module."""
+    # pylint: disable=chain-of-method-calls
+    aliases = module_aliases(node.root())
+    return attribute_counts(
+        (annotation_of(assignments[0]) for assignments in node.instance_attrs.values()),
+        lambda annotation: classifier.is_collection(annotation, aliases))
+
+
+class ClassMetrics(NamedTuple):
+    """The metrics of a class, as stored in a row of the class index."""
+    path: str
+    qualname: str
+    lineno: int
+    line_span: int
+    instance_attrs: int
+    collections: int
+    untyped: int
+
+
+def class_metrics(path: str, node: nodes.ClassDef,  # pylint: disable=dont-use-primitives
+                  classifier: CollectionClassifier):
+    """Measure a class of the module at the path."""
+    # pylint: disable=chain-of-method-calls
+    counts = class_attribute_counts(node, classifier)
+    return ClassMetrics(path, node.qname(), node.fromlineno,
+                        node.end_lineno - node.fromlineno + 1, *counts)
@@ -0,0 +1,251 @@
+"""
+Names, messages and options of the checkers, known to pylint without importing the
+checker modules, which are only loaded once one of their messages is enabled, and the
+output formats of the reporters, whose modules are only loaded once they are chosen.
+"""
+import importlib
+from typing import Dict, NamedTuple, Tuple
+
+MessageDefinition = Tuple[str, str, str]
+Options = Tuple[Tuple[str, Dict[str, object]], ...]
+
+DEFAULT_PRIMITIVES = ("str", "int", "float", "bool", "bytes", "bytearray")
+DEFAULT_ALIASES = ("Text:str",)
+DEFAULT_COLLECTIONS = (
+    "List", "Dict", "Set", "FrozenSet", "Tuple", "Deque", "DefaultDict", "OrderedDict",
+    "Counter", "ChainMap", "Sequence", "MutableSequence", "Mapping", "MutableMapping",
+    "AbstractSet", "MutableSet", "Collection", "Iterable",
+    "list", "dict", "set", "frozenset", "tuple",
+    "collections.deque", "collections.defaultdict", "collections.OrderedDict",
+    "collections.Counter", "collections.ChainMap",
+    "collections.abc.Sequence", "collections.abc.MutableSequence", "collections.abc.Mapping",
+    "collections.abc.MutableMapping", "collections.abc.Set", "collections.abc.MutableSet",
+    "collections.abc.Collection", "collections.abc.Iterable",
+)
+VIOLATION_MODES = ("first", "all")
+
+
+class CheckerDeclaration(NamedTuple):
+    """What pylint must know of a checker before it is built."""
+    name: str
+    module: str
+    class_name: str
+    msgs: Dict[str, MessageDefinition]
+    options: Options = ()
+
+
+ONE_LEVEL_OF_INDENTATION = CheckerDeclaration(
+    "one-level-indentation",
+    "object_calisthenics.checkers.one_level_of_indentation",
+    "OneLevelOfIndentation",
+    msgs={
+        "W9001": (
+            "A function has more than one level of indentation. Depth reached: %s, "
+            "max allowed: %s",
+            "too-much-indentation",
+            "A function should contain at most a single indentation."
+        )
+    },
+    options=(
+        (
+            "indentation-violations", {
+                "default": "first",
+                "type": "choice",
+                "choices": VIOLATION_MODES,
+                "metavar": "<first or all>",
+                "help": "Report a function with too much indentation once, on its "
+                        "first statement nested too deep, or report every outermost "
+                        "statement nested too deep in it.",
+            },
+        ),
+        (
+            "max-indentation-levels", {
+                "default": 1,
+                "type": "int",
+                "metavar": "<int>",
+                "help": "Max indentation levels allowed in a function body.",
+            },
+        ),
+    ),
+)
+
+ELSE_KEYWORD_PRESENT = CheckerDeclaration(
+    "else-keyword-present",
+    "object_calisthenics.checkers.else_keyword_present",
+    "ElseKeywordPresent",
+    msgs={
+        "W9002": (
+            "A function contains an else keyword",
+            "dont-use-else",
+            "A function shouldn't use an else keyword"
+        )
+    },
+    options=(
+        (
+            "else-violations", {
+                "default": "first",
+                "type": "choice",
+                "choices": VIOLATION_MODES,
+                "metavar": "<first or all>",
+                "help": "Report a function using else once, on its first else branch, "
+                        "or report every else branch in it.",
+            },
+        ),
+    ),
+)
+
+PRIMITIVE_OBSESSION = CheckerDeclaration(
+    "primitive-obsession",
+    "object_calisthenics.checkers.primitive_obsession",
+    "PrimitiveObsession",
+    msgs={
+        "W9003": (
+            "A function argument can't be of a primitive type.",
+            "dont-use-primitives",
+            "A function argument should be of a custom type."
+        )
+    },
+    options=(
+        (
+            "primitive-types", {
+                "default": DEFAULT_PRIMITIVES,
+                "type": "csv",
+                "metavar": "<type names>",
+                "help": "Types that function arguments can't be annotated with, alone or "
+                        "as part of a generic, union or tuple annotation.",
+            },
+        ),
+        (
+            "primitive-aliases", {
+                "default": DEFAULT_ALIASES,
+                "type": "csv",
+                "metavar": "<alias:type>",
+                "help": "Type names standing for another type name, like Text:str.",
+            },
+        ),
+    ),
+)
+
+FIRST_CLASS_COLLECTIONS = CheckerDeclaration(
+    "first-class-collections",
+    "object_calisthenics.checkers.first_class_collections",
+    "FirstClassCollections",
+    msgs={
+        "W9004": (
+            "A class contains more than a single instance variable when a collection is present",
+            "single-collection-instance-variable",
+            "A class shouldn't have more than a single instance variable when there is a "
+            "collection instance variable."
+        ),
+        "W9005": (
+            "A class contains un typed instance variables",
+            "untyped-instance-variables",
+            "A class should have type hinted all its instance variables"
+        )
+    },
+    options=(
+        (
+            "collection-types", {
+                "default": DEFAULT_COLLECTIONS,
+                "type": "csv",
+                "metavar": "<type names>",
+                "help": "Types that make an instance variable a collection, subscripted "
+                        "or not, written as the name the typing module or the builtins "
+                        "give them, or qualified by their module, like collections.deque.",
+            },
+        ),
+    ),
+)
+
+ONE_DOT_PER_LINE = CheckerDeclaration(
+    "one-dot-per-line",
+    "object_calisthenics.checkers.one_dot_per_line",
+    "OneDotPerLine",
+    msgs={
+        "W9006": (
+            "A statement has a chain of method calls. Chain length: %s, max allowed: %s",
+            "chain-of-method-calls",
+            "A statement should at most have a single method call."
+        )
+    },
+    options=(
+        (
+            "max-chain-length", {
+                "default": 1,
+                "type": "int",
+                "metavar": "<int>",
+                "help": "Max dots allowed in a chain of attributes.",
+            },
+        ),
+        (
+            "chain-allowed-receivers", {
+                "default": (),
+                "type": "csv",
+                "metavar": "<names>",
+                "help": "Receivers whose dots, the ones inside them and the one after "
+                        "them, aren't counted in the chains taken on them, like self or a "
+                        "module alias such as os.path.",
+            },
+        ),
+    ),
+)
+
+SMALL_CLASS_SIZE = CheckerDeclaration(
+    "small-class-size",
+    "object_calisthenics.checkers.small_class_size",
+    "SmallClassSize",
+    msgs={
+        "W9007": (
+            "A class exceeds the amount of allowed lines. Current lines: %s, max allowed: %s",
+            "class-too-large",
+            "The class has too many lines."
+        )
+    },
+    options=(
+        (
+            "max-class-lines", {
+                "default": 150,
+                "type": "int",
+                "help": "Max allowed lines in class",
+            },
+        ),
+        (
+            "class-lines-exclude", {
+                "default": (),
+                "type": "csv",
+                "metavar": "<docstrings,comments,blank>",
+                "help": "Kinds of lines that don't count in the size of a class, among "
+                        "docstrings, comments and blank. Other values are ignored.",
+            },
+        ),
+    ),
+)
+
+
+DECLARATIONS = (ONE_LEVEL_OF_INDENTATION, ELSE_KEYWORD_PRESENT, PRIMITIVE_OBSESSION,
+                FIRST_CLASS_COLLECTIONS, ONE_DOT_PER_LINE, SMALL_CLASS_SIZE)
+
+
+class ReporterDeclaration(NamedTuple):
+    """
+    What pylint must know of a reporter before it is imported, standing for its class:
+    pylint calls it to build the reporter of the output format it was chosen with.
+    """
+    name: str
+    module: str
+    class_name: str
+
+    def __call__(self):
+        """Import the reporter class and build the reporter."""
+        module = importlib.import_module(self.module)
+        return getattr(module, self.class_name)()
+
+
+REPORTERS = (
+    ReporterDeclaration("ndjson", "object_calisthenics.reporters.streaming_reporters",
+                        "NdjsonReporter"),
+    ReporterDeclaration("calisthenics-binary", "object_calisthenics.reporters.streaming_reporters",
+                        "BinaryReporter"),
+    ReporterDeclaration("calisthenics-baseline",
+                        "object_calisthenics.reporters.baseline_reporter", "BaselineReporter"),
+)
@@ -1,53 +1,43 @@
 """Else Keyword Present checker"""
+import argparse
 from typing import TYPE_CHECKING, Optional
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.calisthenics_checker import CalisthenicsChecker
+from object_calisthenics.checkers.declarations import ELSE_KEYWORD_PRESENT
+from object_calisthenics.checkers.function_body_walker import (ELSE_BRANCHES, ModuleWalker,
+                                                               function_violations)
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
 
 
-class ElseKeywordPresent(BaseChecker):
-    """A class for checking that functions don't use the else keyword."""
+class ElseKeywordPresent(CalisthenicsChecker):
+    # pylint: disable=chain-of-method-calls
+    """
+    A class for checking that functions don't use the else keyword.
+    The message is added on the first statement of the else branch. By default a
+    function gets a message for its first else branch, the function being walked up
+    to it, with ``else-violations=all`` for every one, found by the module walk.
+    """
 
-    name = "else-keyword-present"
-    msgs = {
-        "W9002": (
-            "A function contains an else keyword",
-            "dont-use-else",
-            "A function shouldn't use an else keyword"
-        )
-    }
+    name = ELSE_KEYWORD_PRESENT.name
+    msgs = ELSE_KEYWORD_PRESENT.msgs
+    options = ELSE_KEYWORD_PRESENT.options
 
     def __init__(self, linter: Optional["PyLinter"] = None):
         super().__init__(linter)
+        self._every: bool = False
+
+    def _configure(self, config: argparse.Namespace):
+        """Read whether every violation of a function is reported."""
+        self._every = config.else_violations == "all"
 
-    @staticmethod
-    def _contains_else(node: nodes.If):
-        if hasattr(node, "orelse") and node.orelse:
-            return True
-        return False
-
-    def _iterate_statements(self, node: nodes.NodeNG):
-        result = False
-        for statement in node:
-            is_else_found = self._check_indentation(statement)
-            result = result | is_else_found
-        return result
-
-    def _check_indentation(self, current_node: nodes.NodeNG):
-        is_else_found = False
-        if isinstance(current_node, nodes.If):
-            is_else_found = self._contains_else(current_node)
-        if isinstance(current_node, list):
-            is_else_found = self._iterate_statements(current_node)
-        if hasattr(current_node, "body") and not is_else_found:
-            is_else_found = self._check_indentation(current_node.body)
-        return is_else_found
+    def _recursive_helpers(self):
+        return ((ModuleWalker, "_opened_blocks"),)
 
     def visit_functiondef(self, node: nodes.FunctionDef):
         """Check if an else keyword is present in the function"""
-        is_else_found = self._check_indentation(node.body)
-        if is_else_found:
-            self.add_message("W9002", node=node)
+        for branch in function_violations(node, ELSE_BRANCHES, self._every):
+            self.add_message("W9002", node=branch)
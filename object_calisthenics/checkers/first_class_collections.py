@@ -1,65 +1,46 @@
 """First Class Collections checker"""
+import argparse
 from typing import TYPE_CHECKING, Optional
 
 from astroid import nodes
-from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.annotation_classifier import (CollectionClassifier,
+                                                                collection_classifier_for)
+from object_calisthenics.checkers.class_index import IndexedClassChecker
+from object_calisthenics.checkers.class_metrics import class_attribute_counts
+from object_calisthenics.checkers.declarations import (DEFAULT_COLLECTIONS,
+                                                       FIRST_CLASS_COLLECTIONS)
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
 
 
-class FirstClassCollections(BaseChecker):
+class FirstClassCollections(IndexedClassChecker):
     # pylint: disable=chain-of-method-calls
     """
     A class for checking that a class will contain only a single
     instance variable if it is of a collection type
     """
 
-    name = "first-class-collections"
-    msgs = {
-        "W9004": (
-            "A class contains more than a single instance variable when a collection is present",
-            "single-collection-instance-variable",
-            "A class shouldn't have more than a single instance variable when there is a "
-            "collection instance variable."
-        ),
-        "W9005": (
-            "A class contains un typed instance variables",
-            "untyped-instance-variables",
-            "A class should have type hinted all its instance variables"
-        )
-    }
-
-    collection_types = {'List', 'Dict', 'Set'}
+    name = FIRST_CLASS_COLLECTIONS.name
+    msgs = FIRST_CLASS_COLLECTIONS.msgs
+    options = FIRST_CLASS_COLLECTIONS.options
 
     def __init__(self, linter: Optional["PyLinter"] = None):
         super().__init__(linter)
+        self._collections: CollectionClassifier = collection_classifier_for(DEFAULT_COLLECTIONS)
 
-    def _is_annotated(self, instance_variable: nodes.AssignAttr):
-        parent = instance_variable.parent
-        if not isinstance(parent, nodes.AnnAssign):
-            return False
-        return True
-
-    def _is_collection(self, instance_variable: nodes.AssignAttr):
-        parent = instance_variable.parent
-        if isinstance(parent, nodes.AnnAssign) and \
-                isinstance(parent.annotation, nodes.Subscript):
-            return parent.annotation.value.name in self.collection_types
-        return False
+    def _configure(self, config: argparse.Namespace):
+        """Use the classifier of the configured collection types."""
+        self._collections = collection_classifier_for(config.collection_types)
 
     def leave_classdef(self, node: nodes.ClassDef):
         """
         Verify that there is only a single instance variable that is a collection.
         Or only typed instance variables that are not collections.
         """
-        untyped_variable = any(not self._is_annotated(instance_variable[0])
-                                for instance_variable
-                                in node.instance_attrs.values())
-        found_collection = any(self._is_collection(instance_variable[0])
-                               for instance_variable
-                               in node.instance_attrs.values())
-        if untyped_variable:
+        counts = class_attribute_counts(node, self._collections)
+        if counts.untyped:
             self.add_message("W9005", node=node)
-        if found_collection and len(node.instance_attrs) > 1:
+        if counts.collections and counts.attrs > 1:
             self.add_message("W9004", node=node)
@@ -0,0 +1,403 @@
+"""Shared single-pass walker collecting per-function body facts"""
+import operator
+import weakref
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from astroid import nodes
+
+
+class NestedBlock(NamedTuple):
+    """A statement opening a block deeper than allowed, and the depth reached in it."""
+    statement: nodes.NodeNG
+    depth: int
+
+
+class FunctionFacts(NamedTuple):
+    """
+    Facts about a single function body, gathered by the module walk. The locations of
+    the violations are only collected by the locating walk, the plain walk leaves them
+    empty.
+    """
+    max_indentation: int
+    contains_else: bool
+    nested_blocks: Tuple[NestedBlock, ...] = ()
+    else_branches: Tuple[nodes.NodeNG, ...] = ()
+
+
+# The indentation levels a function body may have by default, the statements opening
+# a block deeper than that are the nested blocks the locating walk collects.
+MAX_INDENTATION_LEVELS = 1
+
+
+# Statement lists that are not reached through ``body``. They are walked so that
+# functions nested in them get their facts, but they don't add to the enclosing
+# indentation or else facts.
+_SIDE_BLOCKS = ("orelse", "handlers", "finalbody", "cases")
+
+
+class StatementShape(NamedTuple):
+    """What the walk needs to know of a type of statement, found once for the type."""
+    has_body: bool
+    side_blocks: Tuple[str, ...]
+    is_function: bool
+    is_if: bool
+
+
+class OpenBlock:
+    """
+    A block of statements the walk is going through, with the facts of the statements
+    of it walked so far. The body of a statement merges its facts into the body it is
+    part of once it is walked, a side block is only walked for its functions.
+    """
+
+    __slots__ = ("statement", "statements", "enclosing", "shape", "height", "contains_else")
+
+    def __init__(self, statement: Optional[nodes.NodeNG], statements: List[nodes.NodeNG],
+                 enclosing: Optional["OpenBlock"] = None,
+                 shape: Optional[StatementShape] = None):
+        self.statement: Optional[nodes.NodeNG] = statement
+        self.statements: Iterator[nodes.NodeNG] = iter(statements)
+        self.enclosing: Optional[OpenBlock] = enclosing
+        self.shape: Optional[StatementShape] = shape
+        self.height: int = 0
+        self.contains_else: bool = False
+
+    def merge(self, height: int, contains_else: bool):  # pylint: disable=dont-use-primitives
+        """Add the facts of a statement of the block."""
+        self.height = max(self.height, height)
+        self.contains_else = self.contains_else or contains_else
+
+    def facts(self):
+        """The facts of the statements of the block."""
+        return FunctionFacts(self.height, self.contains_else)
+
+
+_NO_BLOCKS: Tuple[OpenBlock, ...] = ()
+
+
+class ModuleWalker:
+    # pylint: disable=chain-of-method-calls
+    """
+    Walks a module once, bottom-up, and computes the facts of every function in it.
+    Nested functions are covered by the same walk instead of being re-walked
+    for each enclosing function.
+
+    The walk keeps a stack of the blocks it is in rather than recursing, so the depth
+    of the module is only bounded by memory, and what it looks up on a statement is
+    found once per statement type, in the shapes table. Statements without a block,
+    most of them, are only looked up in that table.
+    """
+
+    _function_types: Tuple[type, ...] = (nodes.FunctionDef,)
+    _if_types: Tuple[type, ...] = (nodes.If,)
+    _shapes: Dict[type, StatementShape] = {}
+
+    def __init__(self):
+        self._facts: Dict[int, FunctionFacts] = {}
+
+    def _shape(self, statement: nodes.NodeNG):
+        shape = self._shapes.get(type(statement))
+        if shape is None:
+            shape = self._shapes[type(statement)] = StatementShape(
+                hasattr(statement, "body"),
+                tuple(name for name in _SIDE_BLOCKS if hasattr(statement, name)),
+                isinstance(statement, self._function_types),
+                isinstance(statement, self._if_types))
+        return shape
+
+    def _opened_blocks(self, statement: nodes.NodeNG, block: OpenBlock):
+        """The blocks of a statement, its body last so that it is walked first."""
+        shape = self._shape(statement)
+        if not shape.side_blocks and not shape.has_body:
+            return _NO_BLOCKS
+        side_blocks = [self._side_block(statements) for statements in
+                       map(statement.__getattribute__, shape.side_blocks) if statements]
+        body = [self._body_block(statement, shape, block)] if shape.has_body else []
+        return side_blocks + body
+
+    def _side_block(self, statements: List[nodes.NodeNG]):
+        """A block walked only for the functions in it, like the module body."""
+        return OpenBlock(None, statements)
+
+    def _body_block(self, statement: nodes.NodeNG, shape: StatementShape, block: OpenBlock):
+        """The body of a statement, part of the block the statement is in."""
+        return OpenBlock(statement, statement.body, block, shape)
+
+    def _levels(self, statement: nodes.NodeNG):
+        """The indentation levels a statement with a body opens, one."""
+        del statement
+        return 1
+
+    def _height(self, statement: nodes.NodeNG, body: OpenBlock):
+        """The height of a statement with a body, its levels above its body."""
+        return body.height + self._levels(statement)
+
+    def _close(self, body: OpenBlock):
+        """Merge the facts of a walked body into the facts of the block it is part of."""
+        statement, shape = body.statement, body.shape
+        if statement is None or body.enclosing is None:
+            return
+        if shape.is_function:
+            self._facts[id(statement)] = body.facts()
+        body.enclosing.merge(self._height(statement, body),
+                             body.contains_else or (shape.is_if and bool(statement.orelse)))
+
+    def _step(self, blocks: List[OpenBlock]):
+        """Go to the next statement of the innermost block, or close the block."""
+        block = blocks[-1]
+        statement = next(block.statements, None)
+        if statement is None:
+            self._close(blocks.pop())
+            return
+        blocks.extend(self._opened_blocks(statement, block))
+
+    def walk(self, module: nodes.Module):
+        """Walk the module and collect the facts of all its functions."""
+        blocks = [self._side_block(module.body)]
+        while blocks:
+            self._step(blocks)
+        return self
+
+    def facts_of(self, node: nodes.FunctionDef):
+        """Return the facts collected for a function of the walked module."""
+        return self._facts[id(node)]
+
+
+class ViolationLocations(NamedTuple):
+    """The statements of a function body the indentation and else rules are broken at."""
+    nested_blocks: List[NestedBlock]
+    else_branches: List[nodes.NodeNG]
+
+
+class ViolationKind(NamedTuple):
+    """
+    A rule of the function bodies: whether the facts of a function break it, with the
+    levels allowed, where its violations are among the ones located in a body, and
+    whether they can be in the blocks deeper than the levels allowed.
+    """
+    broken: Callable[[FunctionFacts, int], bool]
+    located: Callable[..., Sequence[object]]
+    in_deep_blocks: bool
+
+
+NESTED_BLOCKS = ViolationKind(lambda facts, max_levels: facts.max_indentation > max_levels,
+                              operator.attrgetter("nested_blocks"), False)
+ELSE_BRANCHES = ViolationKind(lambda facts, _: facts.contains_else,
+                              operator.attrgetter("else_branches"), True)
+
+
+class MeasuringModuleWalker(ModuleWalker):
+    """
+    The module walk, also keeping the height of the body of every statement, so that
+    the first violation of a function is then located without walking again the bodies
+    it can't be in.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._heights: Dict[int, int] = {}
+
+    def _height(self, statement: nodes.NodeNG, body: OpenBlock):
+        self._heights[id(statement)] = body.height
+        return super()._height(statement, body)
+
+    def height_of(self, statement: nodes.NodeNG):
+        """Return the height of the body of a statement of the walked module."""
+        return self._heights[id(statement)]
+
+
+class LocatingBlock(OpenBlock):
+    # pylint: disable=chain-of-method-calls
+    """
+    A block of the locating walk, which also knows how deep in its function body it is
+    and where the violations of that body are collected. The blocks that aren't part
+    of a function body, like side blocks, have no locations.
+    """
+
+    __slots__ = ("depth", "locations")
+
+    def __init__(self, statement: Optional[nodes.NodeNG], statements: List[nodes.NodeNG],
+                 enclosing: Optional[OpenBlock] = None, shape: Optional[StatementShape] = None):
+        super().__init__(statement, statements, enclosing, shape)
+        self.depth: int = 0
+        self.locations: Optional[ViolationLocations] = None
+
+    def start_function(self):
+        """Make the block the body of a function, collecting the violations of its own."""
+        self.locations = ViolationLocations([], [])
+        return self
+
+    def nest_in(self, block: "LocatingBlock", levels: int):  # pylint: disable=dont-use-primitives
+        """Make the block part of the function body of another one, levels deeper."""
+        self.depth = block.depth + levels
+        self.locations = block.locations
+        return self
+
+    def facts(self):
+        """The facts of the statements of the block, with the violations found in it."""
+        return FunctionFacts(self.height, self.contains_else,
+                             tuple(self.locations.nested_blocks),
+                             tuple(self.locations.else_branches))
+
+
+class LocatingModuleWalker(ModuleWalker):
+    # pylint: disable=chain-of-method-calls
+    """
+    The module walk, also locating where every function body breaks the rules in the
+    same pass. A statement is located once its body is walked, so the locations come
+    in the order of the source.
+
+    The nested blocks are the outermost statements opening a block deeper than the
+    levels allowed, along with the depth reached in them. The else branches are the
+    first statement of the ``else`` branch of the ``if`` statements. A nested function
+    is itself the location, in its enclosing function, of the violations in it: its
+    statements are located in the nested function only.
+    """
+
+    def __init__(self, max_levels: int = MAX_INDENTATION_LEVELS):  # pylint: disable=dont-use-primitives
+        super().__init__()
+        self.max_levels: int = max_levels
+
+    def _side_block(self, statements: List[nodes.NodeNG]):
+        return LocatingBlock(None, statements)
+
+    def _body_block(self, statement: nodes.NodeNG, shape: StatementShape, block: OpenBlock):
+        body = LocatingBlock(statement, statement.body, block, shape)
+        if shape.is_function:
+            return body.start_function()
+        return body.nest_in(block, self._levels(statement))
+
+    def _located(self, statement: nodes.NodeNG, level: int):  # pylint: disable=dont-use-primitives
+        """The statement standing for a level of a statement, the statement itself."""
+        del self, level
+        return statement
+
+    def _nested_level(self, body: LocatingBlock, block: LocatingBlock):
+        """Which level of the statement of a body is at the deepest depth allowed."""
+        level = self.max_levels - block.depth
+        if body.shape.is_function:
+            return min(level, 0)
+        return level
+
+    def _locate_nested_block(self, body: LocatingBlock, block: LocatingBlock):
+        levels = self._levels(body.statement)
+        depth = block.depth + body.height + levels
+        level = self._nested_level(body, block)
+        if 0 <= level < levels and depth > self.max_levels:
+            block.locations.nested_blocks.append(
+                NestedBlock(self._located(body.statement, level), depth))
+
+    @staticmethod
+    def _locate_else_branch(body: LocatingBlock, block: LocatingBlock):
+        statement, shape = body.statement, body.shape
+        if shape.is_if and statement.orelse:
+            block.locations.else_branches.append(statement.orelse[0])
+        if shape.is_function and body.contains_else:
+            block.locations.else_branches.append(statement)
+
+    def _close(self, body: LocatingBlock):
+        super()._close(body)
+        block = body.enclosing
+        if body.statement is None or block is None or block.locations is None:
+            return
+        self._locate_nested_block(body, block)
+        self._locate_else_branch(body, block)
+
+
+class FirstViolationWalker(LocatingModuleWalker):
+    # pylint: disable=chain-of-method-calls
+    """
+    The locating walk of a single function, up to its first violation of a kind. The
+    bodies the violation can't be in aren't walked, their facts being the ones the
+    measuring walk of the module kept: the bodies of nested functions, which are located
+    as a whole, and for the nested blocks the bodies deeper than the levels allowed.
+    """
+
+    def __init__(self, max_levels: int, measured: MeasuringModuleWalker,  # pylint: disable=dont-use-primitives
+                 kind: ViolationKind):
+        super().__init__(max_levels)
+        self._measured: MeasuringModuleWalker = measured
+        self._kind: ViolationKind = kind
+
+    def _is_measured(self, body: LocatingBlock):
+        return body.shape.is_function or \
+            (not self._kind.in_deep_blocks and body.depth > self.max_levels)
+
+    def _body_block(self, statement: nodes.NodeNG, shape: StatementShape, block: OpenBlock):
+        body = super()._body_block(statement, shape, block)
+        if block is None or not self._is_measured(body):
+            return body
+        body.statements = iter(())
+        body.height = self._measured.height_of(statement)
+        body.contains_else = shape.is_function and \
+            self._measured.facts_of(statement).contains_else
+        return body
+
+    def locate(self, function: nodes.NodeNG) -> Tuple[object, ...]:
+        """The first violation of the function, walking its body up to it."""
+        body = self._body_block(function, self._shape(function), None)
+        blocks = [body]
+        while blocks and not self._kind.located(body.locations):
+            self._step(blocks)
+        return tuple(self._kind.located(body.locations)[:1])
+
+    @classmethod
+    def first_of(cls, function: nodes.NodeNG, measured: MeasuringModuleWalker,  # pylint: disable=dont-use-primitives
+                 kind: ViolationKind, max_levels: int) -> Tuple[object, ...]:
+        """
+        The first violation of a kind of a function of the measured module, none or one.
+        Only the functions breaking the rule are walked.
+        """
+        if not kind.broken(measured.facts_of(function), max_levels):
+            return ()
+        return cls(max_levels, measured, kind).locate(function)
+
+
+_MODULE_WALKS: "weakref.WeakKeyDictionary[nodes.Module, LocatingModuleWalker]" = \
+    weakref.WeakKeyDictionary()
+_MEASURED_WALKS: "weakref.WeakKeyDictionary[nodes.Module, MeasuringModuleWalker]" = \
+    weakref.WeakKeyDictionary()
+
+
+def function_facts(node: nodes.FunctionDef,  # pylint: disable=dont-use-primitives
+                   max_levels: Optional[int] = None):
+    """
+    Return the facts of a function, with the locations of its violations, walking its
+    module on the first request. The result of the walk is kept for as long as the
+    module node is alive. The nested blocks are the ones deeper than the levels
+    allowed, the module being walked again when other levels than the ones of the
+    kept walk are asked for, and any walk being fine when none are.
+    """
+    module = node.root()
+    walk = _MODULE_WALKS.get(module)
+    if walk is None or max_levels not in (None, walk.max_levels):
+        walk = _MODULE_WALKS[module] = LocatingModuleWalker(
+            MAX_INDENTATION_LEVELS if max_levels is None else max_levels).walk(module)
+    return walk.facts_of(node)
+
+
+def first_violation(node: nodes.FunctionDef, kind: ViolationKind,  # pylint: disable=dont-use-primitives
+                    max_levels: Optional[int] = None):
+    """
+    Return the first violation of a kind of a function, none or one. Its module is
+    walked without locating anything on the first request, and the walk is kept for as
+    long as the module node is alive: only the functions breaking the rule are walked
+    again, up to their first violation.
+    """
+    module = node.root()
+    if module not in _MEASURED_WALKS:
+        _MEASURED_WALKS[module] = MeasuringModuleWalker().walk(module)
+    return FirstViolationWalker.first_of(
+        node, _MEASURED_WALKS[module], kind,
+        MAX_INDENTATION_LEVELS if max_levels is None else max_levels)
+
+
+def function_violations(node: nodes.FunctionDef, kind: ViolationKind,  # pylint: disable=dont-use-primitives
+                        every: bool, max_levels: Optional[int] = None):
+    """
+    Return every violation of a kind of a function, located by the walk of its module,
+    or only the first one, located by walking the function up to it.
+    """
+    if every:
+        return kind.located(function_facts(node, max_levels))
+    return first_violation(node, kind, max_levels)
@@ -0,0 +1,167 @@
+"""Opt-in timing and counters of the checkers hot paths"""
+import functools
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+RecursiveHelper = Tuple[type, str]
+
+
+class CallStats:
+    """The counters of a single instrumented callback or helper."""
+
+    def __init__(self):
+        self.calls: int = 0
+        self.seconds: float = 0.0
+        self.depth: int = 0
+        self.max_depth: int = 0
+
+    def enter(self):
+        """Count a call, tracking how deep the recursion went."""
+        self.calls += 1
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def leave(self):
+        """Leave a call of a recursive helper."""
+        self.depth -= 1
+
+    def call(self, function: Callable, args: Tuple):
+        """Call a function, leaving the call even when it raises an exception."""
+        self.enter()
+        try:
+            return function(*args)
+        finally:
+            self.leave()
+
+    def timed_call(self, function: Callable, args: Tuple):
+        """Call a function, adding its wall time, the time of a raising call included."""
+        start = time.perf_counter()
+        try:
+            return self.call(function, args)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def to_json(self):
+        """The counters as written in the report."""
+        return {"calls": self.calls, "seconds": self.seconds, "max_depth": self.max_depth}
+
+
+class StatsTable:
+    # pylint: disable=chain-of-method-calls
+    """The call stats of every instrumented member, keyed by its qualified name."""
+
+    def __init__(self):
+        self._stats: Dict[str, CallStats] = {}
+
+    def stats_of(self, name: str):  # pylint: disable=dont-use-primitives
+        """Return the stats of a member, creating them on first use."""
+        return self._stats.setdefault(name, CallStats())
+
+    def to_json(self):
+        """The stats of all the members as written in the report."""
+        return {name: stats.to_json() for name, stats in sorted(self._stats.items())}
+
+
+def timed(stats: CallStats, callback: Callable):
+    """
+    Wrap a checker callback to record its calls and wall time, the time of a call
+    raising an exception included.
+    """
+    @functools.wraps(callback)
+    def timed_callback(*args):
+        return stats.timed_call(callback, args)
+    return timed_callback
+
+
+def tracked(stats: CallStats, helper: Callable):
+    """
+    Wrap a recursive helper to record its calls, one per node it goes through, and
+    its depth, which a call raising an exception leaves as well.
+    """
+    @functools.wraps(helper)
+    def tracked_helper(*args):
+        return stats.call(helper, args)
+    return tracked_helper
+
+
+class PatchedHelpers:
+    # pylint: disable=chain-of-method-calls
+    """The recursive helpers patched on their class, along with their originals."""
+
+    def __init__(self):
+        self._originals: Dict[RecursiveHelper, Callable] = {}
+
+    def __contains__(self, helper: RecursiveHelper):
+        return helper in self._originals
+
+    def patch(self, helper: RecursiveHelper, stats: StatsTable):
+        """
+        Replace the helper on its class with a tracked version of it, keeping the
+        descriptor the class defines it with, like a staticmethod.
+        """
+        owner, name = helper
+        self._originals[helper] = owner.__dict__[name]
+        patched = tracked(stats.stats_of(f"{owner.__name__}.{name}"), getattr(owner, name))
+        setattr(owner, name, staticmethod(patched)
+                if isinstance(self._originals[helper], staticmethod) else patched)
+
+    def restore(self):
+        """Put back the original helpers, as their class defined them."""
+        for (owner, name), original in self._originals.items():
+            setattr(owner, name, original)
+        self._originals = {}
+
+
+class Instrumentation:
+    # pylint: disable=chain-of-method-calls
+    """
+    Collects the call stats of the checkers during a run, and writes them as a
+    json report once the last instrumented checker is closed.
+    The recursive helpers are patched on their class while the run lasts.
+    """
+
+    def __init__(self, report_path: Path):
+        self._report_path: Path = report_path
+        self._callbacks: StatsTable = StatsTable()
+        self._helpers: StatsTable = StatsTable()
+        self._patched: PatchedHelpers = PatchedHelpers()
+        self._open_checkers: int = 0
+
+    def instrument_callback(self, qualified_name: str,  # pylint: disable=dont-use-primitives
+                            callback: Callable):
+        """Return the callback wrapped with timing."""
+        return timed(self._callbacks.stats_of(qualified_name), callback)
+
+    def checker_opened(self, helpers: Tuple[RecursiveHelper, ...]):
+        """Start instrumenting the recursive helpers a checker relies on."""
+        self._open_checkers += 1
+        for helper in set(helpers):
+            self._patch_helper(helper)
+
+    def _patch_helper(self, helper: RecursiveHelper):
+        if helper not in self._patched:
+            self._patched.patch(helper, self._helpers)
+
+    def checker_closed(self):
+        """Write the report once all the instrumented checkers are closed."""
+        self._open_checkers -= 1
+        if not self._open_checkers:
+            self._finish()
+
+    def _finish(self):
+        self._patched.restore()
+        _INSTRUMENTATIONS.pop(self._report_path, None)
+        report = {"callbacks": self._callbacks.to_json(), "helpers": self._helpers.to_json()}
+        self._report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+_INSTRUMENTATIONS: Dict[Path, Instrumentation] = {}
+
+
+def instrumentation_for(report_path: Path):
+    """Return the instrumentation writing to the report, shared by all the checkers."""
+    if report_path not in _INSTRUMENTATIONS:
+        _INSTRUMENTATIONS[report_path] = Instrumentation(report_path)
+    return _INSTRUMENTATIONS[report_path]
@@ -0,0 +1,212 @@
+"""
+Per-file latency of the object calisthenics checkers, to find the files a run spends
+most of its time in.
+
+When enabled, the walker callbacks of the checkers are timed, and their time is added
+to the file of the module being walked, along with the nodes and lines of the module.
+Once the last checker is closed, a json report is written with the p50, p95 and p99
+latencies of the files, a histogram of their latencies and the slowest files with the
+nodes checked per millisecond.
+``python -m object_calisthenics.checkers.latency_report <file>`` prints it.
+"""
+import argparse
+import bisect
+import functools
+import heapq
+import json
+import math
+import sys
+import time
+import weakref
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from astroid import nodes
+
+Arguments = Optional[Sequence[str]]
+Milliseconds = float
+FileCount = int
+
+# The upper bounds of the histogram buckets, the last bucket holding the slower files.
+HISTOGRAM_BOUNDS_MS: Tuple[Milliseconds, ...] = (
+    0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+PERCENTILES = (50, 95, 99)
+
+
+def node_count(module: nodes.Module):
+    """The nodes of the module, counted with a stack of nodes rather than recursing."""
+    count, pending = 0, [module]
+    while pending:
+        count += 1
+        pending.extend(pending.pop().get_children())
+    return count
+
+
+class FileLatency:
+    """The time the checkers spent in a file, with the nodes and lines of its module."""
+
+    __slots__ = ("path", "nodes", "lines", "seconds")
+
+    def __init__(self, module: nodes.Module):
+        self.path: str = module.file or module.name
+        self.nodes: int = node_count(module)
+        self.lines: int = module.tolineno or 0
+        self.seconds: float = 0.0
+
+    def milliseconds(self):
+        """The time spent in the file."""
+        return Milliseconds(self.seconds * 1000)
+
+    def to_json(self):
+        """The latency of the file as written in the report."""
+        milliseconds = self.milliseconds()
+        return {"path": self.path, "ms": milliseconds, "nodes": self.nodes, "lines": self.lines,
+                "nodes_per_ms": self.nodes / milliseconds if milliseconds else None}
+
+
+def percentile(sorted_ms: Sequence[Milliseconds], rank: int):  # pylint: disable=dont-use-primitives
+    """The nearest-rank percentile of sorted latencies, none without latencies."""
+    if not sorted_ms:
+        return None
+    return sorted_ms[max(math.ceil(rank / 100 * len(sorted_ms)) - 1, 0)]
+
+
+def histogram(latencies: Sequence[Milliseconds]):
+    """How many files fall in every bucket, the last bucket having no upper bound."""
+    counts = [FileCount(0)] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    for milliseconds in latencies:
+        counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, milliseconds)] += 1
+    return [{"le_ms": bound, "files": count}
+            for bound, count in zip(HISTOGRAM_BOUNDS_MS + (None,), counts)]
+
+
+def latency_summary(files: List[FileLatency], top: FileCount):
+    """The report of the latencies of the files, the top slowest ones being listed first."""
+    latencies = sorted(latency.milliseconds() for latency in files)
+    slowest = heapq.nlargest(top, files, key=FileLatency.milliseconds)
+    return {
+        "files": len(files),
+        "total_ms": sum(latencies),
+        "percentiles_ms": {f"p{rank}": percentile(latencies, rank) for rank in PERCENTILES},
+        "histogram": histogram(latencies),
+        "slowest": [latency.to_json() for latency in slowest],
+        "all": [latency.to_json() for latency in sorted(files, key=lambda file: file.path)],
+    }
+
+
+class LatencyRecorder:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    Adds the time of the walker callbacks of the checkers to the file being walked, and
+    writes the report once the last checker it times is closed. The module callbacks
+    start the latency of a file the first time they are called on its module, before
+    their own time is taken, so counting the nodes of the module isn't timed.
+    """
+
+    def __init__(self, report_path: Path, top: FileCount):
+        self._report_path: Path = report_path
+        self._top: FileCount = top
+        self._files: List[FileLatency] = []
+        self._module: Callable[[], Optional[nodes.Module]] = lambda: None
+        self._open_checkers: int = 0
+
+    def _timed(self, callback: Callable[[nodes.NodeNG], None]):
+        @functools.wraps(callback)
+        def timed_callback(node: nodes.NodeNG):
+            start = time.perf_counter()
+            result = callback(node)
+            self._files[-1].seconds += time.perf_counter() - start
+            return result
+        return timed_callback
+
+    def _module_timed(self, callback: Callable[[nodes.Module], None]):
+        timed_callback = self._timed(callback)
+
+        @functools.wraps(callback)
+        def module_callback(node: nodes.Module):
+            self.module_started(node)
+            return timed_callback(node)
+        return module_callback
+
+    def module_started(self, module: nodes.Module):
+        """Start the latency of the file of the module, unless it is already started."""
+        if self._module() is not module:
+            self._module = weakref.ref(module)
+            self._files.append(FileLatency(module))
+
+    def time_callback(self, name: str, callback: Callable[[nodes.NodeNG], None]):  # pylint: disable=dont-use-primitives
+        """Time a walker callback of a checker, ``visit_module`` starting the next file."""
+        if name == "visit_module":
+            return self._module_timed(callback)
+        return self._timed(callback)
+
+    def checker_opened(self):
+        """Count a checker whose callbacks are timed, until it is closed."""
+        self._open_checkers += 1
+        return self
+
+    def checker_closed(self):
+        """Write the report once all the timed checkers are closed."""
+        self._open_checkers -= 1
+        if not self._open_checkers:
+            self._finish()
+
+    def _finish(self):
+        _RECORDERS.pop(self._report_path, None)
+        report = latency_summary(self._files, self._top)
+        self._report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+_RECORDERS: Dict[Path, LatencyRecorder] = {}
+
+
+def latency_recorder_for(report_path: Path, top: FileCount):
+    """Return the recorder writing to the report, shared by all the checkers."""
+    if report_path not in _RECORDERS:
+        _RECORDERS[report_path] = LatencyRecorder(report_path, top)
+    return _RECORDERS[report_path]
+
+
+def _milliseconds(value: Optional[Milliseconds]):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def _print_histogram(buckets: List[dict]):
+    print("Histogram:")
+    width = max((bucket["files"] for bucket in buckets), default=0)
+    for bucket in buckets:
+        bound = "inf" if bucket["le_ms"] is None else f"{bucket['le_ms']:g}"
+        bars = "#" * round(40 * bucket["files"] / width) if width else ""
+        print(f"  <= {bound:>6} ms {bucket['files']:>7} {bars}")
+
+
+def _print_slowest(files: List[dict]):
+    print("Slowest files:")
+    for latency in files:
+        print(f"  {latency['path']} ms={_milliseconds(latency['ms'])} nodes={latency['nodes']} "
+              f"lines={latency['lines']} nodes/ms={_milliseconds(latency['nodes_per_ms'])}")
+
+
+def main(argv: Arguments = None):
+    """Print the percentiles, histogram and slowest files of a latency report."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("report", type=Path, help="Latency report file")
+    parser.add_argument("--top", type=int, default=None,
+                        help="Amount of slowest files, all the ones of the report by default")
+    args = parser.parse_args(argv)
+    report_path: Path = args.report
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    percentiles_ms: Dict[str, Optional[Milliseconds]] = report["percentiles_ms"]
+    percentiles = " ".join(f"{name}={_milliseconds(value)}"
+                           for name, value in percentiles_ms.items())
+    print(f"files={report['files']} total_ms={_milliseconds(report['total_ms'])} {percentiles}")
+    _print_histogram(report["histogram"])
+    slowest = report["slowest"] if args.top is None else \
+        heapq.nlargest(args.top, report["all"], key=lambda latency: latency["ms"])
+    _print_slowest(slowest)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Checkers registered by their declaration, built once pylint needs them"""
+# The checker is built without registering its options a second time, which goes
+# through a protected PyLinter member of the pinned pylint version.
+# pylint: disable=protected-access
+import contextlib
+import importlib
+from typing import TYPE_CHECKING, Dict, Optional
+
+from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.declarations import (CheckerDeclaration, MessageDefinition,
+                                                        Options)
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+
+@contextlib.contextmanager
+def _options_already_registered(linter: "PyLinter"):
+    """Build a checker whose options the linter already knows, keeping their values."""
+    linter._register_options_provider = lambda provider: None
+    try:
+        yield
+    finally:
+        del linter._register_options_provider
+
+
+class LazyChecker(BaseChecker):  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    An object calisthenics checker, loaded when one of its messages is enabled.
+    It stands for the checker in the linter with the messages and options of its
+    declaration. Pylint only opens the checkers with an enabled message: the checker
+    module is imported and the checker built then, and its walker callbacks are
+    taken over by this one.
+    """
+
+    def __init__(self, linter: "PyLinter", declaration: CheckerDeclaration):
+        self.name: str = declaration.name
+        self.msgs: Dict[str, MessageDefinition] = declaration.msgs
+        self.options: Options = declaration.options
+        super().__init__(linter)
+        self._declaration: CheckerDeclaration = declaration
+        self.checker: Optional[BaseChecker] = None
+
+    def _build(self):
+        module = importlib.import_module(self._declaration.module)
+        checker_class = getattr(module, self._declaration.class_name)
+        with _options_already_registered(self.linter):
+            return checker_class(self.linter)
+
+    def open(self):
+        """Build the checker on first use, open it and take over its walker callbacks."""
+        if self.checker is None:
+            self.checker = self._build()
+        self.checker.open()
+        callbacks = [name for name in dir(self.checker) if name.startswith(("visit_", "leave_"))]
+        for name in callbacks:
+            setattr(self, name, getattr(self.checker, name))
+
+    def close(self):
+        """Close the checker."""
+        if self.checker is not None:
+            self.checker.close()
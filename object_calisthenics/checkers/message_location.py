@@ -0,0 +1,64 @@
+"""Node free locations of the messages added by the checkers"""
+from typing import NamedTuple, Optional
+
+from astroid import nodes
+from pylint.typing import FileItem
+from pylint.utils import get_module_and_frameid
+
+_PACKAGE_MODULE = ".__init__"
+
+
+class MessageLocation(NamedTuple):
+    """
+    Where pylint reports a message, along with the frame it was added in.
+    The frame line allows finding the frame again without keeping its node.
+    """
+    line: int
+    col_offset: int
+    end_lineno: Optional[int]
+    end_col_offset: Optional[int]
+    frame_id: str
+    frame_line: int
+
+
+def module_name(item: FileItem):
+    """The name of the module of a file as astroid names it, a package by its own name."""
+    name = item.name
+    return name[:-len(_PACKAGE_MODULE)] if name.endswith(_PACKAGE_MODULE) else name
+
+
+def message_location(node: nodes.NodeNG):
+    """Return the location pylint reports for a message added on a node."""
+    frame_id = get_module_and_frameid(node)[1]
+    frame_line = node.frame(future=True).fromlineno
+    position = node.position
+    if position:
+        return MessageLocation(position.lineno, position.col_offset, position.end_lineno,
+                               position.end_col_offset, frame_id, frame_line)
+    return MessageLocation(node.fromlineno, node.col_offset, node.end_lineno,
+                           node.end_col_offset, frame_id, frame_line)
+
+
+def _is_frame_of(child: nodes.NodeNG, scope: nodes.NodeNG, location: MessageLocation):
+    return isinstance(child, (nodes.Lambda, nodes.ClassDef)) and child is not scope and \
+        child.fromlineno <= location.frame_line <= child.tolineno
+
+
+def _child_frame(scope: nodes.NodeNG, name: str,  # pylint: disable=dont-use-primitives
+                 location: MessageLocation):
+    children = scope.locals.get(name, ())  # pylint: disable=chain-of-method-calls
+    if name == "<lambda>":
+        children = scope.nodes_of_class(nodes.Lambda)
+    frames = (child for child in children if _is_frame_of(child, scope, location))
+    return next(frames, scope)
+
+
+def resolve_frame(module: nodes.Module, location: MessageLocation):
+    """
+    Find the frame a message was added in, going down the scopes named in its
+    frame id. Falls back to the closest enclosing scope that could be found.
+    """
+    scope = module
+    for name in filter(None, location.frame_id.split(".")):  # pylint: disable=chain-of-method-calls
+        scope = _child_frame(scope, name, location)
+    return scope
@@ -0,0 +1,124 @@
+"""
+Type aliases a module defines, from its imports and its module level aliases.
+
+They are collected once per module, in a single pass over its top-level statements,
+into a table from the local names to the names they stand for: ``import typing as t``
+makes ``t`` stand for ``typing``, ``from collections import deque as dq`` makes ``dq``
+stand for ``collections.deque`` and ``Names = List[str]`` makes ``Names`` stand for
+``List``. The annotations of the module are then resolved through the table with no
+further name lookup, whatever the amount of annotations.
+"""
+import ast
+import weakref
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from astroid import nodes
+
+from object_calisthenics.checkers.annotation_keys import (SUBSCRIPT, AnnotationKey, AnnotationKeys,
+                                                          TypeAliases)
+
+Binding = Tuple[str, AnnotationKey]
+
+_ASTROID_ALIASED = (nodes.Name, nodes.Attribute, nodes.Subscript)
+_AST_ALIASED = (ast.Name, ast.Attribute, ast.Subscript)
+
+
+def key_name(key: AnnotationKey):
+    """The type name a key stands for, the subscripted name for a subscript."""
+    if isinstance(key, tuple) and key[0] == SUBSCRIPT:
+        key = key[1]
+    return key if isinstance(key, str) else None
+
+
+def _named(bindings: Iterable[Binding]):
+    """The local names standing for the names of their keys, when they have one."""
+    names = ((local, key_name(key)) for local, key in bindings)
+    return [(local, name) for local, name in names if name and name != local]
+
+
+def _astroid_imports(statement: nodes.Import, _: TypeAliases):
+    return [(alias, name) for name, alias in statement.names if alias]
+
+
+def _astroid_imports_from(statement: nodes.ImportFrom, aliases: TypeAliases):
+    if statement.level:
+        return []
+    return [(alias or name, aliases.qualified(statement.modname, name))
+            for name, alias in statement.names if name != "*"]
+
+
+def _astroid_assignment(statement: nodes.Assign, aliases: TypeAliases):
+    target = statement.targets[0]
+    if len(statement.targets) > 1 or not isinstance(target, nodes.AssignName) or \
+            not isinstance(statement.value, _ASTROID_ALIASED):
+        return []
+    return [(target.name, AnnotationKeys.of_astroid(statement.value, aliases))]
+
+
+def _ast_imports(statement: ast.Import, _: TypeAliases):
+    return [(alias.asname, alias.name) for alias in statement.names if alias.asname]
+
+
+def _ast_imports_from(statement: ast.ImportFrom, aliases: TypeAliases):
+    if statement.level or not statement.module:
+        return []
+    return [(alias.asname or alias.name, aliases.qualified(statement.module, alias.name))
+            for alias in statement.names if alias.name != "*"]
+
+
+def _ast_assignment(statement: ast.Assign, aliases: TypeAliases):
+    target = statement.targets[0]
+    if len(statement.targets) > 1 or not isinstance(target, ast.Name) or \
+            not isinstance(statement.value, _AST_ALIASED):
+        return []
+    return [(target.id, AnnotationKeys.of_ast(statement.value, aliases))]
+
+
+BindingRule = Callable[..., List[Binding]]
+
+_ASTROID_BINDINGS: Dict[type, BindingRule] = {
+    nodes.Import: _astroid_imports,
+    nodes.ImportFrom: _astroid_imports_from,
+    nodes.Assign: _astroid_assignment,
+}
+
+_AST_BINDINGS: Dict[type, BindingRule] = {
+    ast.Import: _ast_imports,
+    ast.ImportFrom: _ast_imports_from,
+    ast.Assign: _ast_assignment,
+}
+
+
+def _no_bindings(*_: object):
+    return []
+
+
+def _module_aliases(body: Iterable[object], rules: Dict[type, BindingRule]):
+    """Bind the names of the statements in order, a name standing for what it last did."""
+    names: Dict[str, str] = {}
+    aliases = TypeAliases(names)
+    for statement in body:
+        names.update(_named(rules.get(type(statement), _no_bindings)(statement, aliases)))
+    return aliases
+
+
+_ASTROID_MODULE_ALIASES: "weakref.WeakKeyDictionary[nodes.Module, TypeAliases]" = \
+    weakref.WeakKeyDictionary()
+
+
+def module_aliases(module: nodes.Module):
+    """The type aliases of an astroid module, collected once for as long as it is alive."""
+    if module not in _ASTROID_MODULE_ALIASES:
+        _ASTROID_MODULE_ALIASES[module] = _module_aliases(module.body, _ASTROID_BINDINGS)
+    return _ASTROID_MODULE_ALIASES[module]
+
+
+def share_module_aliases(module: nodes.Module, aliases: TypeAliases):
+    """Resolve the annotations of a module built from a part of a file with the aliases of
+    the whole file, collected beforehand."""
+    _ASTROID_MODULE_ALIASES[module] = aliases
+
+
+def ast_module_aliases(module: ast.Module):
+    """The type aliases of a stdlib ast module."""
+    return _module_aliases(module.body, _AST_BINDINGS)
@@ -1,45 +1,88 @@
 """One dot per line checker"""
-from typing import TYPE_CHECKING, Optional
+import argparse
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 from astroid import nodes
-from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.calisthenics_checker import CalisthenicsChecker
+from object_calisthenics.checkers.declarations import ONE_DOT_PER_LINE
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
 
+Receivers = Tuple[Tuple[str, ...], ...]
+DottedPath = Sequence[str]
+
+
+class ChainLength(int):
+    """The amount of dots of a chain"""
+
+
+def parse_receivers(receivers: Sequence[str]):  # pylint: disable=dont-use-primitives
+    """Split the allowed receivers, like ``self`` or ``os.path``, into their names."""
+    return tuple(tuple(receiver.split(".")) for receiver in receivers)
+
 
-class OneDotPerLine(BaseChecker):
+def receiver_dots(path: DottedPath, receivers: Receivers):
+    """
+    The dots of the path that aren't counted for its allowed receiver: the dots inside
+    the receiver and the one after it. ``self.a.b`` with ``self`` allowed has a single
+    dot left, the one before ``b``, and ``os.path.a.b`` with ``os.path`` allowed too.
+    """
+    prefixes = (receiver for receiver in receivers
+                if len(receiver) < len(path) and tuple(path[:len(receiver)]) == receiver)
+    return ChainLength(max((len(receiver) for receiver in prefixes), default=0))
+
+
+class OneDotPerLine(CalisthenicsChecker):  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
     """
     A class for checking that statements only use a single dot,
     and that there is no call chaining.
+    A chain is a run of attributes, each one taken on the previous one, along with
+    the call of its last attribute. It is reported once, on its outermost node.
     """
 
-    name = "one-dot-per-line"
-    msgs = {
-        "W9006": (
-            "A statement has a chain of method calls.",
-            "chain-of-method-calls",
-            "A statement should at most have a single method call."
-        )
-    }
+    name = ONE_DOT_PER_LINE.name
+    msgs = ONE_DOT_PER_LINE.msgs
+    options = ONE_DOT_PER_LINE.options
 
     def __init__(self, linter: Optional["PyLinter"] = None):
         super().__init__(linter)
+        self._max_length: ChainLength = ChainLength(1)
+        self._receivers: Receivers = ()
+
+    def _configure(self, config: argparse.Namespace):
+        """Read the max chain length and the allowed receivers."""
+        self._max_length = ChainLength(config.max_chain_length)
+        self._receivers = parse_receivers(config.chain_allowed_receivers)
 
-    def _multiple_dots(self, node: nodes.Attribute):
-        if hasattr(node, 'expr') and hasattr(node.expr, 'expr'):
-            return True
-        return False
+    def _chain_length(self, node: nodes.Attribute):
+        """Count the dots of the chain ending with the attribute, in a single walk down."""
+        path = [node.attrname]
+        receiver = node.expr
+        while isinstance(receiver, nodes.Attribute):
+            path.append(receiver.attrname)
+            receiver = receiver.expr
+        dots = ChainLength(len(path))
+        if isinstance(receiver, nodes.Name):
+            path.append(receiver.name)
+            dots = ChainLength(dots - receiver_dots(path[::-1], self._receivers))
+        return dots
 
-    def _add_message(self, node: nodes.Attribute):
-        self.add_message("W9006", node=node)
+    def _check_chain(self, outermost: nodes.NodeNG, last_attribute: nodes.Attribute):
+        dots = self._chain_length(last_attribute)
+        if dots > self._max_length:
+            self.add_message("W9006", node=outermost, args=(dots, self._max_length))
 
     def visit_call(self, node: nodes.Call):
-        """Check dot per line when function call"""
-        func = node.func
-        if self._multiple_dots(func):
-            self._add_message(node)
+        """Check the chain of attributes of a method call"""
+        if isinstance(node.func, nodes.Attribute):
+            self._check_chain(node, node.func)
 
     def visit_attribute(self, node: nodes.Attribute):
-        """Check dot per line when referencing attribute"""
-        if self._multiple_dots(node):
-            self._add_message(node)
+        """Check the chain of attributes ending with an attribute reference"""
+        parent = node.parent
+        is_inner = isinstance(parent, nodes.Attribute) or \
+            (isinstance(parent, nodes.Call) and parent.func is node)
+        if not is_inner:
+            self._check_chain(node, node)
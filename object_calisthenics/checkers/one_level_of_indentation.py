@@ -1,7 +1,13 @@
 """One level of indentation checker"""
+import argparse
 from typing import TYPE_CHECKING, Optional
 from astroid import nodes
-from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.calisthenics_checker import CalisthenicsChecker
+from object_calisthenics.checkers.declarations import ONE_LEVEL_OF_INDENTATION
+from object_calisthenics.checkers.function_body_walker import (MAX_INDENTATION_LEVELS,
+                                                               NESTED_BLOCKS, ModuleWalker,
+                                                               function_violations)
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
@@ -11,52 +17,38 @@ class IndentationLevel(int):
     """Describes the indentation level"""
 
 
-class OneLevelOfIndentation(BaseChecker):
-    """A class for checking that functions have a single level of indentation."""
+class OneLevelOfIndentation(CalisthenicsChecker):
+    # pylint: disable=chain-of-method-calls
+    """
+    A class for checking that functions have a single level of indentation.
+    The message is added on the outermost statement nested too deep, with the depth
+    reached in it. By default a function gets a message for its first such statement,
+    the function being walked up to it, with ``indentation-violations=all`` for every
+    one, found by the module walk.
+    The levels allowed are ``max-indentation-levels``, one by default.
+    """
 
-    name = "one-level-indentation"
-    msgs = {
-        "W9001": (
-            "A function has more than one level of indentation.",
-            "too-much-indentation",
-            "A function should contain at most a single indentation."
-        )
-    }
+    name = ONE_LEVEL_OF_INDENTATION.name
+    msgs = ONE_LEVEL_OF_INDENTATION.msgs
+    options = ONE_LEVEL_OF_INDENTATION.options
 
-    max_indentation_levels_allowed = 1
+    max_indentation_levels_allowed = IndentationLevel(MAX_INDENTATION_LEVELS)
 
     def __init__(self, linter: Optional["PyLinter"] = None):
         super().__init__(linter)
+        self._every: bool = False
+        self._max_levels: IndentationLevel = self.max_indentation_levels_allowed
+
+    def _configure(self, config: argparse.Namespace):
+        """Read whether every violation of a function is reported, and the levels allowed."""
+        self._every = config.indentation_violations == "all"
+        self._max_levels = IndentationLevel(config.max_indentation_levels)
 
-    def _iterate_statements(self,
-                            node: nodes.NodeNG,
-                            indentations: IndentationLevel,
-                            max_indentations: IndentationLevel):
-        for statement in node:
-            max_indentations = self._check_indentation(statement, indentations, max_indentations)
-        return max_indentations
-
-    def _check_indentation(self,
-                           current_node: nodes.NodeNG,
-                           indentations: IndentationLevel,
-                           max_indentations: IndentationLevel = 0):
-        if max_indentations > self.max_indentation_levels_allowed:
-            return max_indentations
-        if isinstance(current_node, list):
-            max_indentations = self._iterate_statements(current_node,
-                                                        indentations,
-                                                        max_indentations)
-        if hasattr(current_node, "body"):
-            indentations += 1
-            max_indentations = max(max_indentations, indentations)
-            max_indentations = self._check_indentation(current_node.body,
-                                                       indentations,
-                                                       max_indentations)
-            indentations -= 1
-        return max_indentations
+    def _recursive_helpers(self):
+        return ((ModuleWalker, "_opened_blocks"),)
 
     def visit_functiondef(self, node: nodes.FunctionDef):
         """When visiting a function, check if more than one indentation present."""
-        max_indentations = self._check_indentation(node.body, indentations=IndentationLevel(0))
-        if max_indentations > self.max_indentation_levels_allowed:
-            self.add_message("W9001", node=node)
+        for nested in function_violations(node, NESTED_BLOCKS, self._every, self._max_levels):
+            self.add_message("W9001", node=nested.statement,
+                             args=(nested.depth, self._max_levels))
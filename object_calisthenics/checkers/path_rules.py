@@ -0,0 +1,219 @@
+"""
+Per-path rules: checker options and disabled messages that only apply under a path.
+
+The rules table is the ``calisthenics-path-rules`` option, whose entries are
+``<path prefix>:<option>=<value>``, like ``legacy/:max-class-lines=300``,
+``core/:max-indentation-levels=0`` or ``tests/:disable=chain-of-method-calls``. The
+option is one of the checkers options, the values of list options and the messages
+of ``disable`` being separated by spaces. The prefixes are relative to the working
+directory, a longer prefix overriding what a shorter one set.
+
+The table is compiled once per run into a prefix trie over the components of the
+prefixes, every node holding the settings of its path with the ones of its own
+prefixes merged in. The settings of a module are then found by walking down the
+components of its path, with no further parsing whatever the amount of rules.
+"""
+import argparse
+import os
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Optional, Sequence, Tuple
+
+from object_calisthenics.checkers.declarations import DECLARATIONS
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+PathRule = str
+PathComponents = Tuple[str, ...]
+OptionValues = Dict[str, object]
+
+DISABLE = "disable"
+
+
+class PathRulesError(Exception):
+    """The per-path rules table can't be compiled."""
+
+
+_OPTIONS = {name: definition for declaration in DECLARATIONS
+            for name, definition in declaration.options}
+_MESSAGE_IDS = {name: msgid for declaration in DECLARATIONS
+                for msgid, (_, symbol, _) in declaration.msgs.items()  # pylint: disable=chain-of-method-calls
+                for name in (msgid, symbol)}
+
+
+def _int_value(value: str, _: dict):  # pylint: disable=dont-use-primitives
+    try:
+        return int(value)
+    except ValueError as error:
+        raise PathRulesError(f"{value!r} isn't an integer") from error
+
+
+def _choice_value(value: str, definition: dict):  # pylint: disable=dont-use-primitives
+    if value not in definition["choices"]:
+        raise PathRulesError(f"{value!r} isn't one of {', '.join(definition['choices'])}")
+    return value
+
+
+_CONVERTERS: Dict[str, Callable[[str, dict], object]] = {
+    "int": _int_value,
+    "csv": lambda value, _: tuple(value.split()),
+    "choice": _choice_value,
+}
+
+
+def option_value(name: str, value: str):  # pylint: disable=dont-use-primitives
+    """The value of a checker option, converted as pylint converts it."""
+    if name not in _OPTIONS:
+        raise PathRulesError(f"{name!r} isn't an option of the object calisthenics checkers")
+    definition = _OPTIONS[name]
+    return _CONVERTERS[definition["type"]](value, definition)
+
+
+def disabled_messages(value: str):  # pylint: disable=dont-use-primitives
+    """The ids of the messages named by their id or symbol, separated by spaces."""
+    unknown = [name for name in value.split() if name not in _MESSAGE_IDS]
+    if unknown:
+        raise PathRulesError(f"{', '.join(unknown)} aren't object calisthenics messages")
+    return frozenset(_MESSAGE_IDS[name] for name in value.split())
+
+
+def path_components(path: str):  # pylint: disable=dont-use-primitives
+    """The components of the absolute path, the keys of the trie."""
+    return tuple(os.path.abspath(path).split(os.sep))  # pylint: disable=chain-of-method-calls
+
+
+class PathSettings:  # pylint: disable=single-collection-instance-variable
+    """
+    The options and disabled messages of a path. The linter options with the ones of
+    the path in place are built once per run, the first time they are asked for.
+    """
+
+    def __init__(self, options: OptionValues, disabled: FrozenSet[str]):  # pylint: disable=dont-use-primitives
+        self.options: OptionValues = options
+        self.disabled: FrozenSet[str] = disabled
+        self._base: Optional[argparse.Namespace] = None
+        self._config: Optional[argparse.Namespace] = None
+
+    def merged(self, options: OptionValues, disabled: FrozenSet[str]):  # pylint: disable=dont-use-primitives
+        """The settings with more options and disabled messages, set by a longer prefix."""
+        return PathSettings({**self.options, **options}, self.disabled | disabled)
+
+    def config(self, base: argparse.Namespace):
+        """The linter options with the options of the path in place of theirs."""
+        if not self.options:
+            return base
+        if self._base is not base:
+            self._base, self._config = base, argparse.Namespace(**vars(base))
+            vars(self._config).update(self.options)
+        return self._config
+
+
+NO_SETTINGS = PathSettings({}, frozenset())
+
+
+class PathTrieNode:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """A component of the prefixes, with the settings of the path it ends."""
+
+    __slots__ = ("children", "settings")
+
+    def __init__(self, settings: PathSettings):
+        self.children: Dict[str, PathTrieNode] = {}
+        self.settings: PathSettings = settings
+
+    def child(self, component: str):  # pylint: disable=dont-use-primitives
+        """The node of a component below this one, added with the same settings if new."""
+        if component not in self.children:
+            self.children[component] = PathTrieNode(self.settings)
+        return self.children[component]
+
+    def deepest(self, components: PathComponents):
+        """The node of the longest run of the components found below this one."""
+        following = iter(components)
+        node, below = self, self
+        while below is not None:
+            node, below = below, below.children.get(next(following, None))
+        return node
+
+
+class PrefixRules:  # pylint: disable=single-collection-instance-variable
+    """The options and disabled messages a prefix sets, gathered from its entries."""
+
+    def __init__(self):
+        self.options: OptionValues = {}
+        self.disabled: FrozenSet[str] = frozenset()
+
+    def add(self, name: str, value: str):  # pylint: disable=dont-use-primitives
+        """Add the setting of an entry of the table."""
+        if name == DISABLE:
+            self.disabled |= disabled_messages(value)
+            return
+        self.options[name.replace("-", "_")] = option_value(name, value)
+
+    def settings_below(self, settings: PathSettings):
+        """The settings of the prefix, below a shorter one with the settings."""
+        return settings.merged(self.options, self.disabled)
+
+
+def _split_rule(rule: PathRule):
+    """The prefix, option name and value of an entry of the table."""
+    prefix, separator, setting = rule.partition(":")
+    name, equals, value = setting.partition("=")
+    if not (prefix and separator and equals):
+        raise PathRulesError(f"{rule!r} isn't a <path prefix>:<option>=<value> entry")
+    return path_components(prefix), name.strip(), value.strip()
+
+
+def parse_path_rules(rules: Sequence[PathRule]):
+    """The rules of every prefix of the table, by the components of the prefix."""
+    prefixes: Dict[PathComponents, PrefixRules] = {}
+    for components, name, value in map(_split_rule, rules):
+        prefixes.setdefault(components, PrefixRules()).add(name, value)
+    return prefixes
+
+
+class PathRules:
+    # pylint: disable=chain-of-method-calls
+    """The per-path rules table compiled into a trie over the components of the prefixes."""
+
+    def __init__(self, rules: Sequence[PathRule]):
+        self.root: PathTrieNode = PathTrieNode(NO_SETTINGS)
+        self._prefixes: int = 0
+        prefixes = parse_path_rules(rules)
+        for components in sorted(prefixes, key=len):
+            self._insert(components, prefixes[components])
+
+    def __len__(self):
+        return self._prefixes
+
+    def _insert(self, components: PathComponents, rules: PrefixRules):
+        """
+        Add a prefix below the shorter ones, already added, whose settings it merges.
+        A prefix never has longer ones below it yet, so no settings are passed down.
+        """
+        node = self.root
+        for component in components:
+            node = node.child(component)
+        node.settings = rules.settings_below(node.settings)
+        self._prefixes += 1
+
+    def settings_of(self, path: Optional[str]):  # pylint: disable=dont-use-primitives
+        """The settings of the path, the ones of its longest prefix in the table."""
+        if not path or not self._prefixes:
+            return self.root.settings
+        return self.root.deepest(path_components(path)).settings
+
+
+_PATH_RULES: Dict[Tuple[str, Tuple[PathRule, ...]], PathRules] = {}
+
+
+def path_rules_for(rules: Sequence[PathRule]):
+    """Return the compiled table, shared by the run, its prefixes being resolved once."""
+    key = (os.getcwd(), tuple(rules))
+    if key not in _PATH_RULES:
+        _PATH_RULES[key] = PathRules(key[1])
+    return _PATH_RULES[key]
+
+
+def configured_path_rules(linter: "PyLinter"):
+    """The compiled table of the ``calisthenics-path-rules`` option."""
+    return path_rules_for(getattr(linter.config, "calisthenics_path_rules", ()))  # pylint: disable=chain-of-method-calls
@@ -0,0 +1,135 @@
+"""Plugin wide options"""
+from typing import TYPE_CHECKING, Optional
+
+from pylint.checkers import BaseChecker
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+
+class PluginOptions(BaseChecker):
+    """
+    Holds the options shared by all the object calisthenics checkers.
+    It doesn't emit any message by itself.
+    """
+
+    name = "object-calisthenics"
+    options = (
+        (
+            "calisthenics-cache-dir", {
+                "default": "",
+                "type": "string",
+                "metavar": "<directory>",
+                "help": "Directory of the persistent result cache of the object "
+                        "calisthenics checkers. The cache is disabled when empty.",
+            },
+        ),
+        (
+            "calisthenics-cache-max-entries", {
+                "default": 100000,
+                "type": "int",
+                "metavar": "<int>",
+                "help": "Max amount of entries kept in the result cache, the least "
+                        "recently used entries are evicted first.",
+            },
+        ),
+        (
+            "calisthenics-instrumentation-report", {
+                "default": "",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "Write the calls, wall time and recursion depth of every "
+                        "object calisthenics checker callback to this json file. "
+                        "The checkers aren't instrumented when empty.",
+            },
+        ),
+        (
+            "calisthenics-latency-report", {
+                "default": "",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "Write the time the object calisthenics checkers spent in every "
+                        "file, with its nodes and lines, to this json file, along with the "
+                        "p50, p95 and p99 latencies, a histogram of the latencies and the "
+                        "slowest files. No report is written when empty.",
+            },
+        ),
+        (
+            "calisthenics-latency-top", {
+                "default": 10,
+                "type": "int",
+                "metavar": "<int>",
+                "help": "Amount of slowest files listed by the latency report.",
+            },
+        ),
+        (
+            "calisthenics-class-index", {
+                "default": "",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "Write the line span, instance variables, collections and untyped "
+                        "instance variables of every checked class to this columnar, "
+                        "memory mappable index. No index is written when empty.",
+            },
+        ),
+        (
+            "calisthenics-backend", {
+                "default": "astroid",
+                "type": "choice",
+                "choices": ["astroid", "ast"],
+                "metavar": "<astroid or ast>",
+                "help": "Tree the standalone runner checks files with. The ast backend "
+                        "runs the same rules over the stdlib ast module, files with "
+                        "pylint pragmas are still checked with astroid. Pylint itself "
+                        "always uses astroid.",
+            },
+        ),
+        (
+            "calisthenics-low-memory", {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Make the standalone runner build and check the modules one "
+                        "top-level definition at a time, releasing every definition before "
+                        "building the next one. Files with pylint pragmas are still built "
+                        "whole. Pylint itself always builds whole modules.",
+            },
+        ),
+        (
+            "calisthenics-diff", {
+                "default": "",
+                "type": "string",
+                "metavar": "<revision range>",
+                "help": "Make the standalone runner only build and check the functions, "
+                        "classes and top-level statements changed by the git diff of this "
+                        "revision range, like origin/main...HEAD, a single revision being "
+                        "compared with the working tree. Files the diff doesn't touch aren't "
+                        "checked. Every file is checked whole when empty.",
+            },
+        ),
+        (
+            "calisthenics-baseline", {
+                "default": "",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "Baseline file of the known violations, whose messages aren't "
+                        "added, written by --output-format=calisthenics-baseline:<file>. "
+                        "Every message is added when empty.",
+            },
+        ),
+        (
+            "calisthenics-path-rules", {
+                "default": (),
+                "type": "csv",
+                "metavar": "<path prefix:option=value>",
+                "help": "Options of the object calisthenics checkers that only apply "
+                        "under a path prefix, like legacy/:max-class-lines=300, or "
+                        "messages disabled under it, like tests/:disable=W9006. List "
+                        "values are separated by spaces, and the longest matching "
+                        "prefix wins.",
+            },
+        ),
+    )
+
+    def __init__(self, linter: Optional["PyLinter"] = None):
+        super().__init__(linter)
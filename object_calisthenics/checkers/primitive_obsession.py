@@ -1,54 +1,37 @@
 """Primitive Obsession checker"""
-from typing import TYPE_CHECKING, Optional, Union, Sequence
+import argparse
+from typing import TYPE_CHECKING, Optional
 from astroid import nodes
-from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.annotation_classifier import AnnotationClassifier, classifier_for
+from object_calisthenics.checkers.annotation_keys import AnnotationKeys
+from object_calisthenics.checkers.calisthenics_checker import CalisthenicsChecker
+from object_calisthenics.checkers.declarations import (DEFAULT_ALIASES, DEFAULT_PRIMITIVES,
+                                                       PRIMITIVE_OBSESSION)
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
 
 
-class PrimitiveObsession(BaseChecker):
+class PrimitiveObsession(CalisthenicsChecker):
+    # pylint: disable=chain-of-method-calls
     """A class for checking that functions have only typed arguments with custom types."""
 
-    name = "primitive-obsession"
-    msgs = {
-        "W9003": (
-            "A function argument can't be of a primitive type.",
-            "dont-use-primitives",
-            "A function argument should be of a custom type."
-        )
-    }
-
-    primitives = ['str', 'int', 'float', 'bool', 'bytes', 'bytearray']
+    name = PRIMITIVE_OBSESSION.name
+    msgs = PRIMITIVE_OBSESSION.msgs
+    options = PRIMITIVE_OBSESSION.options
 
     def __init__(self, linter: Optional["PyLinter"] = None):
         super().__init__(linter)
+        self._classifier: AnnotationClassifier = classifier_for(DEFAULT_PRIMITIVES,
+                                                                DEFAULT_ALIASES)
 
-    @staticmethod
-    def _is_annotated(annotation: nodes.Name):
-        if annotation:
-            return True
-        return False
-
-    def _is_primitive(self, annotation: nodes.Name):
-        is_annotated = self._is_annotated(annotation)
-        if is_annotated and annotation.name in self.primitives:
-            return True
-        return False
-
-    def _sequence_of_types_contains_primitive(self, types: Sequence[nodes.Name]):
-        return any(self._contains_primitive(a_type) for a_type in types)
+    def _recursive_helpers(self):
+        return ((AnnotationKeys, "of_astroid"),)
 
-    def _contains_primitive(self, node: Union[nodes.Name, nodes.Subscript, nodes.Tuple]):
-        if node is None or node == []:
-            return True  # Un annotated args are considered primitives.
-        if isinstance(node, nodes.Name):
-            return self._is_primitive(node)
-        if isinstance(node, nodes.Subscript):
-            return self._contains_primitive(node.slice)
-        if isinstance(node, nodes.Tuple):
-            return self._sequence_of_types_contains_primitive(node.elts)
-        return False
+    def _configure(self, config: argparse.Namespace):
+        """Use the classifier of the configured primitives and aliases."""
+        self._classifier = classifier_for(config.primitive_types, config.primitive_aliases)
 
     @staticmethod
     def _clean_annotations(args: nodes.Arguments):
@@ -62,6 +45,7 @@ class PrimitiveObsession(BaseChecker):
         non-primitive types
         """
         annotations = self._clean_annotations(node.args)
-        has_primitives = any(self._contains_primitive(annotation) for annotation in annotations)
+        has_primitives = any(self._classifier.is_primitive(annotation)
+                             for annotation in annotations)
         if has_primitives:
             self.add_message("W9003", node=node)
@@ -0,0 +1,184 @@
+"""Persistent, content hashed cache of the checkers results"""
+import hashlib
+import json
+import os
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from astroid import nodes
+
+from object_calisthenics import __version__
+from object_calisthenics.checkers.message_location import MessageLocation
+
+CACHE_FORMAT = 1
+
+
+class CacheKey(str):
+    """The key of a single cache entry"""
+
+
+class ContentHash(str):
+    """The hash of a module source"""
+
+
+class CheckerSignature(str):
+    """Identifies a checker along with the option values it runs with"""
+
+
+class EntryCount(int):
+    """An amount of cache entries"""
+
+
+class CachedMessage(NamedTuple):
+    """A message added by a checker, stored without its node."""
+    msgid: str
+    location: MessageLocation
+    args: object
+
+
+def _message_from_json(fields: List[object]):
+    msgid, location, args = fields
+    if isinstance(args, list):
+        args = tuple(args)
+    return CachedMessage(msgid, MessageLocation(*location), args)
+
+
+class CachedMessages:
+    """The messages a checker added for a single module."""
+
+    def __init__(self, messages: Optional[List[CachedMessage]] = None):
+        self._messages: List[CachedMessage] = messages or []
+
+    def __iter__(self) -> Iterator[CachedMessage]:
+        return iter(self._messages)
+
+    def append(self, message: CachedMessage):
+        """Add a message to the collection."""
+        self._messages.append(message)  # pylint: disable=chain-of-method-calls
+
+    def to_json(self):
+        """Serialize the messages to a json document."""
+        return json.dumps(self._messages)
+
+
+def load_messages(path: Path):
+    """Read the messages stored in a cache entry."""
+    return CachedMessages([_message_from_json(fields) for fields in json.loads(path.read_bytes())])
+
+
+class ResultCache:
+    # pylint: disable=chain-of-method-calls
+    """
+    On-disk cache of the checkers results, one json file per entry.
+    Entries are touched when read, and once the cache grows above its max size
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: Path, max_entries: EntryCount):
+        self._directory: Path = directory
+        self._max_entries: EntryCount = max_entries
+        self._entry_count: Optional[EntryCount] = None
+
+    def _entry_path(self, key: CacheKey):
+        return self._directory / key[:2] / f"{key}.json"
+
+    def _entries(self):
+        return list(self._directory.glob("*/*.json"))
+
+    def load(self, key: CacheKey):
+        """Return the cached messages of an entry, or None if the entry is missing."""
+        path = self._entry_path(key)
+        try:
+            messages = load_messages(path)
+            os.utime(path)
+        except (OSError, ValueError, TypeError):
+            path.unlink(missing_ok=True)
+            return None
+        return messages
+
+    def store(self, key: CacheKey, messages: CachedMessages):
+        """Atomically write an entry, evicting old entries when the cache is full."""
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as entry:
+            entry.write(messages.to_json())
+        os.replace(entry.name, path)
+        self._count_new_entry()
+
+    def _count_new_entry(self):
+        if self._entry_count is None:
+            self._entry_count = EntryCount(len(self._entries()))
+        self._entry_count = EntryCount(self._entry_count + 1)
+        if self._entry_count > self._max_entries:
+            self._evict()
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        keep = self._max_entries * 9 // 10
+        for entry in entries[:max(len(entries) - keep, 0)]:
+            entry.unlink(missing_ok=True)
+        self._entry_count = EntryCount(min(len(entries), keep))
+
+    def clear(self):
+        """Remove every entry of the cache."""
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+        self._entry_count = EntryCount(0)
+
+
+class ModuleResults:
+    # pylint: disable=chain-of-method-calls
+    """The cache entry of the module a checker is currently checking."""
+
+    def __init__(self, cache: ResultCache, key: CacheKey):
+        self._cache: ResultCache = cache
+        self._key: CacheKey = key
+        self.cached: Optional[CachedMessages] = cache.load(key)
+        self._recorded: CachedMessages = CachedMessages()
+
+    def record(self, message: CachedMessage):
+        """Record a message added while checking the module."""
+        self._recorded.append(message)
+
+    def store(self):
+        """Store the recorded messages, unless the module was replayed from the cache."""
+        if self.cached is None:
+            self._cache.store(self._key, self._recorded)
+
+
+_CACHES: Dict[Path, ResultCache] = {}
+
+
+def result_cache_for(directory: Path, max_entries: EntryCount):
+    """Return the cache stored in the directory, shared by all the checkers."""
+    directory = directory.resolve()
+    if directory not in _CACHES:
+        _CACHES[directory] = ResultCache(directory, max_entries)
+    return _CACHES[directory]
+
+
+def cache_key(content_hash: ContentHash, signature: CheckerSignature):
+    """Build the cache key of a module checked by a checker with the given options."""
+    key = f"{CACHE_FORMAT}:{__version__}:{signature}:{content_hash}"
+    return CacheKey(hashlib.sha256(key.encode()).hexdigest())
+
+
+_CONTENT_HASHES: "weakref.WeakKeyDictionary[nodes.Module, Optional[ContentHash]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _hash_content(module: nodes.Module):
+    stream = module.stream()
+    if stream is None:
+        return None
+    with stream:
+        return ContentHash(hashlib.sha256(stream.read()).hexdigest())
+
+
+def module_content_hash(module: nodes.Module):
+    """Return the hash of the module source, or None when the source isn't available."""
+    if module not in _CONTENT_HASHES:
+        _CONTENT_HASHES[module] = _hash_content(module)
+    return _CONTENT_HASHES[module]
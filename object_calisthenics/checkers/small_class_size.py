@@ -1,46 +1,59 @@
 """Small Class Size checker"""
+import argparse
 from typing import TYPE_CHECKING, Optional
 from astroid import nodes
-from pylint.checkers import BaseChecker
+
+from object_calisthenics.checkers.class_index import IndexedClassChecker
+from object_calisthenics.checkers.class_lines import (LINE_KINDS, ClassSizes, LineKinds,
+                                                      LineNumber, module_excluded_lines)
+from object_calisthenics.checkers.declarations import SMALL_CLASS_SIZE
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
 
 
-class SmallClassSize(BaseChecker):
+class SmallClassSize(IndexedClassChecker):
+    # pylint: disable=chain-of-method-calls
     """
     A class for checking that a class doesn't exceed a predefined
     number of lines.
+    The lines of a class are counted from its first to its last line, leaving out
+    the lines of its nested classes and the excluded kinds of lines.
     """
 
-    name = "small-class-size"
-    msgs = {
-        "W9007": (
-            "A class exceeds the amount of allowed lines.",
-            "class-too-large",
-            "The class has too many lines. Current lines: %s, max allowed: %s"
-        )
-    }
-
-    options = (
-        (
-            "max-class-lines", {
-                "default": 150,
-                "type": "int",
-                "help": "Max allowed lines in class",
-            },
-        ),
-    )
+    name = SMALL_CLASS_SIZE.name
+    msgs = SMALL_CLASS_SIZE.msgs
+    options = SMALL_CLASS_SIZE.options
 
     def __init__(self, linter: Optional["PyLinter"] = None):
         super().__init__(linter)
+        self._excluded_kinds: LineKinds = frozenset()
+        self._class_sizes: ClassSizes = ClassSizes()
+
+    def _configure(self, config: argparse.Namespace):
+        """Read the kinds of lines that don't count."""
+        excluded = getattr(config, "class_lines_exclude", ())
+        self._excluded_kinds = frozenset(excluded).intersection(LINE_KINDS)
+
+    def visit_module(self, node: nodes.Module):
+        """Find the excluded lines of the module, from its tokens."""
+        super().visit_module(node)
+        self._class_sizes = ClassSizes()
+        if not self._replaying:
+            self._class_sizes = ClassSizes(module_excluded_lines(node, self._excluded_kinds))
+
+    def visit_classdef(self, node: nodes.ClassDef):
+        """Start counting the lines of the nested classes."""
+        super().visit_classdef(node)
+        self._class_sizes.enter()
 
     def leave_classdef(self, node: nodes.ClassDef):
         """
         Check that the amount of lines in the class doesn't exceed max
         allowed lines.
         """
-        max_lines_in_class = node.end_lineno
-        max_allowed_lines = self.linter.config.max_class_lines  # pylint: disable=chain-of-method-calls
-        if max_lines_in_class > max_allowed_lines:
-            self.add_message("W9007", node=node, args=(max_lines_in_class, max_allowed_lines))
+        lines_in_class = self._class_sizes.leave(LineNumber(node.fromlineno),
+                                                 LineNumber(node.end_lineno))
+        max_allowed_lines = self._options().max_class_lines
+        if lines_in_class > max_allowed_lines:
+            self.add_message("W9007", node=node, args=(lines_in_class, max_allowed_lines))
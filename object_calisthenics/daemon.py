@@ -0,0 +1,324 @@
+"""
+Long lived daemon of the object calisthenics checkers, for editors checking on save.
+
+The daemon builds its linter and checkers once, checks the files when it starts and
+keeps the messages of the most recently used modules in memory. When the watcher
+reports that files changed, only those modules are checked again: the rules only
+depend on the module being checked, so the modules importing it keep their messages.
+
+Clients ask for the messages of files through a Unix socket, sending a line of json
+and getting a line of json back. The messages of a file that isn't known, or whose
+modification time or size isn't the cached one, are checked on demand.
+
+Start it with ``python -m object_calisthenics.daemon --socket=<path> [options] <paths>``,
+taking the options of the standalone runner, the directories being always searched
+recursively, and query it with
+``python -m object_calisthenics.daemon --socket=<path> --check <files>``.
+"""
+import argparse
+import collections
+import json
+import os
+import selectors
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import (BinaryIO, Dict, Iterable, List, NamedTuple, Optional,
+                    OrderedDict, Sequence, Union)
+
+from pylint.reporters import JSONReporter
+
+from object_calisthenics.parallel import Worker
+from object_calisthenics.reporters.violation_records import ViolationRecord
+from object_calisthenics.runner import (CalisthenicsRun, CommandLine, CommandLineError, Paths,
+                                        build_run)
+from object_calisthenics.watcher import (FileStamp, InotifyWatcher, PollingWatcher, Seconds,
+                                         file_stamp, watcher_for)
+
+Arguments = Optional[Sequence[str]]
+Request = Dict[str, object]
+Response = Dict[str, object]
+Watcher = Union[InotifyWatcher, PollingWatcher]
+PathName = Union[str, Path]
+
+DEFAULT_MAX_MODULES = 10000
+REQUEST_TIMEOUT = 5.0
+
+
+class ModuleCount(int):
+    """An amount of modules"""
+
+
+class CheckedModule(NamedTuple):
+    """
+    The records of the messages of a module, along with the stamp of the file they
+    were added for. The records don't keep the module tree nor repeat its strings.
+    """
+    stamp: Optional[FileStamp]
+    messages: List[ViolationRecord]
+
+
+class ResultLru:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """The checked modules, the least recently used evicted first once there are too many."""
+
+    def __init__(self, max_modules: ModuleCount):
+        self._modules: OrderedDict[Path, CheckedModule] = collections.OrderedDict()
+        self._max_modules: ModuleCount = max_modules
+
+    def __len__(self):
+        return len(self._modules)
+
+    def get(self, path: Path, stamp: Optional[FileStamp]):
+        """The module checked for the file, None when it isn't cached for this stamp."""
+        module = self._modules.get(path)
+        if module is None or module.stamp != stamp:
+            return None
+        self._modules.move_to_end(path)
+        return module
+
+    def put(self, path: Path, module: CheckedModule):
+        """Keep a checked module, evicting the least recently used ones."""
+        self._modules[path] = module
+        self._modules.move_to_end(path)
+        while len(self._modules) > self._max_modules:
+            self._modules.popitem(last=False)
+
+    def discard(self, path: Path):
+        """Forget the module of a file."""
+        self._modules.pop(path, None)
+
+
+class DaemonStats:
+    """The counters of the daemon, answered to the ``stats`` command."""
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.checked: int = 0
+        self.changes: int = 0
+
+    def add_checked(self, modules: ModuleCount):
+        """Count the modules that were just checked."""
+        self.checked += modules
+
+    def to_json(self, modules: ModuleCount):
+        """The counters as sent to the clients."""
+        return {"modules": modules, "hits": self.hits, "misses": self.misses,
+                "checked": self.checked, "changes": self.changes}
+
+
+def _absolute(path: PathName):
+    return Path(os.path.abspath(path))  # pylint: disable=chain-of-method-calls
+
+
+class Daemon:
+    # pylint: disable=chain-of-method-calls
+    """Checks the changed modules and answers the requests of the clients."""
+
+    def __init__(self, run: CalisthenicsRun, roots: Paths, watcher: Watcher,
+                 modules: ResultLru):
+        self._run: CalisthenicsRun = run
+        self._worker: Worker = Worker(run, roots)
+        self._watcher: Watcher = watcher
+        self._modules: ResultLru = modules
+        self.stats: DaemonStats = DaemonStats()
+        self._running: bool = False
+        self._last_poll: float = time.monotonic()
+
+    def _store(self, path: PathName, stamp: Optional[FileStamp],
+               messages: List[ViolationRecord]):
+        self._modules.put(_absolute(path), CheckedModule(stamp, messages))
+
+    def check(self, paths: Iterable[Path]):
+        """Check the files and directories, keeping the messages of their modules."""
+        items = list(self._run.file_items([str(path) for path in paths]))
+        stamps = {item.filepath: file_stamp(Path(item.filepath)) for item in items}
+        checked = self._worker.check_chunk(items)
+        self.stats.add_checked(ModuleCount(len(checked.files)))
+        for checked_file in checked.files:
+            self._store(checked_file.filepath, stamps.get(checked_file.filepath),
+                        checked_file.messages)
+
+    def messages_of(self, path: Path):
+        """The message records of a file, checked again if it changed since it was cached."""
+        stamp = file_stamp(path)
+        module = self._modules.get(path, stamp)
+        if module is not None:
+            self.stats.hits += 1
+        if module is None and stamp is not None:
+            self.stats.misses += 1
+            self.check([path])
+            module = self._modules.get(path, stamp)
+        return module.messages if module else []
+
+    def apply_changes(self):
+        """
+        Check the modules of the changed files again, unless they were already checked
+        for their current stamp, and forget the removed ones.
+        """
+        changed = {_absolute(path) for path in self._watcher.changes()}
+        self.stats.changes += len(changed)
+        stamps = {path: file_stamp(path) for path in changed}
+        for path in (path for path, stamp in stamps.items() if stamp is None):
+            self._modules.discard(path)
+        stale = sorted(path for path, stamp in stamps.items()
+                       if stamp is not None and self._modules.get(path, stamp) is None)
+        if stale:
+            self.check(stale)
+
+    def _check_request(self, query: Request):
+        paths = [_absolute(path) for path in query.get("paths", [])]
+        return {"messages": [JSONReporter.serialize(record.to_message())
+                             for path in paths for record in self.messages_of(path)]}
+
+    def _stats_request(self, _: Request):
+        return self.stats.to_json(ModuleCount(len(self._modules)))
+
+    def _shutdown_request(self, _: Request):
+        self._running = False
+        return {"stopping": True}
+
+    def handle(self, query: Request):
+        """Answer a request of a client."""
+        handler = _HANDLERS.get(str(query.get("command")))
+        if handler is None:
+            return {"error": f"Unknown command: {query.get('command')}"}
+        return handler(self, query)
+
+    def _serve_connection(self, connection: socket.socket):
+        connection.settimeout(REQUEST_TIMEOUT)
+        with connection, connection.makefile("rwb") as stream:
+            stream.write(json.dumps(self.handle(read_message(stream))).encode() + b"\n")
+
+    def _accept(self, server: socket.socket):
+        try:
+            self._serve_connection(server.accept()[0])
+        except OSError:
+            return
+
+    def _poll(self):
+        due = self._watcher.timeout is not None and \
+            time.monotonic() - self._last_poll >= self._watcher.timeout
+        if due:
+            self._last_poll = time.monotonic()
+            self.apply_changes()
+
+    def _dispatch(self, selector: selectors.BaseSelector):
+        for key, _ in selector.select(self._watcher.timeout):
+            key.data(key.fileobj)
+        self._poll()
+
+    def _serve(self, selector: selectors.BaseSelector):
+        self._running = True
+        while self._running:
+            self._dispatch(selector)
+
+    def _register_watcher(self, selector: selectors.BaseSelector):
+        if self._watcher.fileno() is not None:
+            selector.register(self._watcher.fileno(), selectors.EVENT_READ,
+                              lambda _: self.apply_changes())
+
+    def serve(self, socket_path: Path):
+        """Answer the clients until one of them asks for a shutdown."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server, \
+                selectors.DefaultSelector() as selector:
+            socket_path.unlink(missing_ok=True)
+            server.bind(str(socket_path))
+            server.listen()
+            selector.register(server, selectors.EVENT_READ, self._accept)
+            self._register_watcher(selector)
+            self._serve(selector)
+        socket_path.unlink(missing_ok=True)
+        self._watcher.close()
+
+
+_HANDLERS = {
+    "check": Daemon._check_request,  # pylint: disable=protected-access
+    "stats": Daemon._stats_request,  # pylint: disable=protected-access
+    "shutdown": Daemon._shutdown_request,  # pylint: disable=protected-access
+}
+
+
+def read_message(stream: BinaryIO) -> Request:
+    """Read a line of json, an empty request when it isn't valid json."""
+    try:
+        message = json.loads(stream.readline())
+    except ValueError:
+        return {}
+    return message if isinstance(message, dict) else {}
+
+
+def _connected(socket_path: Path):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(str(socket_path))
+    return client
+
+
+def request(socket_path: Path, message: Request):
+    """Send a request to the daemon listening on the socket and return its response."""
+    with _connected(socket_path) as client, client.makefile("rwb") as stream:
+        stream.write(json.dumps(message).encode() + b"\n")
+        stream.flush()
+        return read_message(stream)
+
+
+def _parser():
+    parser = argparse.ArgumentParser(description=__doc__, add_help=False,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", type=Path, required=True, help="Unix socket path")
+    parser.add_argument("--max-modules", type=int, default=DEFAULT_MAX_MODULES,
+                        help="Modules whose messages are kept in memory")
+    parser.add_argument("--poll-interval", type=float, default=1.0,
+                        help="Seconds between two scans when polling the files")
+    parser.add_argument("--polling", action="store_true", help="Poll instead of using inotify")
+    parser.add_argument("--check", nargs="+", help="Print the messages of files and exit")
+    parser.add_argument("--stats", action="store_true", help="Print the counters and exit")
+    parser.add_argument("--shutdown", action="store_true", help="Stop the daemon and exit")
+    return parser
+
+
+def _print_messages(response: Response):
+    for message in response.get("messages", []):
+        print(f"{message['path']}:{message['line']}:{message['column']}: "
+              f"{message['message-id']}: {message['message']} ({message['symbol']})")
+    return 1 if response.get("messages") else 0
+
+
+def _client(args: argparse.Namespace):
+    if args.check:
+        return _print_messages(request(args.socket, {
+            "command": "check", "paths": [str(_absolute(path)) for path in args.check]}))
+    print(json.dumps(request(args.socket, {"command": "stats" if args.stats else "shutdown"})))
+    return 0
+
+
+def serve(args: argparse.Namespace, argv: CommandLine):
+    """Build the checkers from the runner options, check the paths and serve the clients."""
+    try:
+        run, paths = build_run(["--recursive=y", *argv])
+    except CommandLineError as error:
+        print(error, file=sys.stderr)
+        return 32
+    if not paths:
+        _parser().print_help()
+        return 32
+    roots = [_absolute(path) for path in paths]
+    daemon = Daemon(run, paths, watcher_for(roots, Seconds(args.poll_interval), args.polling),
+                    ResultLru(ModuleCount(args.max_modules)))
+    daemon.check(roots)
+    daemon.serve(args.socket)
+    return 0
+
+
+def main(argv: Arguments = None):
+    """Entry point of ``python -m object_calisthenics.daemon``."""
+    args, rest = _parser().parse_known_args(sys.argv[1:] if argv is None else argv)
+    if args.check or args.stats or args.shutdown:
+        return _client(args)
+    return serve(args, rest)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
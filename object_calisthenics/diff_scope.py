@@ -0,0 +1,186 @@
+"""
+Checks scoped to the lines a git diff changed, for reviews of large changes.
+
+The diff of a revision range is read from git with no context lines, and the lines it
+added or modified in every file are kept in an interval index: sorted, disjoint line
+ranges searched by bisection. The walk of a module then skips the functions and
+classes, and the top-level statements, that don't overlap a changed line, so only the
+definitions the change touched get their messages. A definition enclosing a changed
+definition overlaps its lines as well, and is checked along with it.
+"""
+import bisect
+import os
+import re
+import subprocess
+from array import array
+from typing import Callable, DefaultDict, Dict, Iterable, List, NamedTuple, Optional
+
+from astroid import nodes
+from pylint.utils import ASTWalker
+
+from object_calisthenics.checkers.class_lines import LineNumber
+
+DiffText = str
+RevisionRange = str
+WalkerEvents = DefaultDict[str, List[Callable[[nodes.NodeNG], None]]]
+
+_NEW_FILE = re.compile(r"^\+\+\+ (?:b/(?P<path>.*)|/dev/null)$")
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(?P<first>\d+)(?:,(?P<count>\d+))? @@")
+
+
+class DiffError(Exception):
+    """The diff of the revision range couldn't be read from git."""
+
+
+class LineRange(NamedTuple):
+    """The first and last lines of a run of lines, both included."""
+    first: LineNumber
+    last: LineNumber
+
+
+def hunk_range(first: LineNumber, count: LineNumber):
+    """
+    The lines of a file a hunk added, the line before a removal when it only removed
+    lines, so that the definition the lines were removed from counts as changed.
+    """
+    if not count:
+        return LineRange(LineNumber(max(first, 1)), LineNumber(max(first, 1)))
+    return LineRange(first, LineNumber(first + count - 1))
+
+
+class ChangedLines:
+    # pylint: disable=chain-of-method-calls
+    """The changed lines of a file, as sorted and disjoint ranges searched by bisection."""
+
+    def __init__(self, ranges: Iterable[LineRange]):
+        self._firsts: array = array("Q")
+        self._lasts: array = array("Q")
+        for line_range in sorted(ranges):
+            self._add(line_range)
+
+    def _add(self, line_range: LineRange):
+        if self._lasts and line_range.first <= self._lasts[-1] + 1:
+            self._lasts[-1] = max(self._lasts[-1], line_range.last)
+            return
+        self._firsts.append(line_range.first)
+        self._lasts.append(line_range.last)
+
+    def __len__(self):
+        return len(self._firsts)
+
+    def overlaps(self, first: LineNumber, last: LineNumber):
+        """Whether any line from the first to the last one changed."""
+        index = bisect.bisect_right(self._firsts, last) - 1
+        return index >= 0 and self._lasts[index] >= first
+
+
+class DiffParser:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """Collects the changed line ranges of every file of a diff, a line at a time."""
+
+    def __init__(self):
+        self._path: Optional[str] = None
+        self._ranges: Dict[str, List[LineRange]] = {}
+
+    def _add_hunk(self, hunk: re.Match):
+        count = hunk.group("count")
+        self._ranges[self._path].append(hunk_range(
+            LineNumber(hunk.group("first")), LineNumber(1 if count is None else count)))
+
+    def add_line(self, line: DiffText):
+        """Read a line of the diff, a file header or a hunk header."""
+        new_file = _NEW_FILE.match(line)
+        if new_file:
+            self._path = new_file.group("path")
+            self._ranges.setdefault(self._path, [])
+        hunk = _HUNK.match(line)
+        if hunk and self._path is not None:
+            self._add_hunk(hunk)
+
+    def changed_files(self, root: str):  # pylint: disable=dont-use-primitives
+        """The changed lines of every file still there after the diff, by real path."""
+        return {os.path.realpath(os.path.join(root, path)): ChangedLines(ranges)
+                for path, ranges in self._ranges.items() if path is not None}
+
+
+def parse_diff(diff: DiffText, root: str):  # pylint: disable=dont-use-primitives
+    """The changed lines of every file of a diff with no context lines."""
+    parser = DiffParser()
+    for line in diff.splitlines():
+        parser.add_line(line)
+    return parser.changed_files(root)
+
+
+def _git(*arguments: str):
+    try:
+        completed = subprocess.run(["git", "-c", "core.quotePath=false", *arguments],
+                                   capture_output=True, check=True, text=True)
+    except (OSError, subprocess.CalledProcessError) as error:
+        raise DiffError(f"git {' '.join(arguments)} failed: "
+                        f"{getattr(error, 'stderr', None) or error}") from error
+    return completed.stdout
+
+
+class DiffScope:
+    # pylint: disable=chain-of-method-calls
+    """The changed lines of the files of a git diff, the other files being out of scope."""
+
+    def __init__(self, files: Dict[str, ChangedLines]):  # pylint: disable=dont-use-primitives
+        self._files: Dict[str, ChangedLines] = files
+
+    def __contains__(self, path: str):  # pylint: disable=dont-use-primitives
+        return os.path.realpath(path) in self._files
+
+    def changed_lines(self, path: str):  # pylint: disable=dont-use-primitives
+        """The changed lines of a file, none when the diff doesn't touch it."""
+        return self._files.get(os.path.realpath(path), ChangedLines(()))
+
+
+def diff_scope(revisions: RevisionRange):
+    """
+    The changed lines of the revision range, read from the git repository of the
+    working directory. A single revision is compared with the working tree.
+    """
+    root = _git("rev-parse", "--show-toplevel").strip()
+    diff = _git("-C", root, "diff", "--unified=0", "--no-color", "--no-ext-diff",
+                revisions, "--", "*.py")
+    return DiffScope(parse_diff(diff, root))
+
+
+_DEFINITIONS = (nodes.FunctionDef, nodes.ClassDef)
+
+
+def _is_scoped(node: nodes.NodeNG):
+    return isinstance(node, _DEFINITIONS) or \
+        (node.is_statement and isinstance(node.parent, nodes.Module))
+
+
+def _first_line(node: nodes.NodeNG):
+    decorators = getattr(node, "decorators", None)
+    return LineNumber(decorators.fromlineno if decorators else node.fromlineno)
+
+
+class ScopedWalker(ASTWalker):  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    Walks the definitions and the top-level statements overlapping the changed lines
+    of a file, skipping the other ones along with everything below them.
+    """
+
+    def __init__(self, walker: ASTWalker, changed: ChangedLines):
+        super().__init__(walker.linter)
+        self.visit_events: WalkerEvents = walker.visit_events
+        self.leave_events: WalkerEvents = walker.leave_events
+        self.nbstatements: int = walker.nbstatements
+        self._changed: ChangedLines = changed
+
+    def covers(self, first: LineNumber, last: LineNumber):
+        """Whether any line from the first to the last one is walked."""
+        return self._changed.overlaps(first, last)
+
+    def walk(self, astroid: nodes.NodeNG):
+        """Walk the node unless it is a definition or a top-level statement left unchanged."""
+        if _is_scoped(astroid) and not self.covers(_first_line(astroid),
+                                                   LineNumber(astroid.tolineno)):
+            return
+        super().walk(astroid)
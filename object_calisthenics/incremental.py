@@ -0,0 +1,298 @@
+"""
+Incremental checks of unsaved editor buffers, checking again only the edited definitions.
+
+An editor hands the new text of a buffer to ``EditorSession.edit``, along with the lines
+of the new text it changed, and asks for its messages with ``EditorSession.check``. The
+buffer is split into the segments of ``low_memory``, every top-level definition being a
+segment of its own, and the messages of every segment are kept by its source. A segment
+whose source is known and that no edit touched gets its messages back, moved to the
+lines it is on now, without being built. Only the other segments are built and walked,
+between the events of a module standing for the buffer, the type aliases of the whole
+buffer being collected beforehand from its stdlib ast.
+
+The whole buffer is checked the first time, when an edit touched a top-level statement
+that isn't a definition, like an import the definitions may use, and when the buffer
+has pylint pragmas, whose scopes are computed on the tree of the whole module. A buffer
+that doesn't parse keeps the messages of its last check.
+
+The edits may come from another thread than the checks: a check of a buffer edited
+again while it runs stops at the next definition it would walk, and ``check`` returns
+None, the newer text being checked by the next call.
+"""
+# The session drives the linter the same way the runner does, which goes through a few
+# protected PyLinter members of the pinned pylint version.
+# pylint: disable=protected-access
+import ast
+import bisect
+import contextlib
+import functools
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from astroid import MANAGER
+from astroid.builder import AstroidBuilder
+from pylint.lint import PyLinter
+from pylint.typing import FileItem
+from pylint.utils import ASTWalker, FileState
+from pylint.utils.pragma_parser import OPTION_PO
+
+from object_calisthenics.checkers.class_lines import LineNumber
+from object_calisthenics.checkers.message_location import module_name
+from object_calisthenics.checkers.module_aliases import ast_module_aliases
+from object_calisthenics.diff_scope import ChangedLines, LineRange, ScopedWalker
+from object_calisthenics.low_memory import (ModuleFile, Segment, Source, top_level_statement,
+                                           tree_segments, walk_segments)
+from object_calisthenics.reporters.violation_records import RecordingReporter, ViolationRecord
+from object_calisthenics.runner import CommandLine, CommandLineError, build_linter
+
+Records = List[ViolationRecord]
+Version = int
+ModuleCheck = Callable[..., Optional[bool]]
+
+EVERY_LINE = LineRange(LineNumber(1), LineNumber(2 ** 63))
+
+
+class CheckCancelled(Exception):
+    """The buffer being checked was edited again, so its check is stale."""
+
+
+def definition_starts(tree: ast.Module):
+    """The first lines of the top-level definitions, their decorators included."""
+    return frozenset(statement.line for statement in map(top_level_statement, tree.body)
+                     if statement.starts_definition())
+
+
+class SegmentResult(NamedTuple):
+    """The messages of a segment, checked when it started at the first line."""
+    first: LineNumber
+    records: Records
+
+
+class SegmentResults:
+    # pylint: disable=chain-of-method-calls
+    """The messages of the segments of a buffer, by the source of the segments."""
+
+    def __init__(self, results: Optional[Dict[Source, SegmentResult]] = None):
+        self._results: Dict[Source, SegmentResult] = results or {}
+
+    def __contains__(self, segment: Segment):
+        return segment.source in self._results
+
+    def __len__(self):
+        return len(self._results)
+
+    def records_of(self, segment: Segment):
+        """The messages of a known segment, moved to the lines it is on now."""
+        result = self._results[segment.source]
+        if result.first == segment.first:
+            return result.records
+        return [record.moved(segment.first - result.first) for record in result.records]
+
+
+class CheckPlan(NamedTuple):
+    """The segments of a buffer to build and walk, the other ones having known messages."""
+    dirty: List[Segment]
+    whole: bool
+
+
+def check_plan(all_segments: List[Segment], definitions: Iterable[LineNumber],
+               known: SegmentResults, changed: ChangedLines):
+    """
+    Walk the segments whose messages aren't known or that an edit touched, and the
+    whole buffer when one of them isn't a definition or no message is known yet.
+    """
+    dirty = [segment for segment in all_segments if segment not in known or
+             changed.overlaps(segment.first, segment.last())]
+    whole = not known or not {segment.first for segment in dirty} <= set(definitions)
+    return CheckPlan(all_segments if whole else dirty, whole)
+
+
+class RecordBuckets:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """Sorts the messages of a walk into the walked segments they are on."""
+
+    def __init__(self, walked: List[Segment]):
+        self._firsts: List[LineNumber] = [segment.first for segment in walked]
+        self._segments: List[Segment] = walked
+        self.outside: Records = []
+        self.inside: Dict[LineNumber, Records] = {segment.first: [] for segment in walked}
+
+    def add(self, record: ViolationRecord):
+        """Add a message to its segment, or to the module when it isn't on one."""
+        index = bisect.bisect_right(self._firsts, record.line) - 1
+        if index < 0 or record.line > self._segments[index].last():
+            self.outside.append(record)
+            return
+        self.inside[self._firsts[index]].append(record)
+
+    def result_of(self, segment: Segment, known: SegmentResults):
+        """The messages of a segment, from the walk if it was walked or else the known ones."""
+        if segment.first in self.inside:
+            return SegmentResult(segment.first, self.inside[segment.first])
+        return SegmentResult(segment.first, known.records_of(segment))
+
+
+def checked_results(all_segments: List[Segment], plan: CheckPlan, known: SegmentResults,
+                    records: Records) -> Tuple[SegmentResults, Records]:
+    """The messages of every segment of the buffer, and all the messages of the buffer."""
+    buckets = RecordBuckets(plan.dirty)
+    for record in records:
+        buckets.add(record)
+    results = {segment.source: buckets.result_of(segment, known) for segment in all_segments}
+    return SegmentResults(results), buckets.outside + [
+        record for segment in all_segments for record in results[segment.source].records]
+
+
+class BufferEdit(NamedTuple):
+    """The text of a buffer at a version, with the lines changed since its last check."""
+    text: Source
+    changed: Tuple[LineRange, ...]
+    version: Version
+
+
+class Buffer:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """The latest text of a buffer, edited from any thread, and its last checked messages."""
+
+    def __init__(self, item: FileItem):
+        self.item: FileItem = item
+        self._lock: threading.Lock = threading.Lock()
+        self._edit: BufferEdit = BufferEdit("", (), 0)
+        self.segments: SegmentResults = SegmentResults()
+        self.records: Records = []
+
+    def edit(self, text: Source, changed: LineRange):
+        """Replace the text, making a running check of the previous one stale."""
+        with self._lock:
+            edit = self._edit
+            self._edit = BufferEdit(text, edit.changed + (changed,), edit.version + 1)
+            return self._edit.version
+
+    def latest(self):
+        """The latest text of the buffer."""
+        return self._edit
+
+    def is_stale(self, version: Version):  # pylint: disable=dont-use-primitives
+        """Whether the buffer was edited since the version."""
+        return self._edit.version != version
+
+    def checked(self, edit: BufferEdit, results: SegmentResults, records: Records):
+        """Keep the messages of a checked text, forgetting the changes they account for."""
+        with self._lock:
+            self._edit = self._edit._replace(changed=self._edit.changed[len(edit.changed):])
+            self.segments, self.records = results, records
+
+
+class CancellableWalker(ScopedWalker):  # pylint: disable=single-collection-instance-variable
+    """Walks the changed definitions, stopping once the buffer was edited again."""
+
+    def __init__(self, walker: ASTWalker, changed: ChangedLines,  # pylint: disable=dont-use-primitives
+                 stale: Callable[[], bool]):
+        super().__init__(walker, changed)
+        self._stale: Callable[[], bool] = stale
+
+    def covers(self, first: LineNumber, last: LineNumber):
+        """Whether any line from the first to the last one is walked, unless it is stale."""
+        if self._stale():
+            raise CheckCancelled()
+        return super().covers(first, last)
+
+
+class EditorSession:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    Checks the buffers of an editor with the checkers of a linter, which stay opened for
+    as long as the session lasts. The checks are meant to run on a single thread.
+    """
+
+    def __init__(self, linter: PyLinter):
+        self.linter: PyLinter = linter
+        self._buffers: Dict[str, Buffer] = {}
+        self._checking: contextlib.ExitStack = contextlib.ExitStack()
+        self._check_module: Optional[ModuleCheck] = None
+        linter.set_reporter(RecordingReporter())
+
+    def __enter__(self):
+        self.linter.initialize()
+        self._check_module = self._checking.enter_context(self.linter._astroid_module_checker())
+        return self
+
+    def __exit__(self, *_: object):
+        self._checking.close()
+
+    def _file_item(self, path: str):  # pylint: disable=dont-use-primitives
+        module = Path(path).stem
+        items = self.linter._iterate_file_descrs([path]) if os.path.isfile(path) else ()
+        return next(iter(items), FileItem(module, path, module))
+
+    def _buffer(self, path: str):  # pylint: disable=dont-use-primitives
+        path = os.path.abspath(path)
+        if path not in self._buffers:
+            self._buffers[path] = Buffer(self._file_item(path))
+        return self._buffers[path]
+
+    def edit(self, path: str, text: Source, changed: LineRange):  # pylint: disable=dont-use-primitives
+        """
+        Replace the text of a buffer, the changed lines being lines of the new text,
+        and return its version. It can be called while another thread checks it.
+        """
+        return self._buffer(path).edit(text, changed)
+
+    def check(self, path: str) -> Optional[Records]:  # pylint: disable=dont-use-primitives
+        """The messages of the latest text of a buffer, None when it was edited meanwhile."""
+        buffer = self._buffer(path)
+        edit = buffer.latest()
+        try:
+            tree = ast.parse(edit.text)
+        except (SyntaxError, ValueError):
+            return buffer.records
+        try:
+            buffer.checked(edit, *self._checked(buffer, edit, tree))
+        except CheckCancelled:
+            return None
+        return buffer.records
+
+    def _checked(self, buffer: Buffer, edit: BufferEdit, tree: ast.Module):
+        all_segments = tree_segments(edit.text, tree)
+        plan = check_plan(all_segments, definition_starts(tree), buffer.segments,
+                          ChangedLines(edit.changed))
+        ranges = [EVERY_LINE] if plan.whole else [
+            LineRange(segment.first, segment.last()) for segment in plan.dirty]
+        walker = CancellableWalker(self._check_module.keywords["walker"], ChangedLines(ranges),
+                                   functools.partial(buffer.is_stale, edit.version))
+        module_file = ModuleFile(buffer.item, ast_module_aliases(tree), edit.text)
+        walk = functools.partial(self._check_whole, buffer.item, edit.text) \
+            if plan.whole and OPTION_PO.search(edit.text) else \
+            functools.partial(walk_segments, module_file=module_file, all_segments=all_segments)
+        self._start_module(buffer.item)
+        walk(walker)
+        records = self.linter.reporter.records
+        self.linter.reporter.reset()
+        return checked_results(all_segments, plan, buffer.segments, records)
+
+    def _start_module(self, item: FileItem):
+        self.linter.reporter.reset()
+        self.linter.set_current_module(module_name(item), item.filepath)
+        self.linter.file_state = FileState(item.modpath, self.linter.msgs_store)
+
+    def _check_whole(self, item: FileItem, text: Source, walker: CancellableWalker):
+        """Check the tree of the whole buffer, which computes the scopes of its pragmas."""
+        module = AstroidBuilder(MANAGER).string_build(text, item.name, item.filepath)
+        MANAGER.astroid_cache.pop(module_name(item), None)
+        self.linter.file_state = FileState(item.modpath, self.linter.msgs_store, module)
+        self._check_module(module, walker=walker)
+
+
+def editor_session(argv: CommandLine):
+    """
+    Create an editor session with the checkers configured from the command line, as
+    the runner configures them. The result cache can't be used, since the definitions
+    left unchanged aren't walked.
+    """
+    linter, _ = build_linter(argv)
+    if linter.config.calisthenics_cache_dir:  # pylint: disable=chain-of-method-calls
+        raise CommandLineError("--calisthenics-cache-dir can't be used by an editor session: "
+                               "the messages of the unchanged definitions aren't computed")
+    return EditorSession(linter)
@@ -0,0 +1,360 @@
+"""
+Low memory mode of the standalone runner, for very large modules.
+
+A module is split into segments from its tokens, without building the astroid tree of
+the whole module: every top-level definition, along with its decorators, is a segment
+of its own, and the other top-level statements are grouped into segments of a hundred
+statements at most. The segments are built and walked one at a time, with the line
+numbers they have in the module, and every segment is released before the next one is
+built, so the memory taken by the trees is bounded by the largest definition rather
+than by the module.
+
+The checkers see a single module: the module events are sent for a module node
+without a body, standing for the whole file, and the segments are walked in between.
+The type aliases of the file are collected beforehand from its stdlib ast, so every
+segment resolves the imports of the whole file, as the tree of the whole module does.
+Files with pylint pragmas, whose scopes are computed on the tree of the whole module,
+and files that don't parse are left to the regular check.
+"""
+# Building the tree of a segment, and releasing it, goes through the same steps as
+# astroid's builder and manager, which are protected members of the pinned astroid version.
+# pylint: disable=protected-access
+import ast
+import importlib.util
+import io
+import itertools
+import os
+import re
+import tokenize
+from array import array
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from astroid import MANAGER, nodes
+from astroid._cache import CACHE_MANAGER
+from astroid.builder import AstroidBuilder, _parse_string
+from astroid.context import _invalidate_cache
+from astroid.rebuilder import TreeRebuilder
+from pylint.lint import PyLinter
+from pylint.typing import FileItem
+from pylint.utils import ASTWalker, FileState
+from pylint.utils.pragma_parser import OPTION_PO
+
+from object_calisthenics.checkers.annotation_keys import TypeAliases
+from object_calisthenics.checkers.class_lines import LineNumber
+from object_calisthenics.checkers.message_location import module_name
+from object_calisthenics.checkers.module_aliases import ast_module_aliases, share_module_aliases
+from object_calisthenics.diff_scope import ScopedWalker
+
+ModuleCheck = Callable[..., Optional[bool]]
+Source = str
+LineIndex = Union[int, slice]
+Lines = List[str]
+
+MAX_GROUPED_STATEMENTS = 100
+
+_DEFINITION_KEYWORDS = frozenset({"def", "class", "async", "@"})
+_DEPTH_CHANGES = {tokenize.INDENT: 1, tokenize.DEDENT: -1}
+_LAYOUT_TOKENS = frozenset({tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT, tokenize.INDENT,
+                            tokenize.DEDENT, tokenize.ENDMARKER, tokenize.ENCODING})
+_NEWLINE = re.compile("\n")
+_AST_DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+class CacheCount(int):
+    """An amount of registered caches"""
+
+
+class TopLevelStatement(NamedTuple):
+    """The first line and token of a statement at the top level of a module."""
+    line: LineNumber
+    first_token: str
+
+    def starts_definition(self):
+        """Whether the statement is a definition, or the decorator of one."""
+        return self.first_token in _DEFINITION_KEYWORDS
+
+    def is_decorator(self):
+        """Whether the statement decorates the next one."""
+        return self.first_token == "@"
+
+
+class TopLevelStatements:
+    """Finds the statements at the top level of a module, a token at a time."""
+
+    def __init__(self):
+        self._depth: int = 0
+        self._at_statement_start: bool = True
+
+    def add_token(self, token: tokenize.TokenInfo):
+        """The statement the token starts, None unless it starts a top-level one."""
+        self._depth += _DEPTH_CHANGES.get(token.type, 0)
+        is_layout = token.type in _LAYOUT_TOKENS
+        starts = self._at_statement_start and not self._depth and not is_layout
+        self._at_statement_start = token.type == tokenize.NEWLINE or \
+            (self._at_statement_start and is_layout)
+        return TopLevelStatement(LineNumber(token.start[0]), token.string) if starts else None
+
+    def statements(self, tokens: Iterable[tokenize.TokenInfo]) -> Iterator[TopLevelStatement]:
+        """The top-level statements of a module, from its tokens."""
+        return filter(None, map(self.add_token, tokens))
+
+
+class SegmentStarts:
+    """Decides which top-level statements start a segment, in the order of the module."""
+
+    def __init__(self):
+        self._previous: Optional[TopLevelStatement] = None
+        self._grouped: int = 0
+
+    def _starts_segment(self, statement: TopLevelStatement):
+        previous = self._previous
+        if previous is None:
+            return True
+        if previous.is_decorator():
+            return False
+        return statement.starts_definition() or previous.starts_definition() or \
+            self._grouped >= MAX_GROUPED_STATEMENTS
+
+    def add(self, statement: TopLevelStatement):
+        """Whether the statement starts a segment."""
+        starts = self._starts_segment(statement)
+        self._grouped = 1 if starts else self._grouped + 1
+        self._previous = statement
+        return starts
+
+    def lines(self, statements: Iterable[TopLevelStatement]):
+        """The first line of every segment of the top-level statements of a module."""
+        return [statement.line for statement in statements if self.add(statement)]
+
+
+def segment_starts(tokens: Iterable[tokenize.TokenInfo]):
+    """The first line of every segment of the module made of the tokens."""
+    return SegmentStarts().lines(TopLevelStatements().statements(tokens))
+
+
+class Segment(NamedTuple):
+    """A run of top-level statements, built and checked on its own."""
+    first: LineNumber
+    source: Source
+    holds_docstring: bool = False
+
+    def last(self):
+        """The last line of the segment, the one before the next segment starts."""
+        return LineNumber(self.first + self.source.count("\n") - self.source.endswith("\n"))  # pylint: disable=chain-of-method-calls
+
+
+class SourceLines:
+    """The lines of a source, found from the offsets they start at."""
+
+    def __init__(self, source: Source):
+        self._source: Source = source
+        self._starts: array = array("Q", itertools.chain(
+            (0,), (match.end() for match in _NEWLINE.finditer(source))))
+
+    def segment(self, first: LineNumber, following: Optional[LineNumber]):
+        """The segment from the first line up to the following segment, or the end."""
+        end = self._starts[following - 1] if following else len(self._source)
+        return Segment(first, self._source[self._starts[first - 1]:end])
+
+    def segments(self, starts: List[LineNumber]):
+        """The segments starting at the lines, the first one holding the docstring."""
+        all_segments = [self.segment(first, following)
+                        for first, following in itertools.zip_longest(starts, starts[1:])]
+        if all_segments:
+            all_segments[0] = all_segments[0]._replace(holds_docstring=True)
+        return all_segments
+
+
+def segments(source: Source):
+    """Split a source into its segments, None when it can't be tokenized."""
+    try:
+        starts = segment_starts(tokenize.generate_tokens(io.StringIO(source).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    return SourceLines(source).segments(starts)
+
+
+def top_level_statement(statement: ast.stmt):
+    """
+    The statement found from the stdlib ast of a module rather than from its tokens, a
+    definition starting at its first decorator.
+    """
+    if not isinstance(statement, _AST_DEFINITIONS):
+        return TopLevelStatement(LineNumber(statement.lineno), "")
+    decorators = [decorator.lineno for decorator in statement.decorator_list]
+    return TopLevelStatement(LineNumber(min([statement.lineno] + decorators)), "def")
+
+
+def tree_segments(source: Source, tree: ast.Module):
+    """Split a source into its segments from its stdlib ast, when it was already parsed."""
+    statements = map(top_level_statement, tree.body)
+    return SourceLines(source).segments(SegmentStarts().lines(statements))
+
+
+def _parses(segment: Segment):
+    try:
+        ast.parse(segment.source)
+    except (SyntaxError, ValueError):
+        return False
+    return True
+
+
+class ShiftedLines:  # pylint: disable=single-collection-instance-variable
+    """
+    The lines of a segment, indexed by their line numbers in the whole module, as
+    the tree rebuilder indexes the lines of the source it builds.
+    """
+
+    def __init__(self, lines: Lines, first: LineNumber):
+        self._lines: Lines = lines
+        self._offset: int = first - 1
+
+    def _shifted(self, index: Optional[int]):  # pylint: disable=dont-use-primitives
+        return None if index is None else max(index - self._offset, 0)
+
+    def __getitem__(self, index: LineIndex):
+        if isinstance(index, slice):
+            return self._lines[self._shifted(index.start):self._shifted(index.stop)]
+        return self._lines[self._shifted(index)]
+
+    def __bool__(self):
+        return bool(self._lines)
+
+
+class ModuleFile:
+    # pylint: disable=chain-of-method-calls
+    """
+    The names of the module of a file, as astroid names the modules it builds, and the
+    type aliases of the whole file when they were collected beforehand. When the source
+    isn't the one saved in the file, like an unsaved editor buffer, the modules hold its
+    bytes, which the checkers reading the module source then read instead of the file.
+    """
+
+    def __init__(self, item: FileItem, aliases: Optional[TypeAliases] = None,
+                 source: Optional[Source] = None):
+        self.name: str = module_name(item)
+        self.path: str = os.path.abspath(item.filepath)
+        self.package: bool = Path(self.path).stem == "__init__"
+        self.aliases: Optional[TypeAliases] = aliases
+        self.file_bytes: Optional[bytes] = None if source is None else source.encode("utf-8")
+
+    def _with_source(self, module: nodes.Module):
+        module.file_bytes = self.file_bytes
+        return module
+
+    def module(self):
+        """A module node without a body, standing for the file."""
+        return self._with_source(nodes.Module(self.name, file=self.path, path=[self.path],
+                                              package=self.package))
+
+    def _segment_node(self, rebuilder: TreeRebuilder, tree: ast.Module, segment: Segment):
+        if segment.holds_docstring:
+            return rebuilder.visit_module(tree, self.name, self.path, self.package)
+        module = self.module()
+        module.postinit([rebuilder.visit(statement, module) for statement in tree.body])
+        return module
+
+    def build(self, segment: Segment):
+        """
+        Build the tree of a segment, as astroid builds a module, with the line numbers
+        of the segment in the file. Only the first segment can hold the docstring.
+        """
+        tree, parser_module = _parse_string(segment.source, type_comments=True)
+        ast.increment_lineno(tree, segment.first - 1)
+        rebuilder = TreeRebuilder(MANAGER, parser_module, segment.source)
+        rebuilder._data = ShiftedLines(rebuilder._data, segment.first)
+        module = self._with_source(self._segment_node(rebuilder, tree, segment))
+        module = AstroidBuilder(MANAGER)._post_build(module, rebuilder, "utf-8")
+        MANAGER.astroid_cache.pop(self.name, None)
+        if self.aliases is not None:
+            share_module_aliases(module, self.aliases)
+        return module
+
+
+def _send_module_events(callbacks: Iterable[Callable[[nodes.Module], None]],
+                        module: nodes.Module):
+    for callback in callbacks:
+        callback(module)
+
+
+def _drop_caches(known: CacheCount):
+    """
+    Drop the caches astroid filled while a segment was built and walked: the method
+    caches of its nodes are registered for the whole run, and the inference cache is
+    keyed by nodes, which would keep every segment alive until the end of the run.
+    """
+    for cache in CACHE_MANAGER.dict_caches[known:]:
+        cache.clear()
+    del CACHE_MANAGER.dict_caches[known:]
+    _invalidate_cache()
+
+
+def _walk_segment(walker: ASTWalker, module_file: ModuleFile, segment: Segment):
+    known = CacheCount(len(CACHE_MANAGER.dict_caches))
+    for statement in module_file.build(segment).body:
+        walker.walk(statement)
+    _drop_caches(known)
+
+
+def _in_scope(walker: ASTWalker, segment: Segment):
+    """Whether the walker walks any line of the segment, a scoped one only the changed lines."""
+    if not isinstance(walker, ScopedWalker):
+        return True
+    return walker.covers(segment.first, segment.last())
+
+
+def walk_segments(walker: ASTWalker, module_file: ModuleFile, all_segments: List[Segment]):
+    """
+    Walk the segments one at a time, between the events of a module standing for the
+    whole file, as the walker walks the module built from it. The segments a scoped
+    walker would skip aren't built.
+    """
+    # pylint: disable=chain-of-method-calls
+    module = module_file.module()
+    _send_module_events(walker.visit_events.get("module", ()), module)
+    for segment in (segment for segment in all_segments if _in_scope(walker, segment)):
+        _walk_segment(walker, module_file, segment)
+    _send_module_events(walker.leave_events.get("module", ()), module)
+
+
+def _read_source(item: FileItem):
+    try:
+        return Source(importlib.util.decode_source(Path(item.filepath).read_bytes()))  # pylint: disable=chain-of-method-calls
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+
+def _checkable_segments(source: Optional[Source]) -> Optional[List[Segment]]:
+    if source is None or OPTION_PO.search(source):
+        return None
+    all_segments = segments(source)
+    if all_segments is None or not all(map(_parses, all_segments)):
+        return None
+    return all_segments
+
+
+def _module_aliases(source: Source):
+    """The type aliases of the whole module, from its stdlib ast released right after."""
+    try:
+        return ast_module_aliases(ast.parse(source))
+    except (SyntaxError, ValueError):
+        return None
+
+
+def check_by_definition(linter: PyLinter, item: FileItem, check_astroid_module: ModuleCheck):
+    """
+    Check a file one segment at a time, reporting the messages through the linter.
+    Files that can't be read or parsed, or that contain pylint pragmas, are left to
+    the regular check: False is returned for them and nothing is checked.
+    """
+    source = _read_source(item)
+    all_segments = _checkable_segments(source)
+    if all_segments is None:
+        return False
+    linter.set_current_module(module_name(item), item.filepath)
+    linter.file_state = FileState(item.modpath, linter.msgs_store)
+    walker = check_astroid_module.keywords["walker"]
+    walk_segments(walker, ModuleFile(item, _module_aliases(source)), all_segments)
+    linter.stats.statement = walker.nbstatements  # pylint: disable=chain-of-method-calls
+    return True
@@ -0,0 +1,124 @@
+"""
+Parallel mode of the standalone runner.
+
+The files are split into contiguous chunks which are fanned out to a process pool.
+Every worker builds its own linter and checkers once, from the same command line as
+the main process, and reuses them for all the chunks it gets, so no checker state is
+shared between processes. The chunks come back in the order they were sent, so the
+messages are reported in the same order as a run without ``--jobs``.
+"""
+# pylint: disable=protected-access
+import math
+import multiprocessing
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from pylint.lint import PyLinter, fix_import_path
+from pylint.typing import FileItem
+from pylint.utils import LinterStats, merge_stats
+
+from object_calisthenics.checkers.message_location import module_name
+from object_calisthenics.reporters.violation_records import RecordingReporter, ViolationRecord
+
+if TYPE_CHECKING:
+    from object_calisthenics.runner import CalisthenicsRun
+
+CommandLine = Sequence[str]
+Chunk = List[FileItem]
+RunBuilder = Callable[[CommandLine], Tuple["CalisthenicsRun", CommandLine]]
+
+CHUNKS_PER_WORKER = 4
+
+
+class WorkerCount(int):
+    """The amount of processes checking files"""
+
+
+class CheckedFile(NamedTuple):
+    """The records of the messages a worker added for a single file."""
+    name: str
+    filepath: str
+    base_name: Optional[str]
+    messages: List[ViolationRecord]
+
+
+class CheckedChunk(NamedTuple):
+    """The outcome of a worker checking a chunk of files."""
+    files: List[CheckedFile]
+    stats: LinterStats
+    msg_status: int
+
+
+class Worker:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """The checkers of a pool process, built once and reused for all of its chunks."""
+
+    def __init__(self, run: "CalisthenicsRun", paths: CommandLine):
+        self._run: "CalisthenicsRun" = run
+        self._paths: CommandLine = paths
+        run.linter.set_reporter(RecordingReporter())
+
+    def checked_file(self, item: FileItem):
+        """Take the records of the messages added for a file that was just checked."""
+        linter = self._run.linter
+        messages = linter.reporter.records
+        linter.reporter.reset()
+        return CheckedFile(module_name(item), item.filepath, linter.file_state.base_name, messages)
+
+    def check_chunk(self, chunk: Chunk):
+        """Check the files of a chunk, with fresh stats for the chunk."""
+        linter = self._run.linter
+        linter.open()
+        linter.msg_status = 0
+        with fix_import_path(self._paths):
+            files = [self.checked_file(item) for item in self._run.checked_items(chunk)]
+        return CheckedChunk(files, linter.stats, linter.msg_status)
+
+
+_WORKER: Optional[Worker] = None
+
+
+def _initialize_worker(build_run: RunBuilder, argv: CommandLine):
+    global _WORKER  # pylint: disable=global-statement
+    _WORKER = Worker(*build_run(argv))
+
+
+def _check_chunk(chunk: Chunk):
+    if _WORKER is None:
+        raise RuntimeError("The worker checkers weren't built")
+    return _WORKER.check_chunk(chunk)
+
+
+def chunks(items: Chunk, jobs: WorkerCount):
+    """Split the files into contiguous chunks, a few per worker to balance the load."""
+    size = max(math.ceil(len(items) / (jobs * CHUNKS_PER_WORKER)), 1)
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _report(linter: PyLinter, checked: CheckedFile):
+    linter.file_state.base_name = checked.base_name  # pylint: disable=chain-of-method-calls
+    linter.file_state._is_base_filestate = False  # pylint: disable=chain-of-method-calls
+    linter.set_current_module(checked.name, checked.filepath)
+    for record in checked.messages:
+        linter.reporter.handle_message(record.to_message())  # pylint: disable=chain-of-method-calls
+
+
+def check_parallel(  # pylint: disable=too-many-arguments
+        linter: PyLinter, build_run: RunBuilder, argv: CommandLine, items: Chunk,
+        jobs: WorkerCount):
+    """
+    Check the files in a pool of workers, each building its run and paths with
+    ``build_run`` from the command line, and report their messages through the linter.
+    """
+    work = chunks(items, jobs)
+    linter.open()
+    with multiprocessing.Pool(min(jobs, max(len(work), 1)), initializer=_initialize_worker,
+                              initargs=(build_run, argv)) as pool:
+        all_stats = [_merge(linter, checked) for checked in pool.imap(_check_chunk, work)]
+    linter.stats = merge_stats([linter.stats] + all_stats)
+
+
+def _merge(linter: PyLinter, checked: CheckedChunk):
+    for checked_file in checked.files:
+        _report(linter, checked_file)
+    linter.msg_status |= checked.msg_status
+    return checked.stats
@@ -0,0 +1,14 @@
+"""
+Streaming reporters, writing the messages of every module as soon as it was checked,
+the reporter writing the baseline of the messages of a run, and the one keeping
+compact records of the messages for long running processes.
+"""
+from object_calisthenics.reporters.baseline_reporter import BaselineReporter
+from object_calisthenics.reporters.binary_reader import BinaryReader
+from object_calisthenics.reporters.binary_records import BinaryWriter
+from object_calisthenics.reporters.streaming_reporters import BinaryReporter, NdjsonReporter
+from object_calisthenics.reporters.violation_records import (RecordingReporter, ViolationRecord,
+                                                            violation_record)
+
+__all__ = ["BaselineReporter", "BinaryReader", "BinaryReporter", "BinaryWriter", "NdjsonReporter",
+           "RecordingReporter", "ViolationRecord", "violation_record"]
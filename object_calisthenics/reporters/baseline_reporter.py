@@ -0,0 +1,67 @@
+"""
+Reporter writing the fingerprints of the messages of a run to a baseline file, see
+``checkers.baseline``. The messages of a later run with the file as its
+``calisthenics-baseline`` are only the ones that weren't there.
+"""
+from pathlib import Path
+from typing import Optional, Set, TextIO
+
+from pylint.message import Message
+from pylint.reporters import BaseReporter
+from pylint.reporters.ureports.nodes import Section
+
+from object_calisthenics.checkers.baseline import (Baseline, Fingerprint, SourceLines,
+                                                   decoded_lines, fingerprint, qualified_name,
+                                                   source_line)
+
+Layout = Optional[Section]
+
+
+class BaselineReporter(BaseReporter):  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    Collects the fingerprints of the messages and writes them as a baseline once the
+    run is over, to stdout or to the file given with
+    ``--output-format=calisthenics-baseline:<path>``. The source lines of the messages
+    are read back from their file, which is kept while its messages come.
+    """
+
+    name = "calisthenics-baseline"
+    extension = "ocbase"
+
+    def __init__(self, output: Optional[TextIO] = None):
+        super().__init__(output)
+        self._fingerprints: Set[Fingerprint] = set()
+        self._path: Optional[str] = None
+        self._lines: SourceLines = []
+
+    def _source_lines(self, path: str):  # pylint: disable=dont-use-primitives
+        if path != self._path:
+            self._path = path
+            self._lines = _read_lines(path)
+        return self._lines
+
+    def handle_message(self, msg: Message):
+        """Add the fingerprint of the message."""
+        line = source_line(self._source_lines(msg.abspath), msg.line)
+        self._fingerprints.add(fingerprint(msg.msg_id, qualified_name(msg.module, msg.obj),
+                                           line))
+
+    def display_messages(self, layout: Layout):
+        """Write the baseline of all the messages of the run."""
+        output = getattr(self.out, "buffer", self.out)
+        Baseline(self._fingerprints).write(output)
+        output.flush()
+
+    def display_reports(self, layout: Layout):
+        """The reports aren't part of the baseline."""
+
+    def _display(self, layout: Layout):
+        """The reports aren't part of the baseline."""
+
+
+def _read_lines(path: str):  # pylint: disable=dont-use-primitives
+    try:
+        return decoded_lines(Path(path).read_bytes())
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return []
@@ -0,0 +1,74 @@
+"""Incremental reading of the message records written by ``binary_records.BinaryWriter``"""
+from typing import BinaryIO, Iterator, List
+
+from pylint.interfaces import CONFIDENCE_LEVELS
+from pylint.message import Message
+from pylint.typing import MessageLocationTuple
+
+from object_calisthenics.reporters.binary_records import (MAGIC, MESSAGE_RECORD, MODULE_RECORD,
+                                                          STRING_RECORD, RecordError, read_varint)
+
+_CONFIDENCES = {confidence.name: confidence for confidence in CONFIDENCE_LEVELS}
+
+
+class ModuleStrings:
+    # pylint: disable=chain-of-method-calls
+    """The strings of the string table of the current module, by index."""
+
+    def __init__(self):
+        self._strings: List[str] = []
+
+    def __getitem__(self, index: int):  # pylint: disable=dont-use-primitives
+        return self._strings[index]
+
+    def append(self, text: str):  # pylint: disable=dont-use-primitives
+        """Add the next string of the table."""
+        self._strings.append(text)
+
+    def clear(self):
+        """Forget the strings of the previous module."""
+        self._strings.clear()
+
+
+class BinaryReader:
+    # pylint: disable=chain-of-method-calls
+    """Reads the messages of a binary stream, as they are written."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream: BinaryIO = stream
+        self._strings: ModuleStrings = ModuleStrings()
+
+    def _read_module(self):
+        self._strings.clear()
+        return ()
+
+    def _read_string(self):
+        self._strings.append(self._stream.read(read_varint(self._stream)).decode("utf-8"))
+        return ()
+
+    def _read_message(self):
+        msg_id, symbol, text, confidence, module, obj, path, abspath = (
+            self._strings[read_varint(self._stream)] for _ in range(8))
+        line, column, end_line, end_column = (read_varint(self._stream) for _ in range(4))
+        location = MessageLocationTuple(abspath, path, module, obj, line, column,
+                                        end_line - 1 if end_line else None,
+                                        end_column - 1 if end_column else None)
+        return (Message(msg_id, symbol, location, text, _CONFIDENCES[confidence]),)
+
+    def _read_record(self, kind: int):  # pylint: disable=dont-use-primitives
+        readers = {MODULE_RECORD: self._read_module, STRING_RECORD: self._read_string,
+                   MESSAGE_RECORD: self._read_message}
+        if kind not in readers:
+            raise RecordError(f"Unknown record kind {kind}")
+        return readers[kind]()
+
+    def read_header(self):
+        """Read the header of the stream, raising a RecordError when it isn't valid."""
+        if self._stream.read(len(MAGIC)) != MAGIC:
+            raise RecordError("The stream doesn't start with the message records header")
+
+    def messages(self) -> Iterator[Message]:
+        """Yield the messages of the stream, reading it up to its end."""
+        self.read_header()
+        for kind in iter(lambda: self._stream.read(1), b""):
+            yield from self._read_record(kind[0])
@@ -0,0 +1,118 @@
+"""
+Compact binary records of the messages, written and read incrementally.
+
+A stream starts with ``MAGIC``, followed by records starting with their kind byte:
+
+- ``MODULE_RECORD``: a new module starts, the string table is emptied.
+- ``STRING_RECORD``: the varint length and utf-8 bytes of the next string of the table.
+- ``MESSAGE_RECORD``: varints of the table indexes of the message id, symbol, text,
+  confidence, module, obj, path and absolute path, then of the line, column, end line
+  and end column. The end line and end column are stored plus one, zero meaning None.
+
+Strings are only written the first time a module uses them, so the repeated message
+texts, paths and objects of a module cost a single varint each. The table only holds
+the strings of the current module, whatever the size of the run.
+The records are read back by ``binary_reader.BinaryReader``.
+"""
+from typing import BinaryIO, Dict, Optional
+
+from pylint.message import Message
+
+MAGIC = b"OCMSG\x01"
+MODULE_RECORD = 0
+STRING_RECORD = 1
+MESSAGE_RECORD = 2
+
+
+class RecordError(ValueError):
+    """The stream isn't made of valid message records."""
+
+
+def encode_varint(value: int):  # pylint: disable=dont-use-primitives
+    """Encode an unsigned integer with 7 bits per byte, least significant first."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _read_byte(stream: BinaryIO):
+    byte = stream.read(1)
+    if not byte:
+        raise RecordError("The stream ends in the middle of a record")
+    return byte[0]
+
+
+def read_varint(stream: BinaryIO):
+    """Read an unsigned integer encoded by ``encode_varint``."""
+    byte = _read_byte(stream)
+    value, shift = byte & 0x7F, 7
+    while byte & 0x80:
+        byte = _read_byte(stream)
+        value |= (byte & 0x7F) << shift
+        shift += 7
+    return value
+
+
+def _optional_position(position: Optional[int]):  # pylint: disable=dont-use-primitives
+    return 0 if position is None else position + 1
+
+
+class StringTable:
+    # pylint: disable=chain-of-method-calls
+    """The indexes of the strings already written for the current module."""
+
+    def __init__(self):
+        self._indexes: Dict[str, int] = {}
+
+    def index_of(self, text: str):  # pylint: disable=dont-use-primitives
+        """Return the index of a string, or None when it wasn't written yet."""
+        return self._indexes.get(text)
+
+    def add(self, text: str):  # pylint: disable=dont-use-primitives
+        """Give the next index to a string."""
+        self._indexes[text] = len(self._indexes)
+        return self._indexes[text]
+
+    def clear(self):
+        """Forget the strings of the previous module."""
+        self._indexes.clear()
+
+
+class BinaryWriter:
+    # pylint: disable=chain-of-method-calls
+    """Writes the message records to a binary stream."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream: BinaryIO = stream
+        self._strings: StringTable = StringTable()
+        stream.write(MAGIC)
+
+    def start_module(self):
+        """Start the records of a new module."""
+        self._strings.clear()
+        self._stream.write(bytes((MODULE_RECORD,)))
+
+    def _string_index(self, text: str):  # pylint: disable=dont-use-primitives
+        index = self._strings.index_of(text)
+        if index is not None:
+            return index
+        encoded = text.encode("utf-8")
+        self._stream.write(bytes((STRING_RECORD,)) + encode_varint(len(encoded)) + encoded)
+        return self._strings.add(text)
+
+    def write(self, message: Message):
+        """Write a message, along with the strings the module didn't use yet."""
+        strings = (message.msg_id, message.symbol, message.msg, message.confidence.name,
+                   message.module, message.obj, message.path, message.abspath)
+        fields = [self._string_index(text) for text in strings] + [
+            message.line, message.column, _optional_position(message.end_line),
+            _optional_position(message.end_column)]
+        self._stream.write(bytes((MESSAGE_RECORD,)) +
+                           b"".join(encode_varint(field) for field in fields))
+
+    def flush(self):
+        """Flush the records written so far to the stream."""
+        self._stream.flush()
@@ -0,0 +1,91 @@
+"""
+Reporters writing the messages as they are added instead of collecting them.
+The output is flushed whenever a module starts, so the messages of every checked
+module can be consumed while the run goes on, and memory doesn't grow with the
+amount of messages.
+"""
+import abc
+import json
+from typing import Optional, TextIO
+
+from pylint.message import Message
+from pylint.reporters import BaseReporter, JSONReporter
+from pylint.reporters.ureports.nodes import Section
+
+from object_calisthenics.reporters.binary_records import BinaryWriter
+
+Layout = Optional[Section]
+
+
+class StreamingReporter(BaseReporter, metaclass=abc.ABCMeta):
+    # pylint: disable=chain-of-method-calls
+    """Base class of the reporters writing every message when it is handled."""
+
+    @abc.abstractmethod
+    def handle_message(self, msg: Message):
+        """Write the message."""
+
+    def flush(self):
+        """Flush the messages written so far."""
+        self.out.flush()
+
+    def on_set_current_module(self, module: str,  # pylint: disable=dont-use-primitives
+                              filepath: Optional[str]):
+        """Flush the messages of the previous module."""
+        self.flush()
+
+    def display_messages(self, layout: Layout):
+        """Flush the messages of the last module, they were already written."""
+        self.flush()
+
+    def display_reports(self, layout: Layout):
+        """The reports aren't part of the streamed messages."""
+
+    def _display(self, layout: Layout):
+        """The reports aren't part of the streamed messages."""
+
+
+class NdjsonReporter(StreamingReporter):
+    # pylint: disable=chain-of-method-calls
+    """Writes every message as a line of json, with the fields of the json reporter."""
+
+    name = "ndjson"
+    extension = "ndjson"
+
+    def handle_message(self, msg: Message):
+        """Write the message as a json line."""
+        self.out.write(json.dumps(JSONReporter.serialize(msg)) + "\n")
+
+
+class BinaryReporter(StreamingReporter):
+    """
+    Writes the messages as compact binary records, see ``binary_records``.
+    The records go to the binary buffer of the output, which is stdout or the file
+    given with ``--output-format=calisthenics-binary:<path>``.
+    """
+
+    name = "calisthenics-binary"
+    extension = "ocmsg"
+
+    def __init__(self, output: Optional[TextIO] = None):
+        super().__init__(output)
+        self._writer: Optional[BinaryWriter] = None
+
+    def _binary_writer(self):
+        if self._writer is None:
+            self._writer = BinaryWriter(getattr(self.out, "buffer", self.out))
+        return self._writer
+
+    def handle_message(self, msg: Message):
+        """Write the record of the message."""
+        self._binary_writer().write(msg)
+
+    def flush(self):
+        """Flush the records written so far."""
+        self._binary_writer().flush()
+
+    def on_set_current_module(self, module: str,  # pylint: disable=dont-use-primitives
+                              filepath: Optional[str]):
+        """Flush the records of the previous module and start the ones of the new module."""
+        super().on_set_current_module(module, filepath)
+        self._binary_writer().start_module()
@@ -0,0 +1,97 @@
+"""
+Compact records of the messages, for the processes keeping them around: the daemon
+keeps the messages of every module it checked, and the workers of ``--jobs`` send the
+messages of their chunks back to the main process.
+
+A record holds the fields of a message in slots, with no reference to the checked
+trees, and its strings interned, so the path, module, qualified name, message id and
+text shared by the messages of a module, or of a whole run, are stored once. Memory
+then grows with the amount of messages rather than with the amount of checked source.
+"""
+import sys
+from typing import List, Optional, Tuple
+
+from pylint.interfaces import Confidence
+from pylint.message import Message
+from pylint.reporters import BaseReporter
+from pylint.reporters.ureports.nodes import Section
+from pylint.typing import MessageLocationTuple
+
+Layout = Optional[Section]
+RecordFields = Tuple[object, ...]
+
+_FIELDS = ("msg_id", "symbol", "msg", "abspath", "path", "module", "obj", "confidence", "line",
+           "column", "end_line", "end_column")
+
+
+class ViolationRecord:  # pylint: disable=too-many-instance-attributes
+    """A message, stored in slots with its strings interned."""
+
+    __slots__ = _FIELDS
+
+    def __init__(self, fields: RecordFields):
+        msg_id, symbol, msg, abspath, path, module, obj, confidence, *span = fields
+        line, column, end_line, end_column = span
+        self.msg_id: str = sys.intern(msg_id)
+        self.symbol: str = sys.intern(symbol)
+        self.msg: str = sys.intern(msg)
+        self.abspath: str = sys.intern(abspath)
+        self.path: str = sys.intern(path)
+        self.module: str = sys.intern(module)
+        self.obj: str = sys.intern(obj)
+        self.confidence: Confidence = confidence
+        self.line: int = line
+        self.column: int = column
+        self.end_line: Optional[int] = end_line
+        self.end_column: Optional[int] = end_column
+
+    def fields(self):
+        """The fields of the record, in the order of ``__slots__``."""
+        return tuple(getattr(self, field) for field in _FIELDS)
+
+    def __reduce__(self):
+        return ViolationRecord, (self.fields(),)
+
+    def __eq__(self, other: object):
+        return isinstance(other, ViolationRecord) and self.fields() == other.fields()
+
+    def __hash__(self):
+        return hash(self.fields())
+
+    def moved(self, lines: int):  # pylint: disable=dont-use-primitives
+        """The record of the message once the lines it is on moved down by the amount."""
+        end_line = None if self.end_line is None else self.end_line + lines
+        return ViolationRecord(self.fields()[:8] + (self.line + lines, self.column, end_line,
+                                                    self.end_column))
+
+    def to_message(self):
+        """The message of the record, for the reporters."""
+        location = MessageLocationTuple(self.abspath, self.path, self.module, self.obj,
+                                        self.line, self.column, self.end_line, self.end_column)
+        return Message(self.msg_id, self.symbol, location, self.msg, self.confidence)
+
+
+def violation_record(message: Message):
+    """The record of a message, taking its strings from the interned ones."""
+    return ViolationRecord(tuple(getattr(message, field) for field in _FIELDS))
+
+
+class RecordingReporter(BaseReporter):  # pylint: disable=single-collection-instance-variable
+    """Collects the records of the messages instead of the messages themselves."""
+
+    name = "calisthenics-records"
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[ViolationRecord] = []
+
+    def handle_message(self, msg: Message):
+        """Keep the record of the message, letting the message go."""
+        self.records.append(violation_record(msg))  # pylint: disable=chain-of-method-calls
+
+    def reset(self):
+        """Forget the records of the previous module, once they were taken."""
+        self.records = []
+
+    def _display(self, layout: Layout):
+        """The records are taken by the caller, nothing is displayed."""
@@ -0,0 +1,221 @@
+"""
+Standalone runner of the object calisthenics checkers.
+
+It registers only this plugin's checkers on a bare linter, without pylint's default
+checkers and configuration file lookup, and checks the files one at a time. The
+messages of pylint's checkers are registered without the checkers, so the pragmas
+disabling them aren't reported as unknown. The messages go through pylint's own
+message store and reporters, so message ids, locations, pragmas and output formats
+are the same as a full pylint run.
+With ``--jobs`` the files are fanned out to a process pool, see ``parallel``.
+With ``--calisthenics-low-memory`` the modules are built and checked one top-level
+definition at a time, see ``low_memory``. With ``--calisthenics-diff`` only the
+definitions a git diff changed are built and checked, see ``diff_scope``.
+"""
+# The runner drives the linter the same way pylint's Run does, which goes through
+# a few protected PyLinter members of the pinned pylint version.
+# pylint: disable=protected-access
+import argparse
+import collections
+import functools
+import sys
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+from astroid import MANAGER, nodes
+from pylint import checkers, reporters
+from pylint.lint import PyLinter, fix_import_path
+from pylint.lint.run import _cpu_count
+from pylint.typing import FileItem
+
+from object_calisthenics.ast_backend.report import report_file
+from object_calisthenics.checkers import register
+from object_calisthenics.checkers.baseline import BaselineError, configured_baseline
+from object_calisthenics.checkers.message_location import module_name
+from object_calisthenics.checkers.path_rules import PathRulesError, configured_path_rules
+from object_calisthenics.diff_scope import DiffError, DiffScope, ScopedWalker, diff_scope
+from object_calisthenics.low_memory import check_by_definition
+from object_calisthenics.parallel import WorkerCount, check_parallel
+
+CommandLine = Sequence[str]
+Arguments = Optional[CommandLine]
+Paths = List[str]
+ModuleCheck = Callable[[nodes.Module], Optional[bool]]
+
+
+class CommandLineError(Exception):
+    """The command line arguments can't be used to run the checkers."""
+
+
+def register_pylint_messages(linter: PyLinter):
+    """
+    Register the messages of pylint's own checkers, without the checkers, so that the
+    pragmas and options naming them are known rather than reported as unknown.
+    """
+    builtin = PyLinter()
+    checkers.initialize(builtin)
+    for checker in (checker for checker in builtin.get_checkers() if checker is not builtin):
+        linter.msgs_store.register_messages_from_checker(checker)  # pylint: disable=chain-of-method-calls
+
+
+def _is_parallel(config: argparse.Namespace):
+    return (config.jobs or _cpu_count()) > 1
+
+
+def check_report_options(config: argparse.Namespace):
+    """
+    Reject the reports filled by the astroid checkers of a single process, which the
+    workers of ``--jobs`` would each write for their own files only, and the ast backend
+    would leave empty.
+    """
+    if config.calisthenics_instrumentation_report and _is_parallel(config):
+        raise CommandLineError("--calisthenics-instrumentation-report can't be used with "
+                               "--jobs: every worker would write the calls of its own files")
+    if config.calisthenics_latency_report and \
+            (_is_parallel(config) or config.calisthenics_backend == "ast"):
+        raise CommandLineError("--calisthenics-latency-report can only be used with the "
+                               "astroid backend and without --jobs: the report times the "
+                               "astroid checkers of a single process")
+    if config.calisthenics_class_index and \
+            (_is_parallel(config) or config.calisthenics_backend == "ast"):
+        raise CommandLineError("--calisthenics-class-index can only be used with the astroid "
+                               "backend and without --jobs: the index is filled by the "
+                               "astroid checkers of a single process")
+
+
+def build_linter(argv: CommandLine):
+    """
+    Create a linter with only the object calisthenics checkers, configured from
+    the command line. Return it along with the files and directories to check.
+    """
+    linter = PyLinter()
+    reporters.initialize(linter)
+    register(linter)
+    register_pylint_messages(linter)
+    linter.disable("I")
+    linter.set_current_module("Command line")
+    paths = linter._parse_command_line_configuration(argv)
+    unknown = [path for path in paths if path.startswith("-") and path != "--"]
+    if unknown:
+        raise CommandLineError(f"Unrecognized option found: {', '.join(unknown)}")
+    config = linter.config
+    if config.jobs < 0:
+        raise CommandLineError(
+            f"Jobs number ({config.jobs}) should be greater than or equal to 0")
+    if config.calisthenics_low_memory and config.calisthenics_cache_dir:
+        raise CommandLineError("--calisthenics-low-memory can't be used with "
+                               "--calisthenics-cache-dir: the cached messages are replayed "
+                               "on the tree of the whole module")
+    if config.calisthenics_diff and \
+            (config.calisthenics_cache_dir or config.calisthenics_backend == "ast"):
+        raise CommandLineError("--calisthenics-diff can only be used with the astroid backend "
+                               "and without --calisthenics-cache-dir: the messages of the "
+                               "definitions left out of the diff aren't computed")
+    check_report_options(config)
+    try:
+        configured_baseline(linter)
+        configured_path_rules(linter)
+    except (BaselineError, PathRulesError) as error:
+        raise CommandLineError(str(error)) from error
+    linter.set_current_module("Command line or configuration file")
+    linter.load_plugin_configuration()
+    return linter, [path for path in paths if path != "--"]
+
+
+class CalisthenicsRun:
+    # pylint: disable=chain-of-method-calls
+    """Checks files one at a time, releasing every module once it was checked."""
+
+    def __init__(self, linter: PyLinter):
+        self.linter: PyLinter = linter
+        self._scope: Optional[DiffScope] = _diff_scope(linter)
+
+    def file_items(self, paths: Paths) -> Iterable[FileItem]:
+        """The file items of the modules found under the paths, and changed by the diff."""
+        if self.linter.config.recursive:
+            paths = list(self.linter._discover_files(paths))
+        items = self.linter._iterate_file_descrs(paths)
+        if self._scope is None:
+            return items
+        return (item for item in items if item.filepath in self._scope)
+
+    def checked_items(self, items: Iterable[FileItem]) -> Iterator[FileItem]:
+        """Check the files, yielding each of them once it was checked."""
+        self.linter.initialize()
+        with self.linter._astroid_module_checker() as check_astroid_module:
+            yield from self._check_each(items, check_astroid_module)
+
+    def _check_each(self, items: Iterable[FileItem], check_astroid_module: ModuleCheck):
+        for item in items:
+            self._check_file(item, check_astroid_module)
+            yield item
+
+    def _scoped_check(self, item: FileItem, check_astroid_module: ModuleCheck):
+        """The module check walking only the definitions of the file the diff changed."""
+        if self._scope is None:
+            return check_astroid_module
+        walker = ScopedWalker(check_astroid_module.keywords["walker"],
+                              self._scope.changed_lines(item.filepath))
+        return functools.partial(check_astroid_module, walker=walker)
+
+    def _check_file(self, item: FileItem, check_astroid_module: ModuleCheck):
+        scoped_check = self._scoped_check(item, check_astroid_module)
+        self._check_module(item, scoped_check)
+        check_astroid_module.keywords["walker"].nbstatements = \
+            scoped_check.keywords["walker"].nbstatements
+
+    def _check_module(self, item: FileItem, check_astroid_module: ModuleCheck):
+        config = self.linter.config
+        if config.calisthenics_backend == "ast" and \
+                report_file(self.linter, item, check_astroid_module):
+            return
+        if (config.calisthenics_low_memory or self._scope is not None) and \
+                check_by_definition(self.linter, item, check_astroid_module):
+            return
+        self.linter._check_file(self.linter.get_ast, check_astroid_module, item)
+        MANAGER.astroid_cache.pop(module_name(item), None)
+
+    def _jobs(self):
+        return WorkerCount(self.linter.config.jobs or _cpu_count())
+
+    def _check(self, items: Iterable[FileItem], argv: CommandLine):
+        if self._jobs() > 1:
+            check_parallel(self.linter, build_run, argv, list(items), self._jobs())
+            return
+        collections.deque(self.checked_items(items), maxlen=0)
+
+    def run(self, paths: Paths, argv: CommandLine):
+        """Check the paths, display the report and return the pylint exit status."""
+        with fix_import_path(paths):
+            self._check(self.file_items(paths), argv)
+        self.linter.generate_reports()
+        return self.linter.msg_status
+
+
+def _diff_scope(linter: PyLinter):
+    revisions = linter.config.calisthenics_diff  # pylint: disable=chain-of-method-calls
+    if not revisions:
+        return None
+    try:
+        return diff_scope(revisions)
+    except DiffError as error:
+        raise CommandLineError(str(error)) from error
+
+
+def build_run(argv: CommandLine):
+    """Create a run of the checkers configured from the command line, with its paths."""
+    linter, paths = build_linter(argv)
+    return CalisthenicsRun(linter), paths
+
+
+def main(argv: Arguments = None):
+    """Entry point of ``python -m object_calisthenics``."""
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        run, paths = build_run(argv)
+    except CommandLineError as error:
+        print(error, file=sys.stderr)
+        return 32
+    if not paths:
+        print(run.linter.help())  # pylint: disable=chain-of-method-calls
+        return 32
+    return run.run(paths, argv)
@@ -0,0 +1,195 @@
+"""
+Change notifications of the python files under a set of directories and files.
+
+On Linux the kernel notifies the changes through inotify, called with ctypes since the
+standard library has no binding for it. Elsewhere, or when inotify can't be set up,
+the files are polled: their modification time and size are compared from scan to scan.
+"""
+import ctypes
+import ctypes.util
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Set
+
+Roots = Iterable[Path]
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+
+class Seconds(float):
+    """A duration in seconds"""
+
+
+class FileStamp(NamedTuple):
+    """What changes along with the content of a file."""
+    mtime_ns: int
+    size: int
+
+
+def file_stamp(path: Path):
+    """The stamp of a file, None when it doesn't exist anymore."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return FileStamp(stat.st_mtime_ns, stat.st_size)
+
+
+def python_files(roots: Roots) -> Iterator[Path]:
+    """The python files under the roots, the roots that are files included."""
+    for root in roots:
+        yield from [root] if root.is_file() else root.rglob("*.py")
+
+
+class Snapshot:
+    # pylint: disable=chain-of-method-calls
+    """The stamps of the python files under the roots at some point in time."""
+
+    def __init__(self, roots: Roots):
+        self._stamps: Dict[Path, Optional[FileStamp]] = {
+            path: file_stamp(path) for path in python_files(roots)}
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self._stamps)
+
+    def stamp(self, path: Path):
+        """The stamp of a file when the snapshot was taken, None if it wasn't there."""
+        return self._stamps.get(path)
+
+    def changed_since(self, previous: "Snapshot"):
+        """The files added, removed or modified since the previous snapshot."""
+        return {path for path in set(self) | set(previous)
+                if self.stamp(path) != previous.stamp(path)}
+
+
+class PollingWatcher:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """Finds the changed files by scanning the roots every ``interval`` seconds."""
+
+    def __init__(self, roots: Roots, interval: Seconds):
+        self._roots: Roots = tuple(roots)
+        self.timeout: Optional[Seconds] = interval
+        self._snapshot: Snapshot = Snapshot(self._roots)
+
+    @staticmethod
+    def fileno():
+        """No file descriptor signals the changes, the watcher has to be asked."""
+        return None
+
+    def changes(self):
+        """The python files that changed since the previous call."""
+        previous, self._snapshot = self._snapshot, Snapshot(self._roots)
+        return self._snapshot.changed_since(previous)
+
+    def close(self):
+        """Nothing to release."""
+
+
+class WatchedDirectories:
+    # pylint: disable=chain-of-method-calls
+    """The directories watched by an inotify instance, by watch descriptor."""
+
+    def __init__(self):
+        self._directories: Dict[int, Path] = {}
+
+    def add(self, descriptor: int, directory: Path):  # pylint: disable=dont-use-primitives
+        """Remember the directory of a watch descriptor."""
+        self._directories[descriptor] = directory
+
+    def directory(self, descriptor: int):  # pylint: disable=dont-use-primitives
+        """The directory of a watch descriptor, None once it was removed."""
+        return self._directories.get(descriptor)
+
+
+def _libc():
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)  # pylint: disable=chain-of-method-calls
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError("inotify isn't available")
+    return libc
+
+
+class InotifyWatcher:  # pylint: disable=single-collection-instance-variable
+    # pylint: disable=chain-of-method-calls
+    """
+    Gets the changed files from inotify, which watches every directory under the
+    roots, the directories created later included.
+    """
+
+    timeout: Optional[Seconds] = None
+
+    def __init__(self, roots: Roots):
+        self._roots: Roots = tuple(roots)
+        self._libc: ctypes.CDLL = _libc()
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watched: WatchedDirectories = WatchedDirectories()
+        for root in self._roots:
+            self._watch_tree(root if root.is_dir() else root.parent)
+
+    def _watch(self, directory: Path):
+        descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if descriptor >= 0:
+            self._watched.add(descriptor, directory)
+
+    def _watch_tree(self, root: Path):
+        self._watch(root)
+        for directory in (path for path in root.rglob("*") if path.is_dir()):
+            self._watch(directory)
+
+    def fileno(self):
+        """The file descriptor that becomes readable when files change."""
+        return self._fd
+
+    def _read_events(self):
+        try:
+            return os.read(self._fd, 1 << 16)
+        except BlockingIOError:
+            return b""
+
+    def _event_path(self, data: bytes, offset: int):  # pylint: disable=dont-use-primitives
+        descriptor, mask, _, length = _EVENT.unpack_from(data, offset)
+        directory = self._watched.directory(descriptor)
+        name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+        path = directory / os.fsdecode(name) if directory and name else None
+        if path and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            self._watch_tree(path)
+        return mask, path, offset + _EVENT.size + length
+
+    def changes(self):
+        """The python files that changed since the previous call."""
+        changed: Set[Path] = set()
+        data, offset = self._read_events(), 0
+        while offset < len(data):
+            mask, path, offset = self._event_path(data, offset)
+            changed |= set(python_files(self._roots)) if mask & IN_Q_OVERFLOW else set()
+            changed |= {path} if path and path.suffix == ".py" else set()
+        return changed
+
+    def close(self):
+        """Stop watching."""
+        os.close(self._fd)
+
+
+def _inotify_watcher(roots: Roots):
+    try:
+        return InotifyWatcher(roots)
+    except OSError:
+        return None
+
+
+def watcher_for(roots: Roots, interval: Seconds,  # pylint: disable=dont-use-primitives
+                polling: bool = False):
+    """An inotify watcher of the roots, a polling one when asked or when inotify can't be used."""
+    watcher = None if polling else _inotify_watcher(roots)
+    return watcher or PollingWatcher(roots, interval)
@@ -0,0 +1,181 @@
+"""Parity tests of the ast backend against the astroid based checkers"""
+# pylint: disable=chain-of-method-calls
+import ast
+import textwrap
+from pathlib import Path
+
+import astroid
+import pytest
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+from pylint.utils import ASTWalker
+
+from benchmarks.generators import GENERATORS, Size
+from object_calisthenics.ast_backend import check_source
+from object_calisthenics.ast_backend.engine import EngineOptions
+from object_calisthenics.ast_backend.instance_attrs import instance_attrs
+from object_calisthenics.ast_backend.report import statement_count
+from object_calisthenics.checkers import (ElseKeywordPresent, FirstClassCollections,
+                                          OneDotPerLine, OneLevelOfIndentation,
+                                          PrimitiveObsession, SmallClassSize, register)
+from object_calisthenics.checkers.class_lines import LINE_KINDS
+
+ROOT = Path(__file__).parent.parent
+CHECKERS = (ElseKeywordPresent, FirstClassCollections, OneDotPerLine, OneLevelOfIndentation,
+            PrimitiveObsession, SmallClassSize)
+MESSAGES = {msgid: definition[0] for checker in CHECKERS
+            for msgid, definition in checker.msgs.items()}
+
+
+def _is_snippet_call(node: ast.AST):
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and \
+        node.func.attr in ("extract_node", "parse") and node.args and \
+        isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)
+
+
+def _test_snippets():
+    """The sources the checker tests run on, keyed by where they are."""
+    for path in sorted((ROOT / "tests").glob("test_*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        yield from ((f"{path.name}:{node.lineno}", textwrap.dedent(node.args[0].value))
+                    for node in ast.walk(tree) if _is_snippet_call(node))
+
+
+NESTED_FRAMES = '''
+def outer(values):
+    class Inner:
+        if values:
+            for value in values:
+                pass
+
+        def method(self):
+            return self
+    try:
+        pass
+    except ValueError:
+        class Handler:
+            def handle(self):
+                return self
+    return Inner, Handler
+'''
+SOURCES = {
+    **dict(_test_snippets()),
+    "nested-frames": NESTED_FRAMES,
+    **{f"generated:{name}": generate(Size(1)) for name, generate in GENERATORS.items()},
+    **{str(path.relative_to(ROOT)): path.read_text(encoding="utf-8")
+       for path in sorted(ROOT.glob("object_calisthenics/**/*.py"))},
+}
+
+
+def _astroid_messages(source: str, **options: object):  # pylint: disable=dont-use-primitives
+    linter = PyLinter(reporter=CollectingReporter())
+    register(linter)
+    for name, value in options.items():
+        setattr(linter.config, name, value)
+    walker = ASTWalker(linter)
+    for checker in linter.prepare_checkers()[1:]:
+        checker.open()
+        walker.add_checker(checker)
+    linter.set_current_module("module")
+    walker.walk(astroid.parse(source, "module"))
+    return [(message.msg_id, message.line, message.column, message.end_line,
+             message.end_column, message.obj, message.msg)
+            for message in linter.reporter.messages]
+
+
+def _ast_messages(source: str,  # pylint: disable=dont-use-primitives
+                  options: EngineOptions = EngineOptions()):
+    return [(violation.msgid, violation.line, violation.col_offset, violation.end_lineno,
+             violation.end_col_offset, violation.obj,
+             MESSAGES[violation.msgid] % violation.args if violation.args
+             else MESSAGES[violation.msgid])
+            for violation in check_source(source, options)]
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_same_messages_as_the_astroid_checkers(name: object):
+    """The ast backend adds the same messages, in the same order, as the astroid checkers."""
+    assert _ast_messages(SOURCES[name]) == _astroid_messages(SOURCES[name])
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_same_class_sizes_without_excluded_lines(name: object):
+    """Both backends leave the same docstrings, comments and blank lines out of class sizes."""
+    excluded = frozenset(LINE_KINDS)
+    options = EngineOptions(max_class_lines=5, class_lines_exclude=excluded)
+    assert _ast_messages(SOURCES[name], options) == _astroid_messages(
+        SOURCES[name], max_class_lines=5, class_lines_exclude=excluded)
+
+
+INSTANCE_ATTRS = '''
+import dataclasses
+from typing import ClassVar, Dict, List
+
+class Plain:
+    def __init__(self, items):
+        self.items: List[int] = items
+        def helper(other):
+            self.helped = other
+        def rebinding(self):
+            self.not_an_attribute = 1
+
+    def later(self):
+        self.items = []
+        self.later_one = 2
+
+    @staticmethod
+    def static(value):
+        value.not_an_attribute = 1
+
+    @classmethod
+    def build(cls):
+        cls.class_attribute = 1
+
+
+class Immutable(tuple):
+    def __new__(cls, value):
+        self = tuple.__new__(cls, (value,))
+        self.value = value
+        cls.not_an_attribute = 1
+        return self
+
+
+class Meta(type):
+    def __init__(cls, *args):
+        cls.not_an_attribute = 1
+
+
+@dataclasses.dataclass
+class Data:
+    first: Dict[str, int]
+    second: int
+    shared: ClassVar[int] = 1
+'''
+
+
+@pytest.mark.parametrize("name", ["Plain", "Immutable", "Meta", "Data"])
+def test_instance_attrs_are_the_ones_astroid_infers(name: object):
+    """The instance attributes match the ones astroid finds through inference."""
+    classes = {node.name: node for node in ast.walk(ast.parse(INSTANCE_ATTRS))
+               if isinstance(node, ast.ClassDef)}
+    astroid_class = astroid.parse(INSTANCE_ATTRS)[name]
+    attrs = instance_attrs(classes[name])
+    assert len(attrs) == len(astroid_class.instance_attrs)
+    assert [assignment.annotated for assignment in attrs] == \
+        [isinstance(nodes[0].parent, astroid.nodes.AnnAssign)
+         for nodes in astroid_class.instance_attrs.values()]
+
+
+@pytest.mark.parametrize("name", [name for name in SOURCES if name.startswith("object")])
+def test_statement_count_is_the_one_of_the_pylint_walker(name: object):
+    """The statements counted for the score are the ones the pylint walker counts."""
+    walker = ASTWalker(PyLinter())
+    walker.walk(astroid.parse(SOURCES[name]))
+    assert statement_count(ast.parse(SOURCES[name])) == walker.nbstatements
+
+
+def test_unions_too_deep_to_recurse_through_are_checked():
+    """The walk and the annotation keys don't recurse, however deep the union is."""
+    union = " | ".join(f"Type{index}" for index in range(2000))
+    violations = check_source(f"def test(hello: str | {union}):\n    return hello.a.b\n")
+    assert [violation.msgid for violation in violations] == ["W9003", "W9006"]
@@ -0,0 +1,126 @@
+"""Tests module for the baseline of known violations"""
+import io
+from pathlib import Path
+
+import pytest
+
+from object_calisthenics.checkers.baseline import (Baseline, BaselineError, fingerprint,
+                                                   read_baseline)
+from object_calisthenics.runner import main
+
+MODULE = '''"""Sample module"""
+
+
+def first(value: int):
+    """Sample function"""
+    return value.real.imag
+
+
+class Sample:
+    """Sample class"""
+    def method(self):
+        """Sample method"""
+        return self.a.b
+'''
+
+CHANGED = '''"""Sample module"""
+import os
+
+
+def first(value: int):
+    """Sample function"""
+    return value.real.imag
+
+
+def added(value: int):
+    """Added function"""
+    return value
+
+
+class Sample:
+    """Sample class"""
+    def method(self):
+        """Sample method"""
+        return  self.a.b + self.c.d
+'''
+
+
+class TestBaselineFile:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the fingerprints and the baseline file."""
+
+    def test_fingerprint_ignores_whitespace(self):
+        """The source line is normalized before being hashed."""
+        assert fingerprint("W9006", "module.f", "    return  a.b.c") == \
+            fingerprint("W9006", "module.f", "return a.b.c")
+        assert fingerprint("W9006", "module.f", "return a.b.c") != \
+            fingerprint("W9006", "module.g", "return a.b.c")
+
+    def test_written_baseline_is_read_back(self, tmp_path: Path):
+        """The fingerprints are written sorted and read back into a set."""
+        path = tmp_path / "baseline.ocbase"
+        path.write_bytes(self._written(Baseline([3, 1, 2 ** 64 - 1, 1])))
+        baseline = read_baseline(path)
+        assert len(baseline) == 3
+        assert 2 ** 64 - 1 in baseline and 2 not in baseline
+
+    @pytest.mark.parametrize("truncation", [1, 20])
+    def test_truncated_baseline_is_rejected(self, tmp_path: Path, truncation: object):
+        """A file cut anywhere can't be read as a baseline."""
+        path = tmp_path / "baseline.ocbase"
+        path.write_bytes(self._written(Baseline([1, 2]))[:-int(str(truncation))])
+        with pytest.raises(BaselineError):
+            read_baseline(path)
+
+    @staticmethod
+    def _written(baseline: Baseline):
+        stream = io.BytesIO()
+        baseline.write(stream)
+        return stream.getvalue()
+
+
+class TestBaselineRun:
+    # pylint: disable=chain-of-method-calls
+    """Test case for runs leaving out the violations of a baseline."""
+
+    @staticmethod
+    def _baseline(tmp_path: Path):
+        sample = tmp_path / "sample.py"
+        sample.write_text(MODULE, encoding="utf-8")
+        baseline = tmp_path / "baseline.ocbase"
+        main([f"--output-format=calisthenics-baseline:{baseline}", str(sample)])
+        sample.write_text(CHANGED, encoding="utf-8")
+        return sample, baseline
+
+    @pytest.mark.parametrize("options", [
+        [], ["--calisthenics-backend=ast"], ["--jobs=2"], ["--calisthenics-low-memory=y"]])
+    def test_only_new_violations_are_reported(self, tmp_path: Path,
+                                              capsys: pytest.CaptureFixture,
+                                              options: object):
+        """Moved violations are still known, new and rewritten ones are reported."""
+        sample, baseline = self._baseline(tmp_path)
+        arguments = ["--score=n", "--msg-template={line}:{obj}:{msg_id}",
+                     f"--calisthenics-baseline={baseline}", str(sample)]
+        capsys.readouterr()
+        assert main(list(options) + arguments) == 4
+        assert capsys.readouterr().out.split()[3:] == [
+            "10:added:W9003", "19:Sample.method:W9006", "19:Sample.method:W9006"]
+
+    def test_cached_messages_are_left_out(self, tmp_path: Path,
+                                          capsys: pytest.CaptureFixture):
+        """Messages replayed from the result cache go through the baseline as well."""
+        sample, baseline = self._baseline(tmp_path)
+        arguments = ["--score=n", "--msg-template={line}:{msg_id}",
+                     f"--calisthenics-cache-dir={tmp_path / 'cache'}", str(sample)]
+        capsys.readouterr()
+        main(arguments)
+        assert len(capsys.readouterr().out.split()) == 8
+        main([f"--calisthenics-baseline={baseline}"] + arguments)
+        assert sorted(capsys.readouterr().out.split()[3:]) == ["10:W9003", "19:W9006",
+                                                               "19:W9006"]
+
+    def test_missing_baseline_is_rejected(self, tmp_path: Path):
+        """A baseline file that can't be read stops the run."""
+        sample = tmp_path / "sample.py"
+        sample.write_text(MODULE, encoding="utf-8")
+        assert main([f"--calisthenics-baseline={tmp_path / 'missing'}", str(sample)]) == 32
@@ -0,0 +1,91 @@
+"""Tests module for the cross file class index"""
+from pathlib import Path
+
+import pytest
+from pylint.lint import Run
+
+from object_calisthenics.checkers.class_index_reader import (ClassIndex, IndexFormatError,
+                                                             RowCount, open_class_index)
+from object_calisthenics.checkers.class_metrics import ClassMetrics
+from object_calisthenics.runner import main
+
+FIRST = '''"""First module"""
+from typing import List
+
+
+class Mixed:
+    """Mixes a collection with another variable"""
+    def __init__(self):
+        self.items: List[int] = []
+        self.other = 3
+
+    class Inner:
+        """Nested class"""
+        def __init__(self):
+            self.value: int = 1
+'''
+SECOND = '''"""Second module"""
+
+
+class Plain:
+    """Without instance variables"""
+'''
+
+
+class TestClassIndex:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the class index written by the checkers of classes."""
+
+    @staticmethod
+    def _index(tmp_path: Path, messages: str):  # pylint: disable=dont-use-primitives
+        for name, source in (("first.py", FIRST), ("second.py", SECOND)):
+            (tmp_path / name).write_text(source, encoding="utf-8")
+        index_path = tmp_path / "classes.ocidx"
+        Run(["--load-plugins=object_calisthenics.checkers", "--disable=all",
+             f"--enable={messages}", f"--calisthenics-class-index={index_path}",
+             str(tmp_path / "first.py"), str(tmp_path / "second.py")], exit=False)
+        return index_path
+
+    def test_classes_of_all_modules_are_indexed_once(self, tmp_path: Path):
+        """Every class is indexed once, though both checkers of classes feed the index."""
+        with open_class_index(self._index(tmp_path, "W9004,W9007")) as index:
+            rows = [index.row(row) for row in range(len(index))]
+        assert rows == [
+            ClassMetrics(str(tmp_path / "first.py"), "first.Mixed", 5, 10, 2, 1, 1),
+            ClassMetrics(str(tmp_path / "first.py"), "first.Mixed.Inner", 11, 4, 1, 0, 0),
+            ClassMetrics(str(tmp_path / "second.py"), "second.Plain", 4, 2, 0, 0, 0),
+        ]
+
+    def test_queries(self, tmp_path: Path):
+        """The largest classes, the ones mixing collections and the totals are queried."""
+        with open_class_index(self._index(tmp_path, "W9007")) as index:
+            largest = [metrics.qualname for metrics in index.largest(RowCount(2))]
+            mixing = [metrics.qualname for metrics in index.mixing_collections()]
+            totals = index.totals()
+        assert largest == ["first.Mixed", "first.Mixed.Inner"]
+        assert mixing == ["first.Mixed"]
+        assert (totals.classes, totals.lines, totals.untyped) == (3, 16, 1)
+
+    def test_columns_are_read_in_place(self, tmp_path: Path):
+        """A column is a view on the mapped file rather than a copy."""
+        with open_class_index(self._index(tmp_path, "W9004")) as index:
+            column = index.columns["line_span"]
+            assert isinstance(column, memoryview)
+            assert list(column) == [10, 4, 2]
+
+    def test_no_index_without_class_checkers(self, tmp_path: Path):
+        """Only the checkers of classes write the index."""
+        assert not self._index(tmp_path, "W9001").exists()
+
+    @pytest.mark.parametrize("option", ["--jobs=2", "--calisthenics-backend=ast"])
+    def test_partial_index_is_rejected(self, tmp_path: Path, option: object):
+        """The workers of ``--jobs`` and the ast backend don't fill the index."""
+        (tmp_path / "first.py").write_text(FIRST, encoding="utf-8")
+        assert main([f"--calisthenics-class-index={tmp_path / 'classes.ocidx'}", str(option),
+                     str(tmp_path / "first.py")]) == 32
+        assert not (tmp_path / "classes.ocidx").exists()
+
+    def test_other_files_are_rejected(self):
+        """A buffer without the index header isn't read as an index."""
+        with pytest.raises(IndexFormatError):
+            ClassIndex(memoryview(b"not an index at all"))
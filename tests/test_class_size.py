@@ -27,7 +27,7 @@ class TestSmallClassSize(pylint.testutils.CheckerTestCase):
                     col_offset=0,
                     end_line=2,
                     end_col_offset=15,
-                    args=(6, 3)
+                    args=(5, 3)
                 )
         ):
             self.checker.linter.config.max_class_lines = 3
@@ -44,3 +44,53 @@ class TestSmallClassSize(pylint.testutils.CheckerTestCase):
         """)
         with self.assertNoMessages():
             self.checker.leave_classdef(class_node)
+
+    def _class_sizes(self, source: str, *excluded: str):  # pylint: disable=dont-use-primitives
+        """Walk the module and return the sizes of the classes that are too large."""
+        self.checker.linter.config.max_class_lines = 0
+        self.checker.linter.config.class_lines_exclude = excluded
+        self.checker.open()
+        self.walk(astroid.parse(source))
+        return {message.node.name: message.args[0] for message in self.linter.release_messages()}
+
+    def test_class_size_does_not_depend_on_its_position(self):
+        """A small class at the bottom of a long module is small."""
+        class_node = astroid.extract_node("\n" * 200 + """
+        class TestClass:  #@
+            def __init__(self):
+                self.hello = 'hello'
+        """)
+        with self.assertNoMessages():
+            self.checker.leave_classdef(class_node)
+
+    def test_nested_classes_do_not_count_twice(self):
+        """The lines of a nested class only count for the nested class."""
+        sizes = self._class_sizes("""
+class Outer:
+    class Inner:
+        class Innermost:
+            pass
+        value = 1
+    value = 2
+""")
+        assert sizes == {"Innermost": 2, "Inner": 2, "Outer": 2}
+
+    def test_excluded_lines(self):
+        """Docstrings, comments and blank lines are left out when excluded."""
+        source = '''
+class TestClass:
+    """
+    Docstring
+    """
+
+    # A comment
+    def method(self):
+        """Method docstring"""
+        text = """not a docstring"""
+        return text
+'''
+        assert self._class_sizes(source) == {"TestClass": 10}
+        assert self._class_sizes(source, "docstrings") == {"TestClass": 6}
+        assert self._class_sizes(source, "comments", "blank") == {"TestClass": 8}
+        assert self._class_sizes(source, "docstrings", "comments", "blank", "other") == \
+            {"TestClass": 4}
@@ -0,0 +1,130 @@
+"""Tests module for the watch mode daemon"""
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from object_calisthenics.daemon import (CheckedModule, Daemon, ModuleCount, ResultLru, main,
+                                        request)
+from object_calisthenics.runner import build_run
+from object_calisthenics.watcher import (FileStamp, InotifyWatcher, PollingWatcher, Seconds,
+                                         watcher_for)
+
+PRIMITIVE = '''"""Sample module"""
+
+
+def run(value: int):
+    """Sample function"""
+    return value
+'''
+FIXED = PRIMITIVE.replace("value: int", "value: Value")
+
+
+class TestResultLru:
+    """Test case for the modules kept in memory."""
+
+    def test_least_recently_used_module_is_evicted(self):
+        """Once full, the module that wasn't used for the longest time is evicted."""
+        modules = ResultLru(ModuleCount(2))
+        stamp = FileStamp(1, 1)
+        for name in ("first", "second"):
+            modules.put(Path(name), CheckedModule(stamp, []))
+        modules.get(Path("first"), stamp)
+        modules.put(Path("third"), CheckedModule(stamp, []))
+        assert len(modules) == 2
+        assert modules.get(Path("second"), stamp) is None
+        assert modules.get(Path("first"), stamp) is not None
+
+    def test_module_of_another_stamp_is_not_returned(self):
+        """The messages of a file that changed since it was checked are stale."""
+        modules = ResultLru(ModuleCount(2))
+        modules.put(Path("module"), CheckedModule(FileStamp(1, 1), []))
+        assert modules.get(Path("module"), FileStamp(2, 1)) is None
+
+
+class TestWatcher:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the watchers of the python files."""
+
+    @pytest.mark.parametrize("polling", [True, False])
+    def test_reports_changed_files(self, tmp_path: Path, polling: object):
+        """Modified, created and removed python files are reported, other files aren't."""
+        (tmp_path / "modified.py").write_text("VALUE = 1\n", encoding="utf-8")
+        (tmp_path / "removed.py").write_text("VALUE = 1\n", encoding="utf-8")
+        watcher = watcher_for([tmp_path], Seconds(0.01), polling)
+        assert isinstance(watcher, PollingWatcher if polling else InotifyWatcher)
+        (tmp_path / "modified.py").write_text("VALUE = 22\n", encoding="utf-8")
+        (tmp_path / "removed.py").unlink()
+        (tmp_path / "package").mkdir()
+        (tmp_path / "package" / "created.py").write_text("VALUE = 1\n", encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("notes", encoding="utf-8")
+        changes = watcher.changes() | watcher.changes()
+        watcher.close()
+        assert changes >= {tmp_path / "modified.py", tmp_path / "removed.py"}
+        assert tmp_path / "notes.txt" not in changes
+
+
+    def test_directories_created_later_are_watched(self, tmp_path: Path):
+        """The files of a directory created after the watcher started are reported."""
+        watcher = InotifyWatcher([tmp_path])
+        (tmp_path / "package").mkdir()
+        watcher.changes()
+        (tmp_path / "package" / "module.py").write_text("VALUE = 1\n", encoding="utf-8")
+        changes = watcher.changes()
+        watcher.close()
+        assert changes == {tmp_path / "package" / "module.py"}
+
+
+class TestDaemon:
+    """Test case for the daemon serving the messages over a Unix socket."""
+
+    @staticmethod
+    def _wait_for(condition: object):
+        deadline = time.monotonic() + 10
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        return condition()
+
+    @pytest.fixture(name="daemon")
+    def daemon_fixture(self, tmp_path: Path):
+        """A daemon checking the sample module, polling its directory."""
+        module = tmp_path / "sample.py"
+        module.write_text(PRIMITIVE, encoding="utf-8")
+        run, paths = build_run(["--recursive=y", str(tmp_path)])
+        daemon = Daemon(run, paths, PollingWatcher([tmp_path], Seconds(0.02)),
+                        ResultLru(ModuleCount(10)))
+        daemon.check([tmp_path])
+        socket_path = tmp_path / "daemon.sock"
+        thread = threading.Thread(target=daemon.serve, args=(socket_path,))
+        thread.start()
+        assert self._wait_for(socket_path.exists)
+        yield module, socket_path
+        request(socket_path, {"command": "shutdown"})
+        thread.join(10)
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+    def test_changed_module_is_checked_again(self, daemon: object):
+        """Cached messages are served, and a modified module is checked again."""
+        module, socket_path = daemon
+        check = {"command": "check", "paths": [str(module)]}
+        messages = request(socket_path, check)["messages"]
+        assert [message["message-id"] for message in messages] == ["W9003"]
+        module.write_text(FIXED, encoding="utf-8")
+        assert self._wait_for(lambda: not request(socket_path, check)["messages"])
+        stats = request(socket_path, {"command": "stats"})
+        assert stats["checked"] >= 2
+        assert stats["modules"] == 1
+
+    def test_invalid_requests_are_answered(self, daemon: object):
+        """An unknown command gets an error back instead of stopping the daemon."""
+        _, socket_path = daemon
+        assert "error" in request(socket_path, {"command": "unknown"})
+        assert request(socket_path, {"command": "stats"})["checked"] == 1
+
+    def test_client_prints_the_messages(self, daemon: object, capsys: pytest.CaptureFixture):
+        """The command line client prints a line per message."""
+        module, socket_path = daemon
+        assert main([f"--socket={socket_path}", "--check", str(module)]) == 1
+        assert "W9003" in capsys.readouterr().out
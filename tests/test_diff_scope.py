@@ -0,0 +1,142 @@
+"""Tests module for the checks scoped to the lines changed by a git diff"""
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from object_calisthenics.checkers.class_lines import LineNumber
+from object_calisthenics.diff_scope import ChangedLines, LineRange, parse_diff
+from object_calisthenics.runner import main
+
+MODULE = '''"""Sample module"""
+VALUE = os.path.join("a", "b")
+
+
+def first(value: int):
+    """First function"""
+    return value.real.imag
+
+
+class Sample:
+    """Sample class"""
+    def unchanged(self):
+        """Unchanged method"""
+        return self.a.b
+
+    @property
+    def changed(self):
+        """Changed method"""
+        return self.c.d
+'''
+
+DIFF = '''diff --git a/package/module.py b/package/module.py
+index 1111111..2222222 100644
+--- a/package/module.py
++++ b/package/module.py
+@@ -3,0 +4,2 @@ import os
++VALUE = 1
++OTHER = 2
+@@ -10 +12 @@ def first():
+-    return 1
++    return 2
+@@ -20,3 +21,0 @@ class Sample:
+-    pass
+diff --git a/removed.py b/removed.py
+deleted file mode 100644
+--- a/removed.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+-VALUE = 1
+'''
+
+
+def _lines(*ranges: LineRange):
+    return ChangedLines(ranges)
+
+
+class TestChangedLines:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the interval index of the changed lines."""
+
+    def test_overlapping_and_adjacent_ranges_are_merged(self):
+        """The ranges are kept sorted and disjoint."""
+        changed = _lines(LineRange(LineNumber(10), LineNumber(12)),
+                         LineRange(LineNumber(1), LineNumber(2)),
+                         LineRange(LineNumber(13), LineNumber(15)),
+                         LineRange(LineNumber(11), LineNumber(11)))
+        assert len(changed) == 2
+
+    @pytest.mark.parametrize("first,last,overlaps", [
+        (1, 1, False), (1, 3, True), (4, 4, True), (5, 9, False), (9, 10, True),
+        (12, 20, True), (13, 20, False)])
+    def test_overlaps(self, first: object, last: object, overlaps: object):
+        """A span overlaps the changed lines when any of its lines changed."""
+        changed = _lines(LineRange(LineNumber(3), LineNumber(4)),
+                         LineRange(LineNumber(10), LineNumber(12)))
+        assert changed.overlaps(LineNumber(first), LineNumber(last)) is overlaps
+
+    def test_diff_hunks(self):
+        """Added and modified lines are changed, as is the line before removed ones."""
+        files = parse_diff(DIFF, "/repository")
+        assert list(files) == ["/repository/package/module.py"]
+        changed = files["/repository/package/module.py"]
+        assert [line for line in range(1, 25) if changed.overlaps(line, line)] == \
+            [4, 5, 12, 21]
+
+
+def _git(repository: Path, *arguments: str):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com",
+                    *arguments], cwd=repository, check=True, capture_output=True)
+
+
+class TestDiffScopedRun:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the runner checking only the definitions a diff changed."""
+
+    @staticmethod
+    def _repository(tmp_path: Path, monkeypatch: pytest.MonkeyPatch,  # pylint: disable=dont-use-primitives
+                    pragma: str = ""):
+        monkeypatch.chdir(tmp_path)
+        _git(tmp_path, "init", "-q")
+        (tmp_path / "sample.py").write_text(MODULE + pragma, encoding="utf-8")
+        (tmp_path / "other.py").write_text(MODULE, encoding="utf-8")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "Sample")
+        (tmp_path / "sample.py").write_text(MODULE.replace("self.c.d", "self.c.e") + pragma,
+                                            encoding="utf-8")
+        return ["--score=n", "--msg-template={path}:{line}:{obj}:{msg_id}", "--recursive=y",
+                "--persistent=n", str(tmp_path)]
+
+    @pytest.mark.parametrize("pragma", ["", "# pylint: disable=W9003\n"])
+    def test_only_changed_definitions_are_checked(self, tmp_path: Path,
+                                                  monkeypatch: pytest.MonkeyPatch,
+                                                  capsys: pytest.CaptureFixture,
+                                                  pragma: object):
+        """
+        The changed method and its class get their messages, nothing else does, whether
+        the module is built a definition at a time or whole, as with pylint pragmas.
+        """
+        arguments = self._repository(tmp_path, monkeypatch, str(pragma))
+        assert main(["--calisthenics-diff=HEAD"] + arguments) == 4
+        assert capsys.readouterr().out.split() == [
+            "*************", "Module", "sample", "sample.py:19:Sample.changed:W9006"]
+
+    def test_whole_files_are_checked_without_a_diff(self, tmp_path: Path,
+                                                    monkeypatch: pytest.MonkeyPatch,
+                                                    capsys: pytest.CaptureFixture):
+        """Without the option every definition of every file is checked."""
+        arguments = self._repository(tmp_path, monkeypatch)
+        main(arguments)
+        assert capsys.readouterr().out.count("W9006") == 8
+
+    def test_unknown_revision_is_rejected(self, tmp_path: Path,
+                                          monkeypatch: pytest.MonkeyPatch):
+        """A revision range git can't diff stops the run."""
+        arguments = self._repository(tmp_path, monkeypatch)
+        assert main(["--calisthenics-diff=no-such-revision"] + arguments) == 32
+
+    def test_ast_backend_is_rejected(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """The ast backend checks whole files, the options can't be combined."""
+        arguments = self._repository(tmp_path, monkeypatch)
+        assert main(["--calisthenics-diff=HEAD", "--calisthenics-backend=ast"] +
+                    arguments) == 32
@@ -1,6 +1,7 @@
 """Tests module for the ElseKeywordPresent checker"""
 import astroid
 import pylint.testutils
+from pylint.testutils import set_config
 
 from object_calisthenics.checkers.else_keyword_present import ElseKeywordPresent
 
@@ -12,23 +13,23 @@ class TestElseKeywordPresent(pylint.testutils.CheckerTestCase):
 
     def test_else_present_in_function(self):
         """Test should fail when there is an else statement in a function"""
-        func_node = astroid.extract_node("""
+        func_node, branch = astroid.extract_node("""
         def test():  #@
             hello = None
             if x > 10:
                 hello = 'world'
             else:
-                hello = 'universe'
+                hello = 'universe'  #@
             return hello
         """)
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9002",
-                    node=func_node,
-                    line=2,
-                    col_offset=0,
-                    end_line=2,
-                    end_col_offset=8
+                    node=branch,
+                    line=7,
+                    col_offset=8,
+                    end_line=7,
+                    end_col_offset=26
                 )
         ):
             self.checker.visit_functiondef(func_node)
@@ -43,3 +44,48 @@ class TestElseKeywordPresent(pylint.testutils.CheckerTestCase):
         """)
         with self.assertNoMessages():
             self.checker.visit_functiondef(func_node)
+
+    @set_config(else_violations="all")
+    def test_reports_every_else_branch(self):
+        """
+        Every else branch is reported when asked for, an elif being the else branch of
+        its if statement.
+        """
+        func_node, first, second = astroid.extract_node("""
+        def test():  #@
+            if x > 10:
+                return 'world'
+            elif x > 5:  #@
+                return 'earth'
+            else:
+                return 'universe'
+            for item in items:
+                if item:
+                    return item
+                else:
+                    continue  #@
+        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(msg_id="W9002", node=first, line=5, col_offset=4,
+                                             end_line=8, end_col_offset=25),
+                pylint.testutils.MessageTest(msg_id="W9002", node=second, line=13,
+                                             col_offset=12, end_line=13, end_col_offset=20),
+        ):
+            self.checker.visit_functiondef(func_node)
+
+    def test_else_of_a_nested_function_is_reported_on_the_nested_function(self):
+        """The enclosing function gets its message on the nested function using else."""
+        func_node, inner = astroid.extract_node("""
+        def test():  #@
+            def inner():  #@
+                if x:
+                    return 1
+                else:
+                    return 2
+            return inner
+        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(msg_id="W9002", node=inner, line=3, col_offset=4,
+                                             end_line=3, end_col_offset=13)
+        ):
+            self.checker.visit_functiondef(func_node)
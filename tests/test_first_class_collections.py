@@ -1,6 +1,8 @@
 """Tests module for first class collections check"""
 import astroid
 import pylint.testutils
+import pytest
+from pylint.testutils import set_config
 
 from object_calisthenics.checkers.first_class_collections import FirstClassCollections
 
@@ -124,3 +126,71 @@ class TestFirstClassCollections(pylint.testutils.CheckerTestCase):
                 """)
         with self.assertNoMessages():
             self.checker.leave_classdef(class_node)
+
+    def _assert_single_collection_message(self, class_node: astroid.nodes.ClassDef):
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(
+                    msg_id="W9004",
+                    node=class_node,
+                    line=class_node.lineno,
+                    col_offset=0,
+                    end_line=class_node.lineno,
+                    end_col_offset=15
+                )
+        ):
+            self.checker.leave_classdef(class_node)
+
+    @pytest.mark.parametrize("annotation", [
+        "typing.List[str]", "list[int]", "list", "Tuple[int, ...]", "FrozenSet[str]",
+        "collections.abc.Sequence[str]", "Optional[Dict[str, int]]", "Deque[int] | None",
+        "'Mapping[str, int]'"])
+    def test_fail_check_for_every_collection_type(self, annotation: object):
+        """
+        Subscripted or not, qualified or not and wrapped in an optional or not, the
+        collection types make the check fail.
+        """
+        class_node = astroid.extract_node(f"""
+        class TestClass:
+            def __init__(self):
+                self.test_collection: {annotation} = []
+                self.test_int: int = 0
+        """)
+        self._assert_single_collection_message(class_node)
+
+    def test_fail_check_when_collection_type_is_imported_under_an_alias(self):
+        """Import aliases and module level aliases stand for the types they name."""
+        class_node = astroid.extract_node("""
+        import typing as t
+        from collections import deque as dq
+        Names = t.List[str]
+        class TestClass:
+            def __init__(self):
+                self.test_names: Names = []
+                self.test_queue: dq = dq()
+        """)
+        self._assert_single_collection_message(class_node)
+
+    def test_pass_check_when_alias_names_a_custom_type(self):
+        """Aliases of types that aren't collections don't make the check fail."""
+        class_node = astroid.extract_node("""
+        from model import Names as List
+        Custom = List
+        class TestClass:
+            def __init__(self):
+                self.test_names: Custom = Custom()
+                self.test_int: int = 0
+        """)
+        with self.assertNoMessages():
+            self.checker.leave_classdef(class_node)
+
+    @set_config(collection_types=("model.Names",))
+    def test_collection_types_are_configurable(self):
+        """Only the configured types are collections."""
+        class_node = astroid.extract_node("""
+        from model import Names
+        class TestClass:
+            def __init__(self):
+                self.test_names: Names = Names()
+                self.test_list: List[str] = []
+        """)
+        self._assert_single_collection_message(class_node)
@@ -0,0 +1,124 @@
+"""Tests module for the shared function body walker"""
+import astroid
+
+from object_calisthenics.checkers.function_body_walker import (ELSE_BRANCHES, NESTED_BLOCKS,
+                                                               first_violation, function_facts)
+
+
+class TestFunctionBodyWalker:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the facts computed by the module walk."""
+
+    def test_nested_function_has_its_own_facts(self):
+        """A nested function is measured from its own body, not the outer one."""
+        outer, inner = astroid.extract_node("""
+        def outer():  #@
+            if x:
+                def inner():  #@
+                    if y:
+                        pass
+                    else:
+                        pass
+        """)
+        assert function_facts(outer).max_indentation == 3
+        assert function_facts(outer).contains_else
+        assert function_facts(inner).max_indentation == 1
+        assert function_facts(inner).contains_else
+
+    def test_function_in_side_block_is_walked(self):
+        """Functions defined in else or except blocks still get their facts."""
+        in_else, in_handler = astroid.extract_node("""
+        if x:
+            pass
+        else:
+            def in_else():  #@
+                pass
+        try:
+            pass
+        except ValueError:
+            def in_handler():  #@
+                for i in x:
+                    pass
+        """)
+        assert function_facts(in_else).max_indentation == 0
+        assert function_facts(in_handler).max_indentation == 1
+
+    def test_side_blocks_do_not_count_for_enclosing_function(self):
+        """Only statements reached through body add to the enclosing function facts."""
+        func_node = astroid.extract_node("""
+        def test():  #@
+            for i in x:
+                pass
+            else:
+                if y:
+                    pass
+        """)
+        facts = function_facts(func_node)
+        assert facts.max_indentation == 1
+        assert not facts.contains_else
+
+    def test_deepest_nesting(self):
+        """Functions nested as deep as Python allows are measured."""
+        source = "".join(f"{'    ' * level}if x:\n" for level in range(1, 98))
+        func_node = astroid.extract_node(f"def test():  #@\n{source}{'    ' * 98}pass\n")
+        assert function_facts(func_node).max_indentation == 97
+
+    def test_violations_are_located_in_source_order(self):
+        """
+        The walk locates the nested blocks and else branches of the function body,
+        leaving out the side blocks like the facts do.
+        """
+        func_node, nested, inner_branch, branch = astroid.extract_node("""
+        def test():  #@
+            if x:
+                for i in x:  #@
+                    if y:
+                        pass
+                        if w:
+                            pass
+                        else:
+                            pass  #@
+            else:
+                return 0  #@
+            try:
+                pass
+            except ValueError:
+                if z:
+                    pass
+                else:
+                    pass
+        """)
+        facts = function_facts(func_node)
+        assert [(block.statement, block.depth) for block in facts.nested_blocks] == \
+            [(nested, 4)]
+        assert facts.else_branches == (inner_branch, branch)
+
+    def test_first_violation_is_the_first_located(self):
+        """
+        The first violation, found without walking the nested functions and the blocks
+        nested too deep again, is the first one the locating walk finds.
+        """
+        func_node, inner, nested = astroid.extract_node("""
+        def test():  #@
+            for i in x:
+                def inner():  #@
+                    if y:
+                        pass
+                    else:
+                        pass
+            if x:
+                while y:  #@
+                    if z:
+                        pass
+                    else:
+                        pass
+            else:
+                pass
+        """)
+        facts = function_facts(func_node, 1)
+        assert first_violation(func_node, NESTED_BLOCKS, 1) == facts.nested_blocks[:1]
+        assert first_violation(func_node, NESTED_BLOCKS, 2) == \
+            function_facts(func_node, 2).nested_blocks[:1]
+        assert first_violation(func_node, ELSE_BRANCHES) == facts.else_branches[:1] == (inner,)
+        assert [block.statement for block in facts.nested_blocks] == [inner, nested]
+        assert not first_violation(func_node, NESTED_BLOCKS, 3)
@@ -0,0 +1,157 @@
+"""Tests module for the incremental checks of editor buffers"""
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from object_calisthenics.checkers.class_lines import LineNumber
+from object_calisthenics.diff_scope import LineRange
+from object_calisthenics.incremental import EditorSession, editor_session
+from object_calisthenics.low_memory import ModuleFile
+from object_calisthenics.runner import CommandLineError, main
+
+MODULE = '''"""Sample module"""
+from typing import List as Sequence
+
+
+def first(value: int):
+    """Sample function"""
+    return value.real.imag
+
+
+class Sample:
+    """Sample class"""
+
+    def __init__(self):
+        self.items: Sequence[int] = []
+        self.other: int = 3
+
+
+def second(value: int):
+    """Sample function"""
+    if value:
+        return 1
+    return 2
+'''
+
+EDITED_FIRST = MODULE.replace("    return value.real.imag\n",
+                              "    for item in value:\n        if item:\n            return 1\n"
+                              "    return value.real.imag\n")
+
+
+def _lines(records: object):
+    return sorted((record.line, record.msg_id) for record in records)
+
+
+class TestEditorSession:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the checks of the buffers of an editor."""
+
+    @pytest.fixture(name="session")
+    def _session(self):
+        with editor_session(["--score=n"]) as session:
+            yield session
+
+    @pytest.fixture(name="built")
+    def _built(self, monkeypatch: pytest.MonkeyPatch):
+        """The first lines of the segments built by the checks."""
+        built: List[LineNumber] = []
+        build = ModuleFile.build
+
+        def counted_build(module_file: ModuleFile, segment: object):
+            built.append(segment.first)
+            return build(module_file, segment)
+        monkeypatch.setattr(ModuleFile, "build", counted_build)
+        return built
+
+    @staticmethod
+    def _check(session: EditorSession, text: str, changed: LineRange):  # pylint: disable=dont-use-primitives
+        session.edit("buffer.py", text, changed)
+        return _lines(session.check("buffer.py"))
+
+    def test_first_check_is_the_whole_buffer(self, session: EditorSession, built: list):
+        """The whole buffer is walked the first time, aliases resolved for every class."""
+        assert self._check(session, MODULE, LineRange(1, 1)) == [
+            (5, "W9003"), (7, "W9006"), (10, "W9004"), (18, "W9003")]
+        assert built == [1, 5, 10, 18]
+
+    def test_only_the_edited_definition_is_walked(self, session: EditorSession, built: list):
+        """The other definitions keep their messages, moved to the lines they are on now."""
+        self._check(session, MODULE, LineRange(1, 1))
+        built.clear()
+        assert self._check(session, EDITED_FIRST, LineRange(7, 9)) == [
+            (5, "W9003"), (8, "W9001"), (10, "W9006"), (13, "W9004"), (21, "W9003")]
+        assert built == [5]
+        assert self._check(session, EDITED_FIRST.replace("if value:", "if value > 1:"),
+                           LineRange(23, 23)) == [
+            (5, "W9003"), (8, "W9001"), (10, "W9006"), (13, "W9004"), (21, "W9003")]
+        assert built == [5, 21]
+
+    def test_unknown_sources_are_walked_without_changed_lines(self, session: EditorSession,
+                                                              built: list):
+        """A definition whose source isn't known is walked, whatever the changed lines."""
+        self._check(session, MODULE, LineRange(1, 1))
+        built.clear()
+        self._check(session, EDITED_FIRST, LineRange(21, 21))
+        assert built == [5, 21]
+
+    def test_edited_import_checks_the_whole_buffer(self, session: EditorSession,
+                                                   built: list):
+        """The definitions may use the names of the other statements, so all are walked."""
+        self._check(session, MODULE, LineRange(1, 1))
+        built.clear()
+        assert self._check(session, MODULE.replace("List as Sequence", "Optional as Sequence"),
+                           LineRange(2, 2)) == [(5, "W9003"), (7, "W9006"), (18, "W9003")]
+        assert built == [1, 5, 10, 18]
+
+    def test_buffer_that_doesnt_parse_keeps_its_messages(self, session: EditorSession):
+        """The messages of the last check are kept while the text doesn't parse."""
+        expected = self._check(session, MODULE, LineRange(1, 1))
+        assert self._check(session, MODULE + "def broken(:\n", LineRange(24, 24)) == expected
+
+    def test_buffer_with_pragmas_is_checked_whole(self, session: EditorSession, built: list):
+        """The pragmas of a buffer apply to its messages, the tree being built whole."""
+        text = MODULE.replace("return value.real.imag",
+                              "return value.real.imag  # pylint: disable=W9006")
+        assert self._check(session, text, LineRange(7, 7)) == [
+            (5, "W9003"), (10, "W9004"), (18, "W9003")]
+        assert not built
+
+    def test_check_of_an_edited_buffer_is_cancelled(self, session: EditorSession,
+                                                    monkeypatch: pytest.MonkeyPatch):
+        """A check stops once the buffer was edited again, the next one checks the edit."""
+        self._check(session, MODULE, LineRange(1, 1))
+        build = ModuleFile.build
+
+        def editing_build(module_file: ModuleFile, segment: object):
+            session.edit("buffer.py", MODULE, LineRange(7, 9))
+            return build(module_file, segment)
+        monkeypatch.setattr(ModuleFile, "build", editing_build)
+        session.edit("buffer.py", EDITED_FIRST, LineRange(7, 9))
+        assert session.check("buffer.py") is None
+        monkeypatch.setattr(ModuleFile, "build", build)
+        assert _lines(session.check("buffer.py")) == [
+            (5, "W9003"), (7, "W9006"), (10, "W9004"), (18, "W9003")]
+
+    def test_result_cache_is_rejected(self, tmp_path: Path):
+        """The cached messages of a module would only hold its edited definitions."""
+        with pytest.raises(CommandLineError):
+            editor_session([f"--calisthenics-cache-dir={tmp_path}"])
+
+    def test_checkers_read_the_buffer_rather_than_the_file(self, tmp_path: Path):
+        """The lines of a class and the baseline fingerprints come from the edited text."""
+        options = ["--score=n", "--max-class-lines=4", "--class-lines-exclude=blank"]
+        saved = tmp_path / "saved.py"
+        saved.write_text(MODULE, encoding="utf-8")
+        baseline = tmp_path / "baseline.ocbase"
+        main(options + [f"--output-format=calisthenics-baseline:{baseline}", str(saved)])
+        saved.write_text("\n\n" + MODULE.replace("\n\n", "\n"), encoding="utf-8")
+        with editor_session(options + [f"--calisthenics-baseline={baseline}"]) as session:
+            assert self._check_path(session, saved) == []
+            assert self._check_path(session, tmp_path / "unsaved.py") == [
+                (5, "W9003"), (7, "W9006"), (10, "W9004"), (10, "W9007"), (18, "W9003")]
+
+    @staticmethod
+    def _check_path(session: EditorSession, path: Path):
+        session.edit(str(path), MODULE, LineRange(1, 1))
+        return _lines(session.check(str(path)))
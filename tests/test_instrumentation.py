@@ -0,0 +1,96 @@
+"""Tests module for the checkers instrumentation"""
+import json
+from pathlib import Path
+
+import astroid
+import pylint.testutils
+import pytest
+from pylint.utils import ASTWalker
+
+from object_calisthenics.checkers.annotation_keys import AnnotationKeys
+from object_calisthenics.checkers.function_body_walker import ModuleWalker
+from object_calisthenics.checkers.instrumentation import (CallStats, PatchedHelpers,
+                                                          StatsTable, timed, tracked)
+from object_calisthenics.checkers.one_level_of_indentation import OneLevelOfIndentation
+from object_calisthenics.runner import main
+
+
+def test_static_helpers_stay_static():
+    """A helper defined as a staticmethod is patched and restored as a staticmethod."""
+    original = AnnotationKeys.__dict__["of_astroid"]
+    helpers = PatchedHelpers()
+    helpers.patch((AnnotationKeys, "of_astroid"), StatsTable())
+    assert isinstance(AnnotationKeys.__dict__["of_astroid"], staticmethod)
+    helpers.restore()
+    assert AnnotationKeys.__dict__["of_astroid"] is original
+
+
+def _failing():
+    raise ValueError("failing callback")
+
+
+def test_parallel_report_is_rejected(tmp_path: Path):
+    """The workers of ``--jobs`` would each write the report of their own files."""
+    (tmp_path / "sample.py").write_text("x = 1\n", encoding="utf-8")
+    assert main([f"--calisthenics-instrumentation-report={tmp_path / 'report.json'}",
+                 "--jobs=2", str(tmp_path / "sample.py")]) == 32
+
+
+class TestInstrumentation(pylint.testutils.CheckerTestCase):
+    # pylint: disable=chain-of-method-calls
+    """Test case for the instrumentation report of the checkers."""
+    CHECKER_CLASS = OneLevelOfIndentation
+
+    def _run(self, module: astroid.Module):
+        self.checker.open()
+        walker = ASTWalker(self.linter)
+        walker.add_checker(self.checker)
+        walker.walk(module)
+        self.checker.close()
+
+    def test_report_counts_callbacks_and_helper_calls(self, tmp_path: Path):
+        """
+        The report has the calls of every callback and of the helpers, the module
+        walk going through every statement once without recursing, and the function
+        nested too deep being walked again up to the block nested too deep.
+        """
+        report_path = tmp_path / "report.json"
+        self.linter.config.calisthenics_instrumentation_report = str(report_path)
+        self._run(astroid.parse("""
+        def first():
+            if x:
+                if y:
+                    pass
+
+        def second():
+            pass
+        """))
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["callbacks"]["one-level-indentation.visit_functiondef"]["calls"] == 2
+        helper = report["helpers"]["ModuleWalker._opened_blocks"]
+        assert helper["calls"] == 6 + 2
+        assert helper["max_depth"] == 1
+
+    def test_helpers_are_restored_after_the_run(self, tmp_path: Path):
+        """The recursive helpers are only patched while the run lasts."""
+        original = ModuleWalker.__dict__["_opened_blocks"]
+        self.linter.config.calisthenics_instrumentation_report = str(tmp_path / "report.json")
+        self._run(astroid.parse("def test():\n    pass\n"))
+        assert ModuleWalker.__dict__["_opened_blocks"] is original
+
+    def test_callbacks_are_untouched_when_disabled(self):
+        """Without a report path the checker callbacks aren't wrapped."""
+        self.checker.open()
+        assert not hasattr(self.checker.visit_functiondef, "__wrapped__")
+
+    @pytest.mark.parametrize("wrap", [timed, tracked])
+    def test_raising_calls_leave_their_depth(self, wrap: object):
+        """A call raising an exception is counted and leaves the depth it entered."""
+        stats = CallStats()
+        wrapped = wrap(stats, _failing)
+        with pytest.raises(ValueError):
+            wrapped()
+        with pytest.raises(ValueError):
+            wrapped()
+        assert (stats.calls, stats.depth, stats.max_depth) == (2, 0, 1)
+        assert (stats.seconds > 0) == (wrap is timed)
@@ -0,0 +1,101 @@
+"""Tests module for the per-file latency report"""
+import json
+from pathlib import Path
+
+import astroid
+import pylint.testutils
+import pytest
+from pylint.utils import ASTWalker
+
+from object_calisthenics.checkers.latency_report import histogram, main, percentile
+from object_calisthenics.checkers.one_level_of_indentation import OneLevelOfIndentation
+from object_calisthenics import runner
+
+MODULE = """
+def first(values):
+    for value in values:
+        if value:
+            return value
+
+x = first([])
+"""
+
+
+@pytest.mark.parametrize("rank, expected",  # pylint: disable=chain-of-method-calls
+                         [(50, 5), (95, 10), (99, 10), (10, 1)])
+def test_percentile_is_the_nearest_rank(rank: object, expected: object):
+    """The percentile is the smallest latency at least that share of the files reach."""
+    latencies = [float(value) for value in range(1, 11)]
+    assert percentile(latencies, int(rank)) == expected
+
+
+def test_histogram_buckets_are_upper_bounds():
+    """A latency falls in the first bucket whose upper bound it doesn't exceed."""
+    buckets = histogram([0.05, 0.1, 0.15, 7.0, 9000.0])
+    counts = {bucket["le_ms"]: bucket["files"] for bucket in buckets}
+    assert counts[0.1] == 2 and counts[0.2] == 1 and counts[10] == 1 and counts[None] == 1
+    assert sum(counts.values()) == 5
+
+
+@pytest.mark.parametrize("option",  # pylint: disable=chain-of-method-calls
+                         ["--jobs=2", "--calisthenics-backend=ast"])
+def test_partial_report_is_rejected(tmp_path: Path, option: object):
+    """The workers of ``--jobs`` and the ast backend don't time the astroid checkers."""
+    (tmp_path / "sample.py").write_text("x = 1\n", encoding="utf-8")
+    assert runner.main([f"--calisthenics-latency-report={tmp_path / 'latency.json'}",
+                        str(option), str(tmp_path / "sample.py")]) == 32
+    assert not (tmp_path / "latency.json").exists()
+
+
+class TestLatencyReport(pylint.testutils.CheckerTestCase):
+    # pylint: disable=chain-of-method-calls
+    """Test case for the latency report of the checkers."""
+    CHECKER_CLASS = OneLevelOfIndentation
+
+    def _run(self, *modules: astroid.Module):
+        self.checker.open()
+        walker = ASTWalker(self.linter)
+        walker.add_checker(self.checker)
+        for module in modules:
+            walker.walk(module)
+        self.checker.close()
+
+    def test_report_has_every_file(self, tmp_path: Path):
+        """Every walked module gets its time, nodes and lines, the slowest ones first."""
+        report_path = tmp_path / "latency.json"
+        self.linter.config.calisthenics_latency_report = str(report_path)
+        self.linter.config.calisthenics_latency_top = 1
+        self._run(astroid.parse(MODULE, module_name="large", path="large.py"),
+                  astroid.parse("x = 1\n", module_name="small", path="small.py"))
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["files"] == 2 and len(report["slowest"]) == 1
+        large, small = report["all"]
+        assert (Path(large["path"]).name, large["nodes"], large["lines"]) == ("large.py", 16, 7)
+        assert (Path(small["path"]).name, small["nodes"], small["lines"]) == ("small.py", 4, 1)
+        assert report["total_ms"] == pytest.approx(large["ms"] + small["ms"])
+        assert sum(bucket["files"] for bucket in report["histogram"]) == 2
+        assert report["percentiles_ms"]["p99"] == max(large["ms"], small["ms"])
+
+    def test_report_is_printed(self, tmp_path: Path, capsys: pytest.CaptureFixture):
+        """The printer shows the percentiles, histogram and slowest files of the report."""
+        report_path = tmp_path / "latency.json"
+        self.linter.config.calisthenics_latency_report = str(report_path)
+        self._run(astroid.parse(MODULE, module_name="large", path="large.py"))
+        assert main([str(report_path), "--top", "1"]) == 0
+        output = capsys.readouterr().out
+        assert output.startswith("files=1 ") and "p95=" in output and "Histogram:" in output
+        assert "large.py ms=" in output and "nodes=16 lines=7" in output
+
+    def test_callbacks_are_untouched_when_disabled(self):
+        """Without a report path the checker callbacks aren't wrapped."""
+        self.checker.open()
+        assert not hasattr(self.checker.visit_module, "__wrapped__")
+
+    def test_callbacks_are_wrapped_once_for_every_run(self, tmp_path: Path):
+        """Opening the checker again wraps the callbacks of the class, not the last wrappers."""
+        self.linter.config.calisthenics_latency_report = str(tmp_path / "latency.json")
+        for _ in range(3):
+            self._run(astroid.parse(MODULE, module_name="large", path="large.py"))
+        wrapped = [getattr(self.checker, name).__wrapped__ for name in vars(self.checker)
+                   if name.startswith(("visit_", "leave_"))]
+        assert wrapped and not any(hasattr(callback, "__wrapped__") for callback in wrapped)
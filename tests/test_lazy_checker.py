@@ -0,0 +1,67 @@
+"""Tests module for the checkers loaded once their messages are enabled"""
+import subprocess
+import sys
+from pathlib import Path
+
+from pylint.lint import PyLinter
+
+from object_calisthenics.checkers import register
+from object_calisthenics.checkers.lazy_checker import LazyChecker
+
+_LINT = """
+import sys
+from pylint.lint import Run
+Run(sys.argv[1:], exit=False)
+print(",".join(sorted(name for name in sys.modules if name.startswith("object_calisthenics"))))
+"""
+MODULE = '''"""Sample module"""
+def run(value: int):
+    """Sample function"""
+    return value.real.imag
+'''
+
+
+class TestLazyChecker:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the checkers loaded once their messages are enabled."""
+
+    @staticmethod
+    def _lint(tmp_path: Path, *arguments: str):
+        sample = tmp_path / "sample.py"
+        sample.write_text(MODULE, encoding="utf-8")
+        completed = subprocess.run(
+            [sys.executable, "-c", _LINT, "--load-plugins=object_calisthenics.checkers",
+             "--disable=all", *arguments, "--score=n", str(sample)],
+            capture_output=True, check=True, text=True, cwd=Path(__file__).parents[1])
+        return completed.stdout.splitlines()
+
+    def test_only_enabled_checkers_are_imported(self, tmp_path: Path):
+        """A checker without enabled messages isn't imported, the enabled one reports."""
+        lines = self._lint(tmp_path, "--enable=W9003")
+        modules = lines[-1].split(",")
+        assert any("W9003" in line for line in lines)
+        assert "object_calisthenics.checkers.primitive_obsession" in modules
+        assert "object_calisthenics.checkers.one_dot_per_line" not in modules
+        assert not [module for module in modules
+                    if module.startswith("object_calisthenics.reporters")]
+
+    def test_reporter_is_imported_once_its_format_is_chosen(self, tmp_path: Path):
+        """The reporters of the plugin are imported when their output format is used."""
+        lines = self._lint(tmp_path, "--enable=W9003", "--output-format=ndjson")
+        modules = lines[-1].split(",")
+        assert '"message-id": "W9003"' in lines[0]
+        assert "object_calisthenics.reporters.streaming_reporters" in modules
+
+    def test_options_keep_their_configured_values(self, tmp_path: Path):
+        """The options of a checker built after the configuration was read are kept."""
+        lines = self._lint(tmp_path, "--enable=W9006", "--max-chain-length=2")
+        assert not any("W9006" in line for line in lines[:-1])
+
+    def test_checkers_are_registered_unbuilt(self):
+        """Registering the plugin declares the checkers without building them."""
+        linter = PyLinter()
+        register(linter)
+        lazy_checkers = [checker for checker in linter.get_checkers()
+                         if isinstance(checker, LazyChecker)]
+        assert len(lazy_checkers) == 6
+        assert all(checker.checker is None for checker in lazy_checkers)
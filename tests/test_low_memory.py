@@ -0,0 +1,152 @@
+"""Tests module for the low memory mode of the standalone runner"""
+import ast
+import io
+import tokenize
+from pathlib import Path
+
+import pytest
+from astroid._cache import CACHE_MANAGER
+
+from benchmarks.generators import GENERATORS, Size, generated_models
+from object_calisthenics.checkers.class_index_reader import open_class_index
+from object_calisthenics.low_memory import (MAX_GROUPED_STATEMENTS, segment_starts, segments,
+                                           tree_segments)
+from object_calisthenics.runner import main
+
+MODULE = '''#!/usr/bin/env python
+"""Sample module"""
+import os
+VALUE = os.path.join("a", "b")
+
+
+@property
+@staticmethod
+def decorated(value: int):
+    """Decorated function"""
+    if value:
+        if value:
+            return value.real.imag
+    else:
+        return 2
+
+
+class Sample:
+    """Sample class"""
+    def __init__(self):
+        self.items: List[int] = []
+        self.other = 3
+
+    class Inner:
+        """Nested class"""
+        def run(self): return self.a.b.c
+"""A string after the class"""
+async def coroutine(): return VALUE.a.b
+class OneLine: pass
+'''
+ALIASED = '''"""Module importing a collection used by a later definition"""
+from collections import defaultdict
+
+
+class Counts:
+    """Mixes a collection with another variable"""
+    def __init__(self):
+        self.counts: defaultdict[str, int] = defaultdict(int)
+        self.total: int = 0
+'''
+
+
+def _starts(source: str):  # pylint: disable=dont-use-primitives
+    return segment_starts(tokenize.generate_tokens(io.StringIO(source).readline))
+
+
+class TestSegments:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the split of the modules into segments."""
+
+    def test_definitions_are_segments_of_their_own(self):
+        """A definition starts at its first decorator, the other statements are grouped."""
+        assert _starts(MODULE) == [2, 7, 18, 27, 28, 29]
+
+    def test_statements_are_grouped_up_to_a_limit(self):
+        """A run of statements is split once it has too many statements."""
+        source = "".join(f"VALUE_{index} = {index}\n"
+                         for index in range(MAX_GROUPED_STATEMENTS + 1))
+        assert _starts(source) == [1, MAX_GROUPED_STATEMENTS + 1]
+
+    def test_segments_cover_the_module(self):
+        """The segments hold the whole module, only the first one its docstring."""
+        module_segments = segments(MODULE)
+        assert "".join(segment.source for segment in module_segments) == \
+            MODULE.split("\n", 1)[1]
+        assert [segment.holds_docstring for segment in module_segments] == \
+            [True] + [False] * 5
+
+    def test_segments_of_the_tree_are_the_same(self):
+        """The segments found from the stdlib ast of a module are the ones of its tokens."""
+        assert tree_segments(MODULE, ast.parse(MODULE)) == segments(MODULE)
+        assert [segment.last() for segment in segments(MODULE)] == [6, 17, 26, 27, 28, 29]
+
+    def test_source_that_cant_be_tokenized_has_no_segments(self):
+        """An unterminated bracket leaves the file to the regular check."""
+        assert segments("VALUE = (1,\n") is None
+
+
+class TestLowMemoryRun:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the runner checking the modules one segment at a time."""
+
+    @staticmethod
+    def _modules(tmp_path: Path):
+        (tmp_path / "sample.py").write_text(MODULE, encoding="utf-8")
+        (tmp_path / "pragmas.py").write_text(MODULE + "# pylint: disable=W9006\n",
+                                             encoding="utf-8")
+        (tmp_path / "invalid.py").write_text(MODULE + "def broken(:\n", encoding="utf-8")
+        (tmp_path / "aliased.py").write_text(ALIASED, encoding="utf-8")
+        (tmp_path / "models.py").write_text(generated_models(Size(5), Size(30)),
+                                            encoding="utf-8")
+        for name, generate in GENERATORS.items():
+            (tmp_path / f"{name.replace('-', '_')}.py").write_text(generate(Size(1)),
+                                                                   encoding="utf-8")
+        return ["--recursive=yes", "--persistent=n", "--output-format=json",
+                "--max-class-lines=20", str(tmp_path)]
+
+    def test_output_is_the_same_as_whole_modules(self, tmp_path: Path,
+                                                 capsys: pytest.CaptureFixture):
+        """The same messages are reported, in the same order and with the same score."""
+        arguments = self._modules(tmp_path)
+        assert main(arguments + ["--score=y"]) == 6
+        whole_output = capsys.readouterr().out
+        assert main(["--calisthenics-low-memory=y", "--score=y"] + arguments) == 6
+        assert capsys.readouterr().out == whole_output
+        assert whole_output.count('"W9007"') == 50
+        assert '"module": "aliased",\n        "obj": "Counts",\n        "line": 5' in whole_output
+
+    @staticmethod
+    def _rows(path: Path):
+        with open_class_index(path) as index:
+            return [index.row(row) for row in range(len(index))]
+
+    def test_class_index_is_the_same_as_whole_modules(self, tmp_path: Path):
+        """The classes of the segments are indexed as the classes of whole modules."""
+        arguments = self._modules(tmp_path)
+        indexes = [tmp_path / "whole.ocidx", tmp_path / "low.ocidx"]
+        main([f"--calisthenics-class-index={indexes[0]}"] + arguments)
+        main(["--calisthenics-low-memory=y", f"--calisthenics-class-index={indexes[1]}"] +
+             arguments)
+        rows = [self._rows(path) for path in indexes]
+        assert rows[0] == rows[1]
+        assert len(rows[0]) > 30
+
+    def test_caches_of_the_segments_are_released(self, tmp_path: Path):
+        """The method caches astroid registers for the nodes don't outlive their segment."""
+        models = tmp_path / "models.py"
+        models.write_text(generated_models(Size(5), Size(30)), encoding="utf-8")
+        caches = len(CACHE_MANAGER.dict_caches)
+        assert main(["--calisthenics-low-memory=y", "--persistent=n", str(models)]) == 4
+        assert len(CACHE_MANAGER.dict_caches) == caches
+
+    def test_result_cache_is_rejected(self, tmp_path: Path):
+        """The cached messages need the whole module, the options can't be combined."""
+        arguments = self._modules(tmp_path)
+        assert main(["--calisthenics-low-memory=y",
+                     f"--calisthenics-cache-dir={tmp_path / 'cache'}"] + arguments) == 32
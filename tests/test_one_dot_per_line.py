@@ -1,6 +1,7 @@
 """Tests module for one dot per line check"""
 import astroid
 import pylint.testutils
+from pylint.testutils import set_config
 
 from object_calisthenics.checkers.one_dot_per_line import OneDotPerLine
 
@@ -22,6 +23,7 @@ class TestOneDotPerLine(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9006",
+                    args=(2, 1),
                     node=call_node.value,
                     line=3,
                     col_offset=12,
@@ -53,6 +55,7 @@ class TestOneDotPerLine(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9006",
+                    args=(2, 1),
                     node=call_node.value,
                     line=3,
                     col_offset=11,
@@ -84,6 +87,7 @@ class TestOneDotPerLine(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9006",
+                    args=(2, 1),
                     node=call_node,
                     line=3,
                     col_offset=4,
@@ -116,6 +120,7 @@ class TestOneDotPerLine(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9006",
+                    args=(2, 1),
                     node=attribute_node,
                     line=3,
                     col_offset=4,
@@ -147,6 +152,7 @@ class TestOneDotPerLine(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9006",
+                    args=(2, 1),
                     node=call_node.value,
                     line=3,
                     col_offset=12,
@@ -178,6 +184,7 @@ class TestOneDotPerLine(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9006",
+                    args=(2, 1),
                     node=call_node.value,
                     line=3,
                     col_offset=11,
@@ -197,3 +204,86 @@ class TestOneDotPerLine(pylint.testutils.CheckerTestCase):
                 """)
         with self.assertNoMessages():
             self.checker.visit_attribute(call_node.value)
+
+    def test_long_chain_is_reported_once_on_its_outermost_node(self):
+        """A chain is reported once, with its length, however many dots it has"""
+        module = astroid.parse("""
+        def test_func():
+            return obj1.obj2.obj3.obj4.func5()
+        """)
+        call_node = module.body[0].body[0].value
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(
+                    msg_id="W9006",
+                    node=call_node,
+                    args=(4, 1),
+                    line=3,
+                    col_offset=11,
+                    end_line=3,
+                    end_col_offset=38
+                )
+        ):
+            self.walk(module)
+
+    def test_calls_split_chains(self):
+        """The attributes taken on the result of a call start a new chain"""
+        module = astroid.parse("""
+        def test_func():
+            return obj1.func2().func3().func4()
+        """)
+        with self.assertNoMessages():
+            self.walk(module)
+
+    @set_config(max_chain_length=3)
+    def test_chain_within_max_length_passes(self):
+        """Chains up to the max chain length pass the check"""
+        module = astroid.parse("""
+        def test_func():
+            return obj1.obj2.obj3.func4()
+        """)
+        with self.assertNoMessages():
+            self.walk(module)
+
+    @set_config(chain_allowed_receivers=("self", "os.path"))
+    def test_allowed_receivers_dots_are_not_counted(self):
+        """The dots of an allowed receiver are not part of the chain length"""
+        module = astroid.parse("""
+        def test_func(self):
+            self.obj1.func2()
+            os.path.join()
+            return self.obj1.obj2.func3()
+        """)
+        call_node = module.body[0].body[2].value
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(
+                    msg_id="W9006",
+                    node=call_node,
+                    args=(2, 1),
+                    line=5,
+                    col_offset=11,
+                    end_line=5,
+                    end_col_offset=33
+                )
+        ):
+            self.walk(module)
+
+    @set_config(chain_allowed_receivers=("os.path",))
+    def test_dotted_receiver_and_its_next_dot_are_not_counted(self):
+        """A receiver of several names leaves out its own dots and the one after it"""
+        module = astroid.parse("""
+        def test_func():
+            return os.path.sep.strip.join()
+        """)
+        call_node = module.body[0].body[0].value
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(
+                    msg_id="W9006",
+                    node=call_node,
+                    args=(2, 1),
+                    line=3,
+                    col_offset=11,
+                    end_line=3,
+                    end_col_offset=35
+                )
+        ):
+            self.walk(module)
@@ -1,6 +1,8 @@
 """Module for testing OneLevelOfIndentation Check"""
 import astroid
 import pylint.testutils
+from pylint.testutils import set_config
+
 from object_calisthenics.checkers.one_level_of_indentation import OneLevelOfIndentation
 
 
@@ -12,33 +14,34 @@ class TestOneLevelOfIndentation(pylint.testutils.CheckerTestCase):
 
     def test_finds_two_levels_of_indentation_in_if(self):
         """Test should fail when there are two nested if statements."""
-        func_node = astroid.extract_node("""
+        func_node, nested = astroid.extract_node("""
         def test():  #@
             hello = None
             if x > 10:
-                if y > 5:
+                if y > 5:  #@
                     hello = 'world'
             return hello
         """)
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9001",
-                    node=func_node,
-                    line=2,
-                    col_offset=0,
-                    end_line=2,
-                    end_col_offset=8
+                    node=nested,
+                    args=(2, 1),
+                    line=5,
+                    col_offset=8,
+                    end_line=6,
+                    end_col_offset=27
                 )
         ):
             self.checker.visit_functiondef(func_node)
 
     def test_finds_three_levels_of_indentation_in_if(self):
         """Test should fail when there are three nested if statements"""
-        func_node = astroid.extract_node("""
+        func_node, nested = astroid.extract_node("""
                 def test():  #@
                     hello = None
                     if x > 10:
-                        if y > 5:
+                        if y > 5:  #@
                             if z > 5:
                                 hello = 'world'
                     return hello
@@ -46,52 +49,55 @@ class TestOneLevelOfIndentation(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9001",
-                    node=func_node,
-                    line=2,
-                    col_offset=0,
-                    end_line=2,
-                    end_col_offset=8
+                    node=nested,
+                    args=(3, 1),
+                    line=5,
+                    col_offset=8,
+                    end_line=7,
+                    end_col_offset=31
                 )
         ):
             self.checker.visit_functiondef(func_node)
 
     def test_finds_two_levels_of_indentation_in_for_loop(self):
         """Test should fail on two nested for loops"""
-        func_node = astroid.extract_node("""
+        func_node, nested = astroid.extract_node("""
                         def test():  #@
                             hello = None
                             for i in range(3):
-                                for j in range(3):
+                                for j in range(3):  #@
                                     hello = "world"
                         """)
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9001",
-                    node=func_node,
-                    line=2,
-                    col_offset=0,
-                    end_line=2,
-                    end_col_offset=8
+                    node=nested,
+                    args=(2, 1),
+                    line=5,
+                    col_offset=8,
+                    end_line=6,
+                    end_col_offset=27
                 )
         ):
             self.checker.visit_functiondef(func_node)
 
     def test_finds_two_levels_of_indentation_in_while_loop(self):
         """Test should fail in a function with a while loop and an extra nesting"""
-        func_node = astroid.extract_node("""
+        func_node, nested = astroid.extract_node("""
                                 def test():  #@
                                     while True:
-                                        if a > 0:
+                                        if a > 0:  #@
                                             i = i + 1
                                 """)
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9001",
-                    node=func_node,
-                    line=2,
-                    col_offset=0,
-                    end_line=2,
-                    end_col_offset=8
+                    node=nested,
+                    args=(2, 1),
+                    line=4,
+                    col_offset=8,
+                    end_line=5,
+                    end_col_offset=21
                 )
         ):
             self.checker.visit_functiondef(func_node)
@@ -108,34 +114,35 @@ class TestOneLevelOfIndentation(pylint.testutils.CheckerTestCase):
 
     def test_finds_two_levels_of_indentation_in_second_block(self):
         """Test should fail when there are two nested statements anywhere in the function"""
-        func_node = astroid.extract_node("""
+        func_node, nested = astroid.extract_node("""
                 def test():  #@
                     hello = None
                     if x < 5:
                         hello = 'hello'
                     if x > 10:
-                        if y > 5:
+                        if y > 5:  #@
                             hello = 'world'
                     return hello
                 """)
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9001",
-                    node=func_node,
-                    line=2,
-                    col_offset=0,
-                    end_line=2,
-                    end_col_offset=8
+                    node=nested,
+                    args=(2, 1),
+                    line=7,
+                    col_offset=8,
+                    end_line=8,
+                    end_col_offset=27
                 )
         ):
             self.checker.visit_functiondef(func_node)
 
     def test_finds_two_indentations_in_nested_functions(self):
         """Test should fail if there is a nested function and a nested statement inside"""
-        func_node = astroid.extract_node("""
+        func_node, nested = astroid.extract_node("""
                         def test():  #@
                             hello = 'world'
-                            def test1():
+                            def test1():  #@
                                 some = 'thing'
                                 if hello == 'world':
                                     hello = 'bye'
@@ -144,11 +151,12 @@ class TestOneLevelOfIndentation(pylint.testutils.CheckerTestCase):
         with self.assertAddsMessages(
                 pylint.testutils.MessageTest(
                     msg_id="W9001",
-                    node=func_node,
-                    line=2,
-                    col_offset=0,
-                    end_line=2,
-                    end_col_offset=8
+                    node=nested,
+                    args=(2, 1),
+                    line=4,
+                    col_offset=4,
+                    end_line=4,
+                    end_col_offset=13
                 )
         ):
             self.checker.visit_functiondef(func_node)
@@ -173,3 +181,80 @@ class TestOneLevelOfIndentation(pylint.testutils.CheckerTestCase):
                         """)
         with self.assertNoMessages():
             self.checker.visit_functiondef(func_node)
+
+    def test_reports_the_first_nested_block(self):
+        """A function gets a single message, on its first statement nested too deep."""
+        func_node, first = astroid.extract_node("""
+                        def test():  #@
+                            for item in items:
+                                if item:  #@
+                                    pass
+                            while y:
+                                with z:
+                                    pass
+                        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(msg_id="W9001", node=first, args=(2, 1), line=4,
+                                             col_offset=8, end_line=5, end_col_offset=16)
+        ):
+            self.checker.visit_functiondef(func_node)
+
+    def test_try_with_handlers_and_finally_opens_two_levels(self):
+        """
+        Astroid builds such a try as a TryExcept in a TryFinally, the TryExcept being
+        the block nested too deep.
+        """
+        func_node = astroid.extract_node("""
+                        def test():  #@
+                            try:
+                                pass
+                            except ValueError:
+                                pass
+                            finally:
+                                pass
+                        """)
+        nested = func_node.body[0].body[0]
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(msg_id="W9001", node=nested, args=(2, 1), line=3,
+                                             col_offset=4, end_line=6, end_col_offset=12)
+        ):
+            self.checker.visit_functiondef(func_node)
+
+    @set_config(indentation_violations="all")
+    def test_reports_every_nested_block(self):
+        """Every outermost statement nested too deep is reported when asked for."""
+        func_node, first, second = astroid.extract_node("""
+                        def test():  #@
+                            for item in items:
+                                if item:  #@
+                                    if x:
+                                        pass
+                            while y:
+                                with z:  #@
+                                    pass
+                        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(msg_id="W9001", node=first, args=(3, 1), line=4,
+                                             col_offset=8, end_line=6, end_col_offset=20),
+                pylint.testutils.MessageTest(msg_id="W9001", node=second, args=(2, 1), line=8,
+                                             col_offset=8, end_line=9, end_col_offset=16),
+        ):
+            self.checker.visit_functiondef(func_node)
+
+    @set_config(indentation_violations="all")
+    def test_nesting_of_a_nested_function_is_reported_on_the_nested_function(self):
+        """
+        The statements of a nested function are only located in the nested function,
+        the enclosing function gets its message on the nested function.
+        """
+        func_node, inner = astroid.extract_node("""
+                        def test():  #@
+                            def inner():  #@
+                                if x:
+                                    pass
+                        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(msg_id="W9001", node=inner, args=(2, 1), line=3,
+                                             col_offset=4, end_line=3, end_col_offset=13)
+        ):
+            self.checker.visit_functiondef(func_node)
@@ -0,0 +1,107 @@
+"""Tests module for the per-path rules table"""
+from pathlib import Path
+
+import pytest
+
+from object_calisthenics.checkers.path_rules import PathRules, PathRulesError
+from object_calisthenics.runner import main
+
+RULES = ["legacy/:max-class-lines=3", "legacy/generated/:max-class-lines=1",
+         "legacy/:disable=W9006 dont-use-else", "core/:primitive-types=str int",
+         "legacy/generated/:disable=W9003"]
+
+MODULE = '''"""Sample module"""
+
+
+def first(value: int):
+    """Sample function"""
+    for item in value:
+        if item:
+            return value.real.imag
+    return None
+
+
+class Sample:
+    """Sample class"""
+'''
+
+
+class TestPathRules:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the prefix trie of the rules table."""
+
+    def test_longest_prefix_wins(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """A path gets the settings of its longest prefix, merged with the shorter ones."""
+        monkeypatch.chdir(tmp_path)
+        rules = PathRules(RULES)
+        assert len(rules) == 3
+        generated = rules.settings_of(str(tmp_path / "legacy" / "generated" / "module.py"))
+        assert generated.options == {"max_class_lines": 1}
+        assert generated.disabled == {"W9002", "W9003", "W9006"}
+        assert rules.settings_of("legacy/module.py").options == {"max_class_lines": 3}
+        assert rules.settings_of("core/module.py").options == {
+            "primitive_types": ("str", "int")}
+
+    @pytest.mark.parametrize("path", ["legacy_module.py", "other/legacy/module.py", None])
+    def test_other_paths_have_no_settings(self, tmp_path: Path,
+                                          monkeypatch: pytest.MonkeyPatch, path: object):
+        """Only the components of a prefix match, from the working directory."""
+        monkeypatch.chdir(tmp_path)
+        settings = PathRules(RULES).settings_of(path and str(path))
+        assert not settings.options and not settings.disabled
+
+    @pytest.mark.parametrize("rule", [
+        "legacy/max-class-lines=3", "legacy/:max-class-lines", "legacy/:max-lines=3",
+        "legacy/:max-class-lines=many", "legacy/:indentation-violations=some",
+        "legacy/:disable=W0101"])
+    def test_invalid_rules_are_rejected(self, rule: object):
+        """Entries that aren't prefixes with an option of the checkers can't be compiled."""
+        with pytest.raises(PathRulesError):
+            PathRules([str(rule)])
+
+
+class TestPathRulesRun:
+    # pylint: disable=chain-of-method-calls
+    """Test case for runs checking every module with the settings of its path."""
+
+    @staticmethod
+    def _tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        for directory in ("legacy", "specs", "core"):
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / "sample.py").write_text(MODULE, encoding="utf-8")
+        return ["--score=n", "--msg-template={path}:{line}:{msg_id}:{msg}",
+                "--calisthenics-path-rules=legacy/:max-class-lines=1,specs/:disable=W9006,"
+                "core/:max-indentation-levels=0", "legacy", "specs", "core"]
+
+    @pytest.mark.parametrize("options", [[], ["--calisthenics-backend=ast"], ["--jobs=2"]])
+    def test_modules_get_the_settings_of_their_path(self, tmp_path: Path,
+                                                    monkeypatch: pytest.MonkeyPatch,
+                                                    capsys: pytest.CaptureFixture,
+                                                    options: object):
+        """Every module is checked with the options and disabled messages of its path."""
+        arguments = self._tree(tmp_path, monkeypatch)
+        main(list(options) + arguments)
+        output = capsys.readouterr().out
+        assert "legacy/sample.py:12:W9007" in output
+        assert "specs/sample.py:8:W9006" not in output and "specs/sample.py:4:W9003" in output
+        assert "core/sample.py:6:W9001:A function has more than one level of indentation. " \
+               "Depth reached: 2, max allowed: 0" in output
+        assert "legacy/sample.py:7:W9001" in output and "core/sample.py:12:W9007" not in output
+
+    def test_cached_results_depend_on_the_path(self, tmp_path: Path,
+                                               monkeypatch: pytest.MonkeyPatch,
+                                               capsys: pytest.CaptureFixture):
+        """Modules with the same source under other rules don't share their cached results."""
+        arguments = self._tree(tmp_path, monkeypatch) + [
+            f"--calisthenics-cache-dir={tmp_path / 'cache'}"]
+        main(arguments)
+        first_run = sorted(capsys.readouterr().out.split("\n"))
+        main(arguments)
+        assert sorted(capsys.readouterr().out.split("\n")) == first_run
+
+    def test_invalid_rules_are_rejected(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """A rules table that can't be compiled stops the run."""
+        arguments = self._tree(tmp_path, monkeypatch)
+        arguments[2] = "--calisthenics-path-rules=legacy/:max-lines=3"
+        assert main(arguments) == 32
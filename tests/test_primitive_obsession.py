@@ -1,13 +1,16 @@
 """Tests module for primitive obsession check"""
 import astroid
 import pylint.testutils
+import pytest
+from pylint.testutils import set_config
 
+from object_calisthenics.checkers.annotation_classifier import classifier_for
 from object_calisthenics.checkers.primitive_obsession import PrimitiveObsession
 
 
 class TestPrimitiveObsession(pylint.testutils.CheckerTestCase):
     # pylint: disable=chain-of-method-calls
-    # pylint: disable=class-too-large
+    # pylint: disable=class-too-large,too-many-public-methods
     """Test case for PrimitiveObsession checker."""
     CHECKER_CLASS = PrimitiveObsession
 
@@ -285,3 +288,97 @@ class TestPrimitiveObsession(pylint.testutils.CheckerTestCase):
         """)
         with self.assertNoMessages():
             self.checker.visit_functiondef(func_node)
+
+    @pytest.mark.parametrize("annotation", ["int | None", "SomeType | str", "'str'",
+                                            "Optional['bytes']", "typing.Text", "Text",
+                                            "list[int]", "dict[SomeType, float]",
+                                            "builtins.bool", "typing.Optional[int]",
+                                            "Annotated['int', SomeType]"])
+    def test_primitive_annotation_forms(self, annotation: object):
+        """PEP 604 unions, PEP 585 generics, typing names, aliases and strings are checked."""
+        func_node = astroid.extract_node(f"""
+        def test(hello: {annotation}):  # @
+            pass
+        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(
+                    msg_id="W9003",
+                    node=func_node,
+                    line=2,
+                    col_offset=0,
+                    end_line=2,
+                    end_col_offset=8
+                )
+        ):
+            self.checker.visit_functiondef(func_node)
+
+    @pytest.mark.parametrize("annotation", ["SomeType | None", "'SomeType'", "list[SomeType]",
+                                            "typing.Optional[SomeType]", "nodes.Text",
+                                            "Literal['int']", "typing.Literal['str', 'bytes']",
+                                            "Annotated[SomeType, 'str']"])
+    def test_non_primitive_annotation_forms(self, annotation: object):
+        """
+        The same forms pass the check when they don't contain primitives, the values of
+        a ``Literal`` and the metadata of an ``Annotated`` not being annotations.
+        """
+        func_node = astroid.extract_node(f"""
+        def test(hello: {annotation}):  # @
+            pass
+        """)
+        with self.assertNoMessages():
+            self.checker.visit_functiondef(func_node)
+
+    @set_config(primitive_types=("SomeType",), primitive_aliases=("UserId:SomeType",))
+    def test_configured_primitives_and_aliases(self):
+        """The primitive types and their aliases come from the options."""
+        func_node, other_node = astroid.extract_node("""
+        def test(hello: str, world: Optional[UserId]):  #@
+            pass
+        def other(hello: str, world: int):  #@
+            pass
+        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(
+                    msg_id="W9003",
+                    node=func_node,
+                    line=2,
+                    col_offset=0,
+                    end_line=2,
+                    end_col_offset=8
+                )
+        ):
+            self.checker.visit_functiondef(func_node)
+            self.checker.visit_functiondef(other_node)
+
+    def test_repeated_annotations_are_classified_once(self):
+        """The verdict of an annotation shape is reused for the same shape."""
+        classifier = classifier_for(("str", "int"), ())
+        first, second = astroid.extract_node("""
+        def test(hello: Dict[SomeType, List[Other]]):  #@
+            pass
+        def other(world: typing.Dict[SomeType, typing.List[Other]]):  #@
+            pass
+        """)
+        assert not classifier.is_primitive(first.args.annotations[0])
+        misses = classifier.is_primitive_key.cache_info().misses
+        assert not classifier.is_primitive(second.args.annotations[0])
+        assert classifier.is_primitive_key.cache_info().misses == misses
+
+    def test_long_generated_union(self):
+        """A union nested deeper than the recursion limit allows is classified."""
+        union = " | ".join(f"Type{index}" for index in range(450))
+        func_node = astroid.extract_node(f"""
+        def test(hello: {union} | str):  #@
+            pass
+        """)
+        with self.assertAddsMessages(
+                pylint.testutils.MessageTest(
+                    msg_id="W9003",
+                    node=func_node,
+                    line=2,
+                    col_offset=0,
+                    end_line=2,
+                    end_col_offset=8
+                )
+        ):
+            self.checker.visit_functiondef(func_node)
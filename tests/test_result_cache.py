@@ -0,0 +1,98 @@
+"""Tests module for the checkers result cache"""
+from pathlib import Path
+from unittest import mock
+
+import astroid
+import pylint.testutils
+from pylint.utils import ASTWalker
+
+from object_calisthenics.checkers.one_level_of_indentation import (IndentationLevel,
+                                                                   OneLevelOfIndentation)
+from object_calisthenics.checkers.result_cache import (CachedMessage, CachedMessages,
+                                                       EntryCount, ResultCache)
+from object_calisthenics.checkers.message_location import message_location
+
+MODULE = """
+class TestClass:
+    def test(self):  #@
+        if x > 10:
+            if y > 5:  #@
+                hello = 'world'
+"""
+
+
+class TestResultCache(pylint.testutils.CheckerTestCase):
+    # pylint: disable=chain-of-method-calls
+    """Test case for replaying the checkers results from the cache."""
+    CHECKER_CLASS = OneLevelOfIndentation
+
+    def _walk(self, module: astroid.Module):
+        checker = OneLevelOfIndentation(self.linter)
+        checker.open()
+        walker = ASTWalker(self.linter)
+        walker.add_checker(checker)
+        walker.walk(module)
+
+    @staticmethod
+    def _expected_message(node: astroid.NodeNG):
+        return pylint.testutils.MessageTest(
+            msg_id="W9001",
+            node=node,
+            args=(2, 1),
+            line=5,
+            col_offset=12,
+            end_line=6,
+            end_col_offset=31
+        )
+
+    def test_messages_are_replayed_from_the_cache(self, tmp_path: Path):
+        """An unchanged module gets the same messages without being visited again."""
+        self.linter.config.calisthenics_cache_dir = str(tmp_path)
+        func_node, nested = astroid.extract_node(MODULE)
+        with self.assertAddsMessages(self._expected_message(nested)):
+            self._walk(func_node.root())
+        # Replayed messages are added on their frame, at the location they were stored at.
+        func_node, _ = astroid.extract_node(MODULE)
+        with self.assertAddsMessages(self._expected_message(func_node)), \
+                mock.patch.object(OneLevelOfIndentation, "max_indentation_levels_allowed",
+                                  IndentationLevel(5)):
+            self._walk(func_node.root())
+
+    def test_changed_module_is_checked_again(self, tmp_path: Path):
+        """A module whose source changed isn't replayed."""
+        self.linter.config.calisthenics_cache_dir = str(tmp_path)
+        self._walk(astroid.parse(MODULE))
+        self.linter.release_messages()
+        with self.assertNoMessages():
+            self._walk(astroid.parse("def test():\n    return 1\n"))
+
+
+class TestResultCacheStorage:
+    """Test case for the on-disk storage of the cache entries."""
+
+    @staticmethod
+    def _messages():
+        node = astroid.extract_node("def test(): pass")
+        return CachedMessages([CachedMessage("W9001", message_location(node), (6, 3))])
+
+    def test_stored_entry_is_loaded(self, tmp_path: Path):
+        """A stored entry is loaded back with the same messages."""
+        cache = ResultCache(tmp_path, EntryCount(10))
+        cache.store("ab12", self._messages())
+        assert list(cache.load("ab12")) == list(self._messages())
+
+    def test_corrupted_entry_is_a_miss(self, tmp_path: Path):
+        """An entry that can't be read is removed and treated as missing."""
+        cache = ResultCache(tmp_path, EntryCount(10))
+        cache.store("ab12", self._messages())
+        (tmp_path / "ab" / "ab12.json").write_text("[[", encoding="utf-8")
+        assert cache.load("ab12") is None
+        assert not (tmp_path / "ab" / "ab12.json").exists()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path):
+        """The cache doesn't grow above its max amount of entries."""
+        cache = ResultCache(tmp_path, EntryCount(10))
+        for index in range(25):
+            cache.store(f"{index:04}", self._messages())
+        assert len(list(tmp_path.glob("*/*.json"))) <= 10
+        assert cache.load("0024") is not None
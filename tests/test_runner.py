@@ -0,0 +1,116 @@
+"""Tests module for the standalone runner"""
+from pathlib import Path
+
+import pytest
+from pylint.lint import Run
+
+from object_calisthenics.parallel import WorkerCount, chunks
+from object_calisthenics.runner import main
+
+MODULE = '''"""Sample module"""
+class Sample:
+    """Sample class"""
+    def __init__(self):
+        self.items: List[int] = []
+        self.other = 3
+
+    def run(self, value: int):
+        """Sample method"""
+        if value:
+            if self.other:
+                return value.real.imag
+        else:
+            return self.items.copy().pop()  # pylint: disable=chain-of-method-calls
+        return None
+'''
+CALISTHENICS_MESSAGES = "W9001,W9002,W9003,W9004,W9005,W9006,W9007"
+
+
+class TestRunner:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the standalone runner."""
+
+    @staticmethod
+    def _sample(tmp_path: Path):
+        sample = tmp_path / "sample.py"
+        sample.write_text(MODULE, encoding="utf-8")
+        return str(sample)
+
+    @pytest.mark.parametrize("output_format", ["text", "parseable", "json"])
+    def test_output_is_the_same_as_pylint(self, tmp_path: Path,
+                                          capsys: pytest.CaptureFixture,
+                                          output_format: object):
+        """The runner reports the same messages as pylint with the plugin loaded."""
+        sample = self._sample(tmp_path)
+        arguments = [f"--output-format={output_format}", "--score=n", sample]
+        exit_code = main(arguments)
+        runner_output = capsys.readouterr().out
+        Run(["--load-plugins=object_calisthenics.checkers", "--disable=all",
+             f"--enable={CALISTHENICS_MESSAGES}"] + arguments, exit=False)
+        assert runner_output == capsys.readouterr().out
+        assert exit_code == 4
+        assert "W9002" in runner_output
+
+    def test_pragmas_of_pylint_messages_are_known(self, tmp_path: Path,
+                                                  capsys: pytest.CaptureFixture):
+        """Disabling a message of pylint's own checkers isn't an unknown option value."""
+        sample = tmp_path / "sample.py"
+        sample.write_text(MODULE.replace('"""Sample module"""',
+                                         '"""Sample module"""  # pylint: disable=invalid-name'),
+                          encoding="utf-8")
+        assert main(["--score=n", "--disable=too-many-branches", str(sample)]) == 4
+        assert "W0012" not in capsys.readouterr().out
+
+    def test_unknown_option_is_rejected(self, tmp_path: Path):
+        """An option that isn't known to the linter stops the run."""
+        assert main(["--no-such-option", self._sample(tmp_path)]) == 32
+
+    def test_parallel_output_is_the_same_as_serial(self, tmp_path: Path,
+                                                   capsys: pytest.CaptureFixture):
+        """Files checked by a process pool are reported in the same order as serially."""
+        for index in range(6):
+            (tmp_path / f"sample_{index}.py").write_text(MODULE, encoding="utf-8")
+        arguments = ["--recursive=yes", "--persistent=n", str(tmp_path)]
+        assert main(arguments) == 4
+        serial_output = capsys.readouterr().out
+        assert main(["--jobs=2"] + arguments) == 4
+        assert capsys.readouterr().out == serial_output
+        assert serial_output.count("W9002") == 6
+
+    def test_chunks_keep_the_files_order(self):
+        """The chunks sent to the workers are contiguous and cover every file once."""
+        items = list(range(10))
+        work = chunks(items, WorkerCount(2))
+        assert [item for chunk in work for item in chunk] == items
+        assert len(work) == 5
+
+    def test_ast_backend_output_is_the_same_as_astroid(self, tmp_path: Path,
+                                                       capsys: pytest.CaptureFixture):
+        """The ast backend reports the same messages and score as the astroid checkers."""
+        self._sample(tmp_path)
+        (tmp_path / "no_pragmas.py").write_text(MODULE.replace("  # pylint:", "  #"),
+                                                encoding="utf-8")
+        arguments = ["--recursive=yes", "--persistent=n", str(tmp_path)]
+        assert main(arguments) == 4
+        astroid_output = capsys.readouterr().out
+        assert main(["--calisthenics-backend=ast"] + arguments) == 4
+        assert capsys.readouterr().out == astroid_output
+        assert "Module no_pragmas" in astroid_output
+        assert astroid_output.count("W9006") == 3
+
+    @pytest.mark.parametrize("mode", ["--calisthenics-backend=ast",
+                                      "--calisthenics-low-memory=y"])
+    def test_package_is_named_as_astroid_names_it(self, tmp_path: Path,
+                                                  capsys: pytest.CaptureFixture,
+                                                  mode: object):
+        """The module of a package ``__init__`` file is the package, as in astroid modules."""
+        package = tmp_path / "package"
+        package.mkdir()
+        (package / "__init__.py").write_text(MODULE.replace("  # pylint:", "  #"),
+                                             encoding="utf-8")
+        arguments = ["--output-format=json", "--persistent=n", str(package / "__init__.py")]
+        assert main(arguments) == 4
+        astroid_output = capsys.readouterr().out
+        assert main([str(mode)] + arguments) == 4
+        assert capsys.readouterr().out == astroid_output
+        assert '"module": "package",' in astroid_output
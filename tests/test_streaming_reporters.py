@@ -0,0 +1,119 @@
+"""Tests module for the streaming reporters"""
+import io
+import json
+from pathlib import Path
+
+import pytest
+from pylint.interfaces import UNDEFINED
+from pylint.message import Message
+from pylint.typing import MessageLocationTuple
+
+from object_calisthenics.reporters import BinaryReader, BinaryWriter
+from object_calisthenics.reporters.binary_records import RecordError, encode_varint, read_varint
+from object_calisthenics.reporters.streaming_reporters import StreamingReporter
+from object_calisthenics.runner import main
+
+MODULE = '''"""Sample module"""
+def first(value: int):
+    """Sample function"""
+    return value.real.imag.conjugate()
+
+
+def second(value):
+    """Sample function"""
+    return value.real.imag
+'''
+
+
+class FlushRecorder(io.StringIO):
+    # pylint: disable=chain-of-method-calls
+    """A text output keeping what was written at every flush."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushed: list = []
+
+    def flush(self):
+        """Record the output written so far."""
+        self.flushed.append(self.getvalue())
+
+
+class TestStreamingReporters:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the ndjson and binary reporters."""
+
+    @staticmethod
+    def _samples(tmp_path: Path):
+        samples = [tmp_path / "first.py", tmp_path / "second.py"]
+        for sample in samples:
+            sample.write_text(MODULE, encoding="utf-8")
+        return [str(sample) for sample in samples]
+
+    def test_ndjson_lines_are_the_json_reporter_messages(self, tmp_path: Path,
+                                                         capsys: pytest.CaptureFixture):
+        """Every line of the ndjson output is a message of the json reporter output."""
+        samples = self._samples(tmp_path)
+        main(["--output-format=json", "--score=n"] + samples)
+        expected = json.loads(capsys.readouterr().out)
+        main(["--output-format=ndjson", "--score=n"] + samples)
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == expected
+        assert len(lines) == 8
+
+    def test_binary_records_are_the_reported_messages(self, tmp_path: Path,
+                                                      capsys: pytest.CaptureFixture):
+        """The binary output reads back as the messages the json reporter writes."""
+        samples = self._samples(tmp_path)
+        main(["--output-format=json", "--score=n"] + samples)
+        expected = json.loads(capsys.readouterr().out)
+        output = tmp_path / "messages.ocmsg"
+        main([f"--output-format=calisthenics-binary:{output}", "--score=n"] + samples)
+        with output.open("rb") as stream:
+            messages = list(BinaryReader(stream).messages())
+        assert [(message.msg_id, message.path, message.obj, message.line, message.column,
+                 message.end_line, message.end_column) for message in messages] == \
+            [(message["message-id"], message["path"], message["obj"], message["line"],
+              message["column"], message["endLine"], message["endColumn"])
+             for message in expected]
+        assert output.stat().st_size < len(json.dumps(expected)) // 3
+
+    def test_messages_are_flushed_once_their_module_was_checked(self, tmp_path: Path,
+                                                                monkeypatch: pytest.MonkeyPatch):
+        """The messages of a module are flushed before the next module is reported."""
+        output = FlushRecorder()
+        monkeypatch.setattr("sys.stdout", output)
+        main(["--output-format=ndjson", "--score=n"] + self._samples(tmp_path))
+        first_module_flush = [flushed for flushed in output.flushed
+                              if '"module": "first"' in flushed][0]
+        assert first_module_flush.count("\n") == 4
+        assert '"module": "second"' not in first_module_flush
+
+    def test_strings_are_written_once_per_module(self):
+        """A message repeating the strings of its module is written as a few bytes."""
+        location = MessageLocationTuple("/tmp/sample.py", "sample.py", "sample", "Sample", 3, 4,
+                                        None, None)
+        message = Message("W9006", "chain-of-method-calls", location, "A chain.", UNDEFINED)
+        stream = io.BytesIO()
+        writer = BinaryWriter(stream)
+        writer.start_module()
+        writer.write(message)
+        first_size = stream.tell()
+        writer.write(message)
+        assert stream.tell() - first_size == 13
+        stream.seek(0)
+        assert list(BinaryReader(stream).messages()) == [message, message]
+
+    @pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 40])
+    def test_varint_round_trip(self, value: object):
+        """Integers read back as they were encoded."""
+        assert read_varint(io.BytesIO(encode_varint(value))) == value
+
+    def test_invalid_stream_is_rejected(self):
+        """A stream that isn't made of message records raises an error."""
+        with pytest.raises(RecordError):
+            list(BinaryReader(io.BytesIO(b"not records")).messages())
+
+    def test_base_reporter_writes_no_message(self):
+        """The base class leaves writing the messages to the streaming reporters."""
+        with pytest.raises(TypeError):
+            StreamingReporter()  # pylint: disable=abstract-class-instantiated
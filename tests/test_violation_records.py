@@ -0,0 +1,51 @@
+"""Tests module for the compact message records"""
+import pickle
+
+from pylint.interfaces import HIGH
+from pylint.message import Message
+from pylint.typing import MessageLocationTuple
+
+from object_calisthenics.reporters import RecordingReporter, violation_record
+
+
+def _message(line: int, obj: str):  # pylint: disable=dont-use-primitives
+    location = MessageLocationTuple("/src/module.py", "src/module.py", "module",
+                                    "".join(obj), line, 4, line + 1, 8)
+    return Message("W9006", "chain-of-method-calls", location,
+                   "".join(["A statement has a chain of method calls."]), HIGH)
+
+
+class TestViolationRecords:
+    # pylint: disable=chain-of-method-calls
+    """Test case for the records of the messages."""
+
+    def test_record_gives_back_the_message(self):
+        """The message of a record is the one it was made of."""
+        message = _message(3, "Sample.method")
+        assert violation_record(message).to_message() == message
+
+    def test_record_has_no_attributes_besides_its_fields(self):
+        """A record is stored in slots, without a dict of attributes."""
+        assert not hasattr(violation_record(_message(3, "Sample.method")), "__dict__")
+
+    def test_strings_are_shared_between_records(self):
+        """The strings of equal values are stored once, whatever message they come from."""
+        first = violation_record(_message(3, "Sample"))
+        second = violation_record(_message(5, "Sample"))
+        assert first.obj is second.obj and first.msg is second.msg
+        assert first != second
+
+    def test_pickled_records_are_interned_again(self):
+        """Records sent back by the workers share their strings with the local ones."""
+        record = violation_record(_message(3, "Sample.method"))
+        unpickled = pickle.loads(pickle.dumps(record))
+        assert unpickled == record and unpickled.obj is record.obj
+
+    def test_reporter_keeps_records(self):
+        """The recording reporter keeps the records of the messages until reset."""
+        reporter = RecordingReporter()
+        reporter.handle_message(_message(3, "Sample.method"))
+        assert reporter.records == [violation_record(_message(3, "Sample.method"))]
+        assert not reporter.messages
+        reporter.reset()
+        assert not reporter.records